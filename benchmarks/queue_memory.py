@@ -0,0 +1,70 @@
+# Authored By Certified Coders � 2025
+"""
+Memory per 100k queued tracks: the old per-entry dicts in a list versus
+slotted ``Track`` records in a ``ChatQueue``.
+
+    python benchmarks/queue_memory.py [count]
+
+``track.py`` is loaded straight from its file so the bot package (clients,
+config, storage setup) is not imported.
+"""
+import importlib.util
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location(
+    "track", os.path.join(ROOT, "siyamedia", "utils", "stream", "track.py")
+)
+track = importlib.util.module_from_spec(spec)
+sys.modules["track"] = track
+spec.loader.exec_module(track)
+
+
+def entry(i: int) -> dict:
+    # Same shape put_queue used to build, plus the keys the call flow adds later.
+    return {
+        "title": f"Track {i}",
+        "dur": "03:45",
+        "streamtype": "audio",
+        "by": "user",
+        "user_id": 1000 + i,
+        "chat_id": -100123,
+        "file": f"vid_{i:011d}",
+        "vidid": f"{i:011d}",
+        "seconds": 222,
+        "mystic": None,
+        "markup": "stream",
+    }
+
+
+def as_dicts(count: int) -> list:
+    return [entry(i) for i in range(count)]
+
+
+def as_tracks(count: int) -> "track.ChatQueue":
+    return track.ChatQueue(track.Track(**entry(i)) for i in range(count))
+
+
+def measure(build, count: int) -> int:
+    tracemalloc.start()
+    data = build(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return size
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    before = measure(as_dicts, count)
+    after = measure(as_tracks, count)
+    print(f"{count} tracks")
+    print(f"  dict + list       : {before / 1024 / 1024:8.2f} MiB  ({before / count:6.0f} B/track)")
+    print(f"  Track + ChatQueue : {after / 1024 / 1024:8.2f} MiB  ({after / count:6.0f} B/track)")
+    print(f"  saved             : {(1 - after / before) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
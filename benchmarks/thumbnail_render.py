@@ -0,0 +1,130 @@
+# Authored By Certified Coders � 2025
+"""
+Now-playing thumbnails per second: the old per-call get_thumb pipeline versus
+``ThumbnailTemplate`` with its static layers built once.
+
+    python benchmarks/thumbnail_render.py [cover.jpg] [seconds]
+
+Without a cover image a synthetic 720x404 JPEG (the size of the search
+result thumbnails get_thumb downloads) is used. Every render decodes the
+cover from bytes, as get_thumb does from the downloaded file. ``thumbtemplate.py``
+is loaded straight from its file so the bot package is not imported; run it
+from the repository root so the fonts and icons in siyamedia/assets resolve.
+"""
+import importlib.util
+import io
+import os
+import random
+import sys
+import time
+
+from PIL import Image, ImageDraw, ImageEnhance, ImageFilter, ImageFont
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location(
+    "thumbtemplate", os.path.join(ROOT, "siyamedia", "utils", "thumbtemplate.py")
+)
+tt = importlib.util.module_from_spec(spec)
+sys.modules["thumbtemplate"] = tt
+spec.loader.exec_module(tt)
+
+ASSETS = os.path.join(ROOT, "siyamedia", "assets", "thumb")
+TITLE = "Some Fairly Long Song Title Official Music Video Lyrics"
+
+
+def legacy(cover: Image.Image) -> Image.Image:
+    # What get_thumb did for every new video id before the template.
+    base = cover.resize((1280, 720)).convert("RGBA")
+    bg = ImageEnhance.Brightness(base.filter(ImageFilter.BoxBlur(10))).enhance(0.6)
+    panel_area = bg.crop((tt.PANEL_X, tt.PANEL_Y, tt.PANEL_X + tt.PANEL_W, tt.PANEL_Y + tt.PANEL_H))
+    overlay = Image.new("RGBA", (tt.PANEL_W, tt.PANEL_H), (255, 255, 255, tt.TRANSPARENCY))
+    frosted = Image.alpha_composite(panel_area, overlay)
+    mask = Image.new("L", (tt.PANEL_W, tt.PANEL_H), 0)
+    ImageDraw.Draw(mask).rounded_rectangle((0, 0, tt.PANEL_W, tt.PANEL_H), 50, fill=255)
+    bg.paste(frosted, (tt.PANEL_X, tt.PANEL_Y), mask)
+
+    draw = ImageDraw.Draw(bg)
+    title_font = ImageFont.truetype(os.path.join(ASSETS, "font2.ttf"), 32)
+    regular_font = ImageFont.truetype(os.path.join(ASSETS, "font.ttf"), 18)
+
+    thumb = base.resize((tt.THUMB_W, tt.THUMB_H))
+    tmask = Image.new("L", thumb.size, 0)
+    ImageDraw.Draw(tmask).rounded_rectangle((0, 0, tt.THUMB_W, tt.THUMB_H), 20, fill=255)
+    bg.paste(thumb, (tt.THUMB_X, tt.THUMB_Y), tmask)
+
+    draw.text((tt.TITLE_X, tt.TITLE_Y), tt.trim_to_width(TITLE, title_font, tt.MAX_TITLE_WIDTH), fill="black", font=title_font)
+    draw.text((tt.META_X, tt.META_Y), "YouTube | 1.2M views", fill="black", font=regular_font)
+    draw.line([(tt.BAR_X, tt.BAR_Y), (tt.BAR_X + tt.BAR_RED_LEN, tt.BAR_Y)], fill="red", width=6)
+    draw.line([(tt.BAR_X + tt.BAR_RED_LEN, tt.BAR_Y), (tt.BAR_X + tt.BAR_TOTAL_LEN, tt.BAR_Y)], fill="gray", width=5)
+    draw.ellipse([(tt.BAR_X + tt.BAR_RED_LEN - 7, tt.BAR_Y - 7), (tt.BAR_X + tt.BAR_RED_LEN + 7, tt.BAR_Y + 7)], fill="red")
+    draw.text((tt.BAR_X, tt.BAR_Y + 15), "00:00", fill="black", font=regular_font)
+    draw.text((tt.BAR_X + tt.BAR_TOTAL_LEN - 60, tt.BAR_Y + 15), "03:45", fill="black", font=regular_font)
+
+    ic = Image.open(os.path.join(ASSETS, "play_icons.png")).resize((tt.ICONS_W, tt.ICONS_H)).convert("RGBA")
+    r, g, b, a = ic.split()
+    black_ic = Image.merge("RGBA", (r.point(lambda *_: 0), g.point(lambda *_: 0), b.point(lambda *_: 0), a))
+    bg.paste(black_ic, (tt.ICONS_X, tt.ICONS_Y), black_ic)
+    return bg
+
+
+def synthetic_cover() -> bytes:
+    rnd = random.Random(0)
+    img = Image.linear_gradient("L").resize((720, 404)).convert("RGB")
+    draw = ImageDraw.Draw(img)
+    for _ in range(200):
+        x, y = rnd.randrange(720), rnd.randrange(404)
+        color = tuple(rnd.randrange(256) for _ in range(3))
+        draw.ellipse((x, y, x + rnd.randrange(10, 120), y + rnd.randrange(10, 120)), fill=color)
+    buf = io.BytesIO()
+    img.save(buf, "JPEG", quality=90)
+    return buf.getvalue()
+
+
+def rate(fn, seconds: float) -> float:
+    fn()
+    count, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def encoded(img: Image.Image, **params) -> None:
+    img.save(io.BytesIO(), "PNG", **params)
+
+
+def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1]:
+        with open(sys.argv[1], "rb") as f:
+            data = f.read()
+    else:
+        data = synthetic_cover()
+
+    def cover() -> Image.Image:
+        return Image.open(io.BytesIO(data))
+
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+    os.chdir(ROOT)
+
+    start = time.perf_counter()
+    template = tt.ThumbnailTemplate(ASSETS)
+    setup = (time.perf_counter() - start) * 1000
+
+    old = rate(lambda: legacy(cover()), seconds)
+    new = rate(lambda: template.render(cover(), TITLE, "1.2M views", "03:45", False), seconds)
+    old_png = rate(lambda: encoded(legacy(cover())), seconds)
+    new_png = rate(
+        lambda: encoded(
+            template.render(cover(), TITLE, "1.2M views", "03:45", False),
+            compress_level=tt.PNG_COMPRESS_LEVEL,
+        ),
+        seconds,
+    )
+
+    print(f"template setup   : {setup:8.1f} ms (once per worker)")
+    print(f"render only      : {old:8.1f} -> {new:8.1f} renders/s  (x{new / old:.1f})")
+    print(f"render + PNG     : {old_png:8.1f} -> {new_png:8.1f} renders/s  (x{new_png / old_png:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 # Authored By Certified Coders � 2025
 import re
-from os import getenv
+from os import environ, getenv
 from dotenv import load_dotenv
 from pyrogram import filters
 
@@ -54,6 +54,20 @@ SUPPORT_CHAT = getenv("SUPPORT_CHAT", "https://t.me/+BsvMgJITJvM5YWE1")
 AUTO_LEAVING_ASSISTANT = False
 AUTO_LEAVE_ASSISTANT_TIME = int(getenv("ASSISTANT_LEAVE_TIME", "3600"))
 
+# -- Queue persistence ----------------------------------------------------------
+QUEUE_STORE = (getenv("QUEUE_STORE") or "sqlite").lower()  # sqlite | mongo | off
+
+# -- Membership index -----------------------------------------------------------
+# False-positive rate for a bloom filter holding served users; 0 keeps an exact set.
+SERVED_USERS_BLOOM = float(getenv("SERVED_USERS_BLOOM") or 0)
+
+# -- Media cache ----------------------------------------------------------------
+MEDIA_CACHE_MB = int(getenv("MEDIA_CACHE_MB") or 4096)  # disk budget for downloads/
+
+# -- Thumbnails -----------------------------------------------------------------
+THUMB_CACHE_MB = int(getenv("THUMB_CACHE_MB") or 256)  # disk budget for rendered cards in cache/
+THUMB_FORMAT = (getenv("THUMB_FORMAT") or "png").lower()  # png | jpeg | webp
+
 # -- Debug ----------------------------------------------------------------------
 DEBUG_IGNORE_LOG = True
 
@@ -62,11 +76,18 @@ SPOTIFY_CLIENT_ID = getenv("SPOTIFY_CLIENT_ID", "22b6125bfe224587b722d6815002db2
 SPOTIFY_CLIENT_SECRET = getenv("SPOTIFY_CLIENT_SECRET", "c9c63c6fbf2f467c8bc68624851e9773")
 
 # -- Session strings (optional) -------------------------------------------------
-STRING1 = getenv("STRING_SESSION")
-STRING2 = getenv("STRING_SESSION2")
-STRING3 = getenv("STRING_SESSION3")
-STRING4 = getenv("STRING_SESSION4")
-STRING5 = getenv("STRING_SESSION5")
+# STRING_SESSION, STRING_SESSION2, STRING_SESSION3, ... with no upper bound;
+# the suffix is the assistant number stored in chat settings and the bare
+# STRING_SESSION is assistant 1.
+STRING_SESSIONS = {}
+for _key, _value in environ.items():
+    _match = re.fullmatch(r"STRING_SESSION(\d*)", _key)
+    if not (_match and _value):
+        continue
+    if not re.fullmatch(r"|[1-9]\d*", _match[1]) or _match[1] == "1":
+        raise SystemExit(f"[ERROR] - Invalid {_key}. Use STRING_SESSION, STRING_SESSION2, STRING_SESSION3, ...")
+    STRING_SESSIONS[int(_match[1] or 1)] = _value
+STRING_SESSIONS = dict(sorted(STRING_SESSIONS.items()))
 
 # -- Media assets ---------------------------------------------------------------
 START_VIDS = [
@@ -104,7 +125,7 @@ AYUV = [
 
 # -- Runtime structures ---------------------------------------------------------
 BANNED_USERS = filters.user()
-adminlist, lyrical, autoclean, confirmer = {}, {}, [], {}
+lyrical, confirmer = {}, {}
 
 # -- Minimal validation ---------------------------------------------------------
 if SUPPORT_CHANNEL and not re.match(r"^https?://", SUPPORT_CHANNEL):
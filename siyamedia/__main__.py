@@ -1,31 +1,42 @@
 # Authored By Certified Coders  2025
 import asyncio
 import importlib
+import time
 
 from pyrogram import idle
-from pytgcalls.exceptions import NoActiveGroupCall
 
 import config
 from siyamedia import LOGGER, app, userbot
 from siyamedia.core.call import StreamController
 from siyamedia.misc import sudo
 from siyamedia.plugins import ALL_MODULES
-from siyamedia.utils.database import get_banned_users, get_gbanned
+from siyamedia.utils.database import (
+    ensure_chat_settings,
+    ensure_membership_indexes,
+    get_banned_users,
+    get_gbanned,
+    membership,
+    warm_chat_settings,
+)
 from siyamedia.utils.cookie_handler import fetch_and_store_cookies
+from siyamedia.utils.extractor import extractor
+from siyamedia.utils.mediacache import media_cache
+from siyamedia.utils.render import renderer
+from siyamedia.utils.thumbcache import thumb_cache
+from siyamedia.utils.stream.store import journal
 from config import BANNED_USERS
 
 
-async def init():
-    if (
-        not config.STRING1
-        and not config.STRING2
-        and not config.STRING3
-        and not config.STRING4
-        and not config.STRING5
-    ):
-        LOGGER(__name__).error("?ss?s???? s?ss??? ??? ??????, ????s? ???? ? ???????? s?ss???...")
-        exit()
+async def step(name: str, coro):
+    """Await ``coro`` and log how long the startup step took."""
+    started = time.monotonic()
+    try:
+        return await coro
+    finally:
+        LOGGER("siyamedia").info(f"Startup: {name} took {time.monotonic() - started:.2f}s")
+
 
+async def load_cookies():
     # ? Try to fetch cookies at startup
     try:
         await fetch_and_store_cookies()
@@ -34,42 +45,139 @@ async def init():
         LOGGER("siyamedia").warning(f"???????? ?????: {e}")
 
 
-    await sudo()
-
+async def load_banned():
     try:
-        users = await get_gbanned()
-        for user_id in users:
-            BANNED_USERS.add(user_id)
-        users = await get_banned_users()
-        for user_id in users:
-            BANNED_USERS.add(user_id)
+        await membership.load()
+        membership.start()
+    except Exception as e:
+        LOGGER("siyamedia").warning(f"Membership index load failed: {e}")
+    try:
+        BANNED_USERS.update(await get_gbanned())
+        BANNED_USERS.update(await get_banned_users())
     except:
         pass
 
-    await app.start()
+
+async def load_chat_settings():
+    try:
+        migrated = await ensure_chat_settings()
+        if migrated:
+            LOGGER("siyamedia").info(f"Migrated {migrated} legacy chat settings")
+        warmed = await warm_chat_settings()
+        LOGGER("siyamedia").info(f"Chat settings cache warmed for {warmed} chats")
+    except Exception as e:
+        LOGGER("siyamedia").warning(f"Chat settings warm-up failed: {e}")
+
+
+async def load_membership_indexes():
+    try:
+        removed = await ensure_membership_indexes()
+        if removed:
+            LOGGER("siyamedia").info(f"Dropped {removed} duplicate chat/user registrations")
+    except Exception as e:
+        LOGGER("siyamedia").warning(f"Membership index setup failed: {e}")
+
+
+async def scan_caches():
+    cached = await asyncio.to_thread(media_cache.scan)
+    LOGGER("siyamedia").info(
+        f"Media cache indexed {cached} files ({media_cache.total // (1024 * 1024)} MB)"
+    )
+    await asyncio.to_thread(thumb_cache.scan)
+    await asyncio.to_thread(thumb_cache.evict)
+
+
+async def warm_workers():
+    try:
+        pids = await extractor.warm()
+        LOGGER("siyamedia").info(f"yt-dlp extractor pool ready ({len(pids)} workers)")
+    except Exception as e:
+        LOGGER("siyamedia").warning(f"yt-dlp extractor pool warm-up failed: {e}")
+    try:
+        pids = await renderer.warm()
+        LOGGER("siyamedia").info(f"Render pool ready ({len(pids)} workers)")
+    except Exception as e:
+        LOGGER("siyamedia").warning(f"Render pool warm-up failed: {e}")
+
+
+async def load_plugins():
     for all_module in ALL_MODULES:
         importlib.import_module("siyamedia.plugins" + all_module)
-
+        # Let the assistants keep logging in between imports.
+        await asyncio.sleep(0)
     LOGGER("siyamedia.plugins").info("?????'s ??????s ??????...")
 
-    await userbot.start()
-    await StreamController.start()
 
+async def restore_queues():
+    try:
+        restored = await step("queue restore", journal.restore(StreamController.rejoin))
+        if restored:
+            LOGGER("siyamedia").info(f"Resumed {len(restored)} queued voice chats")
+            await warm_chat_settings(restored)
+    except Exception as e:
+        LOGGER("siyamedia").warning(f"Queue restore failed: {e}")
+    journal.start()
+
+
+async def probe_logger_call():
     try:
-        await StreamController.stream_call("http://docs.evostream.com/sample_content/assets/sintel1m720p.mp4")
-    except NoActiveGroupCall:
-        LOGGER("siyamedia").error(
-            "????s? ???? ?? ??? ????? ???? ?? ???? ??? ?????/???????.\n\n????? ??? s??????..."
-        )
+        if not await StreamController.probe():
+            LOGGER("siyamedia").error(
+                "No voice chat running in the log group/channel; start one, stream checks fail until then."
+            )
+    except Exception as e:
+        LOGGER("siyamedia").warning(f"Voice chat probe failed: {e}")
+
+
+async def init():
+    if not config.STRING_SESSIONS:
+        LOGGER(__name__).error("?ss?s???? s?ss??? ??? ??????, ????s? ???? ? ???????? s?ss???...")
         exit()
-    except:
-        pass
+    booted = time.monotonic()
+
+    # Fork the yt-dlp and render workers before anything starts a thread;
+    # they finish loading in the background.
+    extractor.spawn()
+    renderer.spawn()
+    asyncio.create_task(step("worker warm-up", warm_workers()))
+
+    # Local state, the bot and the assistants come up side by side. Plugins
+    # (and their handlers) load once the bot is online and sudoers/bans are in.
+    state = asyncio.gather(
+        step("cookies", load_cookies()),
+        step("sudoers", sudo()),
+        step("banned users", load_banned()),
+        step("chat settings", load_chat_settings()),
+        step("membership indexes", load_membership_indexes()),
+        step("media caches", scan_caches()),
+    )
+
+    async def bot():
+        await step("bot", app.start())
+        await state
+        await step("plugins", load_plugins())
+
+    await asyncio.gather(
+        state,
+        bot(),
+        step("assistants", userbot.start()),
+        step("call clients", StreamController.start()),
+    )
 
     await StreamController.decorators()
+    asyncio.create_task(probe_logger_call())
+
+    # Rejoining may need full downloads, so it runs after the bot is ready.
+    asyncio.create_task(restore_queues())
+
+    LOGGER("siyamedia").info(f"Startup: ready in {time.monotonic() - booted:.2f}s")
     LOGGER("siyamedia").info(
         "\x41\x6e\x6e\x69\x65\x20\x4d\x75\x73\x69\x63\x20\x52\x6f\x62\x6f\x74\x20\x53\x74\x61\x72\x74\x65\x64\x20\x53\x75\x63\x63\x65\x73\x73\x66\x75\x6c\x6c\x79\x2e\x2e\x2e"
     )
     await idle()
+    await journal.close()
+    extractor.shutdown()
+    renderer.shutdown()
     await app.stop()
     await userbot.stop()
     LOGGER("siyamedia").info("s??????? ????? ??s?? ??? ...")
@@ -5,6 +5,7 @@ from pyrogram.enums import ChatMemberStatus
 
 import config
 from ..logging import LOGGER
+from .mediaref import REJECTED, media_refs
 
 
 class MusicBotClient(Client):
@@ -19,8 +20,74 @@ class MusicBotClient(Client):
         )
         LOGGER(__name__).info("Bot client initialized.")
 
+    # Message.reply_* and CallbackQuery.edit_message_media end up in these,
+    # so every send of a known URL goes out as its Telegram file_id.
+    async def _send_media(self, send, kind: str, chat_id, media, *args, **kwargs):
+        ref = media_refs.resolve(media, kind)
+        if ref is not media:
+            try:
+                return await send(chat_id, ref, *args, **kwargs)
+            except REJECTED:
+                await media_refs.forget(media, kind)
+        msg = await send(chat_id, media, *args, **kwargs)
+        await media_refs.remember(media, kind, msg)
+        return msg
+
+    @staticmethod
+    async def _fresh_card(video_id: str) -> str:
+        """Drop a rejected card file_id and fall back to the local (or rebuilt) card."""
+        from siyamedia.utils.thumbcache import thumb_cache
+        from siyamedia.utils.thumbnails import get_thumb
+
+        thumb_cache.forget(video_id)
+        return await get_thumb(video_id)
+
+    async def send_photo(self, chat_id, photo, *args, **kwargs):
+        from siyamedia.utils.thumbcache import thumb_cache
+
+        if isinstance(photo, str) and (video_id := thumb_cache.owner(photo)):
+            try:
+                return await super().send_photo(chat_id, photo, *args, **kwargs)
+            except REJECTED:
+                photo = await self._fresh_card(video_id)
+        msg = await self._send_media(super().send_photo, "photo", chat_id, photo, *args, **kwargs)
+        # Now-playing cards are local files; their ids live in the thumb cache.
+        if isinstance(photo, str) and msg and msg.photo:
+            thumb_cache.remember(photo, msg.photo.file_id)
+        return msg
+
+    async def send_video(self, chat_id, video, *args, **kwargs):
+        return await self._send_media(super().send_video, "video", chat_id, video, *args, **kwargs)
+
+    async def send_animation(self, chat_id, animation, *args, **kwargs):
+        return await self._send_media(super().send_animation, "animation", chat_id, animation, *args, **kwargs)
+
+    async def edit_message_media(self, chat_id, message_id, media, *args, **kwargs):
+        from siyamedia.utils.thumbcache import thumb_cache
+
+        source, kind = media.media, type(media).__name__[len("InputMedia"):].lower()
+        if kind == "photo" and isinstance(source, str) and (video_id := thumb_cache.owner(source)):
+            try:
+                return await super().edit_message_media(chat_id, message_id, media, *args, **kwargs)
+            except REJECTED:
+                source = media.media = await self._fresh_card(video_id)
+        ref = media_refs.resolve(source, kind)
+        if ref is not source:
+            media.media = ref
+            try:
+                return await super().edit_message_media(chat_id, message_id, media, *args, **kwargs)
+            except REJECTED:
+                await media_refs.forget(source, kind)
+                media.media = source
+        msg = await super().edit_message_media(chat_id, message_id, media, *args, **kwargs)
+        await media_refs.remember(source, kind, msg)
+        if kind == "photo" and isinstance(source, str) and msg and msg.photo:
+            thumb_cache.remember(source, msg.photo.file_id)
+        return msg
+
     async def start(self):
         await super().start()
+        await media_refs.load()
         me = await self.get_me()
         self.username, self.id = me.username, me.id
         self.name = f"{me.first_name} {me.last_name or ''}".strip()
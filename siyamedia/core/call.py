@@ -5,8 +5,8 @@ from datetime import datetime, timedelta
 from typing import Union
 
 from ntgcalls import TelegramServerError, ConnectionNotFound
-from pyrogram import Client
-from pyrogram.errors import FloodWait, ChatAdminRequired
+from pyrogram import Client, raw
+from pyrogram.errors import ChatAdminRequired
 from pyrogram.types import InlineKeyboardMarkup
 from pytgcalls import PyTgCalls
 from pytgcalls.exceptions import NoActiveGroupCall, NoAudioSourceFound, NoVideoSourceFound
@@ -15,7 +15,9 @@ from pytgcalls.types import AudioQuality, ChatUpdate, MediaStream, StreamEnded,
 import config
 from strings import get_string
 from siyamedia import LOGGER, YouTube, app
+from siyamedia.core.dir import PLAYBACK_DIR
 from siyamedia.misc import db
+from siyamedia.utils.assistantpool import assistant_pool
 from siyamedia.utils.database import (
     add_active_chat,
     add_active_video_chat,
@@ -23,15 +25,34 @@ from siyamedia.utils.database import (
     get_loop,
     group_assistant,
     is_autoend,
+    music_off,
     music_on,
     remove_active_chat,
     remove_active_video_chat,
     set_loop,
 )
+from siyamedia.utils.downloader import find_cached_file
 from siyamedia.utils.exceptions import AssistantErr
-from siyamedia.utils.formatters import check_duration, seconds_to_min, speed_converter
+from siyamedia.utils.formatters import (
+    check_duration,
+    seconds_to_min,
+    speed_converter,
+    time_to_seconds,
+)
 from siyamedia.utils.inline.play import stream_markup
+from siyamedia.utils.sender import Priority, sender
 from siyamedia.utils.stream.autoclear import auto_clean
+from siyamedia.utils.stream.prefetch import prefetcher
+from siyamedia.utils.stream.progressive import adopt, open_source
+from siyamedia.utils.stream.queue import new_queue
+from siyamedia.utils.stream.track import ChatQueue, Track
+from siyamedia.utils.stream.clock import (
+    get_played,
+    pause_clock,
+    resume_clock,
+    start_clock,
+    stop_clock,
+)
 from siyamedia.utils.thumbnails import get_thumb
 from siyamedia.utils.errors import capture_internal_err
 
@@ -61,38 +82,20 @@ async def _clear_(chat_id: int) -> None:
     popped = db.pop(chat_id, None)
     if popped:
         await auto_clean(popped)
-    db[chat_id] = []
+    db[chat_id] = new_queue()
+    prefetcher.cancel(chat_id)
+    stop_clock(chat_id)
     await remove_active_video_chat(chat_id)
     await remove_active_chat(chat_id)
     await set_loop(chat_id, 0)
 
 class Call:
     def __init__(self):
-        self.userbot1 = Client(
-            "AnnieXAssis1", config.API_ID, config.API_HASH, session_string=config.STRING1
-        ) if config.STRING1 else None
-        self.one = PyTgCalls(self.userbot1) if self.userbot1 else None
-
-        self.userbot2 = Client(
-            "AnnieXAssis2", config.API_ID, config.API_HASH, session_string=config.STRING2
-        ) if config.STRING2 else None
-        self.two = PyTgCalls(self.userbot2) if self.userbot2 else None
-
-        self.userbot3 = Client(
-            "AnnieXAssis3", config.API_ID, config.API_HASH, session_string=config.STRING3
-        ) if config.STRING3 else None
-        self.three = PyTgCalls(self.userbot3) if self.userbot3 else None
-
-        self.userbot4 = Client(
-            "AnnieXAssis4", config.API_ID, config.API_HASH, session_string=config.STRING4
-        ) if config.STRING4 else None
-        self.four = PyTgCalls(self.userbot4) if self.userbot4 else None
-
-        self.userbot5 = Client(
-            "AnnieXAssis5", config.API_ID, config.API_HASH, session_string=config.STRING5
-        ) if config.STRING5 else None
-        self.five = PyTgCalls(self.userbot5) if self.userbot5 else None
-
+        self.userbots = {
+            index: Client(f"AnnieXAssis{index}", config.API_ID, config.API_HASH, session_string=session)
+            for index, session in config.STRING_SESSIONS.items()
+        }
+        self.calls = {index: PyTgCalls(client) for index, client in self.userbots.items()}
         self.active_calls: set[int] = set()
 
 
@@ -100,11 +103,13 @@ class Call:
     async def pause_stream(self, chat_id: int) -> None:
         assistant = await group_assistant(self, chat_id)
         await assistant.pause(chat_id)
+        pause_clock(chat_id)
 
     @capture_internal_err
     async def resume_stream(self, chat_id: int) -> None:
         assistant = await group_assistant(self, chat_id)
         await assistant.resume(chat_id)
+        resume_clock(chat_id)
 
     @capture_internal_err
     async def mute_stream(self, chat_id: int) -> None:
@@ -128,6 +133,7 @@ class Call:
             pass
         finally:
             self.active_calls.discard(chat_id)
+            assistant_pool.release(chat_id)
 
 
     @capture_internal_err
@@ -136,7 +142,7 @@ class Call:
         try:
             check = db.get(chat_id)
             if check:
-                check.pop(0)
+                check.popleft()
         except (IndexError, KeyError):
             pass
         await remove_active_video_chat(chat_id)
@@ -150,6 +156,7 @@ class Call:
             pass
         finally:
             self.active_calls.discard(chat_id)
+            assistant_pool.release(chat_id)
 
 
     @capture_internal_err
@@ -157,6 +164,8 @@ class Call:
         assistant = await group_assistant(self, chat_id)
         stream = dynamic_media_stream(path=link, video=bool(video))
         await assistant.play(chat_id, stream)
+        start_clock(chat_id)
+        prefetcher.schedule(chat_id)
 
     @capture_internal_err
     async def vc_users(self, chat_id: int) -> list:
@@ -171,15 +180,16 @@ class Call:
         is_video = mode == "video"
         stream = dynamic_media_stream(path=file_path, video=is_video, ffmpeg_params=ffmpeg_params)
         await assistant.play(chat_id, stream)
+        start_clock(chat_id, time_to_seconds(to_seek))
 
     @capture_internal_err
-    async def speedup_stream(self, chat_id: int, file_path: str, speed: float, playing: list) -> None:
-        if not isinstance(playing, list) or not playing or not isinstance(playing[0], dict):
+    async def speedup_stream(self, chat_id: int, file_path: str, speed: float, playing: ChatQueue) -> None:
+        if not isinstance(playing, ChatQueue) or not playing or not isinstance(playing[0], Track):
             raise AssistantErr("Invalid stream info for speedup.")
 
         assistant = await group_assistant(self, chat_id)
         base = os.path.basename(file_path)
-        chatdir = os.path.join("playback", str(speed))
+        chatdir = os.path.join(PLAYBACK_DIR, str(speed))
         os.makedirs(chatdir, exist_ok=True)
         out = os.path.join(chatdir, base)
 
@@ -194,23 +204,19 @@ class Call:
             await proc.communicate()
 
         dur = int(await asyncio.get_event_loop().run_in_executor(None, check_duration, out))
-        played, con_seconds = speed_converter(playing[0]["played"], speed)
+        played, con_seconds = speed_converter(get_played(chat_id), speed)
         duration_min = seconds_to_min(dur)
-        is_video = playing[0]["streamtype"] == "video"
+        is_video = playing[0].streamtype == "video"
         ffmpeg_params = f"-ss {played} -to {duration_min}"
         stream = dynamic_media_stream(path=out, video=is_video, ffmpeg_params=ffmpeg_params)
 
-        if chat_id in db and db[chat_id] and db[chat_id][0].get("file") == file_path:
+        if chat_id in db and db[chat_id] and db[chat_id][0].file == file_path:
             await assistant.play(chat_id, stream)
-            db[chat_id][0].update({
-                "played": con_seconds,
-                "dur": duration_min,
-                "seconds": dur,
-                "speed_path": out,
-                "speed": speed,
-                "old_dur": db[chat_id][0].get("dur"),
-                "old_second": db[chat_id][0].get("seconds"),
-            })
+            start_clock(chat_id, con_seconds)
+            track = db[chat_id][0]
+            track.old_dur, track.old_second = track.dur, track.seconds
+            track.dur, track.seconds = duration_min, dur
+            track.speed_path, track.speed = out, speed
         else:
             raise AssistantErr("Stream mismatch during speedup.")
 
@@ -227,6 +233,19 @@ class Call:
             except:
                 pass
 
+    async def probe(self) -> bool:
+        """Whether the log group has a voice chat running, checked without joining it."""
+        peer = await app.resolve_peer(config.LOGGER_ID)
+        if isinstance(peer, raw.types.InputPeerChannel):
+            full = await app.invoke(
+                raw.functions.channels.GetFullChannel(
+                    channel=raw.types.InputChannel(channel_id=peer.channel_id, access_hash=peer.access_hash)
+                )
+            )
+        else:
+            full = await app.invoke(raw.functions.messages.GetFullChat(chat_id=peer.chat_id))
+        return full.full_chat.call is not None
+
     @capture_internal_err
     async def join_call(
         self,
@@ -235,11 +254,14 @@ class Call:
         link: str,
         video: Union[bool, str] = None,
         image: Union[bool, str] = None,
+        seek: int = 0,
     ) -> None:
         assistant = await group_assistant(self, chat_id)
         lang = await get_lang(chat_id)
         _ = get_string(lang)
-        stream = dynamic_media_stream(path=link, video=bool(video))
+        stream = dynamic_media_stream(
+            path=link, video=bool(video), ffmpeg_params=f"-ss {seek}" if seek else None
+        )
 
         try:
             await assistant.play(chat_id, stream)
@@ -249,13 +271,17 @@ class Call:
             raise AssistantErr(_["call_11"])
         except NoVideoSourceFound:
             raise AssistantErr(_["call_12"])
-        except (ConnectionNotFound, TelegramServerError):
+        except (ConnectionNotFound, TelegramServerError) as e:
+            assistant_pool.report(chat_id, e)
             raise AssistantErr(_["call_10"])
         except Exception as e:
+            assistant_pool.report(chat_id, e)
             raise AssistantErr(
                 f"?????? ?? ???? ??? ????? ????.\nR??s??: {e}"
             )
+        start_clock(chat_id, seek)
         self.active_calls.add(chat_id)
+        assistant_pool.track(chat_id, bool(video))
         await add_active_chat(chat_id)
         await music_on(chat_id)
         if video:
@@ -267,6 +293,38 @@ class Call:
             if users == 1:
                 autoend[chat_id] = datetime.now() + timedelta(minutes=1)
 
+    async def rejoin(self, chat_id: int, state: dict) -> None:
+        playing = db.get(chat_id)
+        if not playing:
+            raise AssistantErr("Nothing queued to resume.")
+        track = playing[0]
+        video = bool(state.get("video"))
+        position = int(state.get("position") or 0)
+        vidid = track.vidid
+        file_path = track.speed_path or track.file
+
+        if "live_" in file_path:
+            n, file_path = await YouTube.video(vidid, True)
+            if n == 0:
+                raise AssistantErr(file_path)
+            position = 0
+        elif "index_" in file_path:
+            file_path = vidid
+        elif "vid_" in file_path or not os.path.exists(file_path):
+            if vidid in ("telegram", "soundcloud"):
+                raise AssistantErr(f"Local file for {vidid} stream is gone.")
+            file_path = find_cached_file(vidid)
+            if not file_path:
+                file_path, _ = await YouTube.download(vidid, None, videoid=True, video=video)
+            if not file_path:
+                raise AssistantErr(f"Could not fetch {vidid} to resume.")
+
+        await self.join_call(chat_id, track.chat_id, file_path, video=video, seek=position)
+        if state.get("paused"):
+            await self.pause_stream(chat_id)
+            await music_off(chat_id)
+        LOGGER(__name__).info(f"Resumed queue in {chat_id} at {position}s")
+
 
     @capture_internal_err
     async def play(self, client, chat_id: int) -> None:
@@ -275,7 +333,7 @@ class Call:
         loop = await get_loop(chat_id)
         try:
             if loop == 0:
-                popped = check.pop(0)
+                popped = check.popleft()
             else:
                 loop = loop - 1
                 await set_loop(chat_id, loop)
@@ -291,6 +349,7 @@ class Call:
                             pass
                         finally:
                             self.active_calls.discard(chat_id)
+                            assistant_pool.release(chat_id)
                     return
         except:
             try:
@@ -299,25 +358,28 @@ class Call:
             except:
                 return
         else:
-            queued = check[0]["file"]
+            prefetcher.schedule(chat_id)
+            queued = check[0].file
             language = await get_lang(chat_id)
             _ = get_string(language)
-            title = (check[0]["title"]).title()
-            user = check[0]["by"]
-            original_chat_id = check[0]["chat_id"]
-            streamtype = check[0]["streamtype"]
-            videoid = check[0]["vidid"]
-            db[chat_id][0]["played"] = 0
-
-            exis = (check[0]).get("old_dur")
-            if exis:
-                db[chat_id][0]["dur"] = exis
-                db[chat_id][0]["seconds"] = check[0]["old_second"]
-                db[chat_id][0]["speed_path"] = None
-                db[chat_id][0]["speed"] = 1.0
+            title = (check[0].title).title()
+            user = check[0].by
+            original_chat_id = check[0].chat_id
+            streamtype = check[0].streamtype
+            videoid = check[0].vidid
+
+            check[0].reset_speed()
 
             video = True if str(streamtype) == "video" else False
 
+            if await assistant_pool.drain(chat_id):
+                try:
+                    await client.leave_call(chat_id)
+                except Exception:
+                    pass
+                client = await group_assistant(self, chat_id)
+                assistant_pool.track(chat_id, video)
+
             if "live_" in queued:
                 n, link = await YouTube.video(videoid, True)
                 if n == 0:
@@ -326,181 +388,173 @@ class Call:
                 stream = dynamic_media_stream(path=link, video=video)
                 try:
                     await client.play(chat_id, stream)
-                except Exception:
+                except Exception as e:
+                    assistant_pool.report(chat_id, e)
                     return await app.send_message(original_chat_id, text=_["call_6"])
+                start_clock(chat_id)
 
                 img = await get_thumb(videoid)
                 button = stream_markup(_, chat_id)
-                run = await app.send_photo(
-                    chat_id=original_chat_id,
+                run = await sender.call(
+                    app,
+                    "send_photo",
+                    original_chat_id,
                     photo=img,
                     caption=_["stream_1"].format(
                         f"https://t.me/{app.username}?start=info_{videoid}",
                         title[:23],
-                        check[0]["dur"],
+                        check[0].dur,
                         user,
                     ),
                     reply_markup=InlineKeyboardMarkup(button),
+                    priority=Priority.NOW_PLAYING,
                 )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "tg"
+                db[chat_id][0].mystic = run
+                db[chat_id][0].markup = "tg"
 
             elif "vid_" in queued:
                 mystic = await app.send_message(original_chat_id, _["call_7"])
-                try:
-                    file_path, direct = await YouTube.download(
-                        videoid,
-                        mystic,
-                        videoid=True,
-                        video=True if str(streamtype) == "video" else False,
-                    )
-                except:
+                # A finished prefetch has already swapped the placeholder for
+                # its file; an unfinished one is deduplicated onto here.
+                file_path, pending = await open_source(videoid, video)
+                if not file_path:
                     return await mystic.edit_text(
                         _["call_6"], disable_web_page_preview=True
                     )
+                if pending:
+                    # The track is already queued, so adopt now; this also
+                    # consumes the download's result if playback fails below.
+                    adopt(chat_id, videoid, pending)
 
                 stream = dynamic_media_stream(path=file_path, video=video)
                 try:
                     await client.play(chat_id, stream)
-                except:
+                except Exception as e:
+                    assistant_pool.report(chat_id, e)
                     return await app.send_message(original_chat_id, text=_["call_6"])
+                start_clock(chat_id)
+                if not pending:
+                    check[0].file = file_path
 
                 img = await get_thumb(videoid)
                 button = stream_markup(_, chat_id)
                 await mystic.delete()
-                run = await app.send_photo(
-                    chat_id=original_chat_id,
+                run = await sender.call(
+                    app,
+                    "send_photo",
+                    original_chat_id,
                     photo=img,
                     caption=_["stream_1"].format(
                         f"https://t.me/{app.username}?start=info_{videoid}",
                         title[:23],
-                        check[0]["dur"],
+                        check[0].dur,
                         user,
                     ),
                     reply_markup=InlineKeyboardMarkup(button),
+                    priority=Priority.NOW_PLAYING,
                 )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "stream"
+                db[chat_id][0].mystic = run
+                db[chat_id][0].markup = "stream"
 
             elif "index_" in queued:
                 stream = dynamic_media_stream(path=videoid, video=video)
                 try:
                     await client.play(chat_id, stream)
-                except:
+                except Exception as e:
+                    assistant_pool.report(chat_id, e)
                     return await app.send_message(original_chat_id, text=_["call_6"])
+                start_clock(chat_id)
 
                 button = stream_markup(_, chat_id)
-                run = await app.send_photo(
-                    chat_id=original_chat_id,
+                run = await sender.call(
+                    app,
+                    "send_photo",
+                    original_chat_id,
                     photo=config.STREAM_IMG_URL,
                     caption=_["stream_2"].format(user),
                     reply_markup=InlineKeyboardMarkup(button),
+                    priority=Priority.NOW_PLAYING,
                 )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "tg"
+                db[chat_id][0].mystic = run
+                db[chat_id][0].markup = "tg"
 
             else:
                 stream = dynamic_media_stream(path=queued, video=video)
                 try:
                     await client.play(chat_id, stream)
-                except:
+                except Exception as e:
+                    assistant_pool.report(chat_id, e)
                     return await app.send_message(original_chat_id, text=_["call_6"])
+                start_clock(chat_id)
 
                 if videoid == "telegram":
                     button = stream_markup(_, chat_id)
-                    run = await app.send_photo(
-                        chat_id=original_chat_id,
+                    run = await sender.call(
+                        app,
+                        "send_photo",
+                        original_chat_id,
                         photo=(
                             config.TELEGRAM_AUDIO_URL
                             if str(streamtype) == "audio"
                             else config.TELEGRAM_VIDEO_URL
                         ),
                         caption=_["stream_1"].format(
-                            config.SUPPORT_CHAT, title[:23], check[0]["dur"], user
+                            config.SUPPORT_CHAT, title[:23], check[0].dur, user
                         ),
                         reply_markup=InlineKeyboardMarkup(button),
+                        priority=Priority.NOW_PLAYING,
                     )
-                    db[chat_id][0]["mystic"] = run
-                    db[chat_id][0]["markup"] = "tg"
+                    db[chat_id][0].mystic = run
+                    db[chat_id][0].markup = "tg"
 
                 elif videoid == "soundcloud":
                     button = stream_markup(_, chat_id)
-                    run = await app.send_photo(
-                        chat_id=original_chat_id,
+                    run = await sender.call(
+                        app,
+                        "send_photo",
+                        original_chat_id,
                         photo=config.SOUNCLOUD_IMG_URL,
                         caption=_["stream_1"].format(
-                            config.SUPPORT_CHAT, title[:23], check[0]["dur"], user
+                            config.SUPPORT_CHAT, title[:23], check[0].dur, user
                         ),
                         reply_markup=InlineKeyboardMarkup(button),
+                        priority=Priority.NOW_PLAYING,
                     )
-                    db[chat_id][0]["mystic"] = run
-                    db[chat_id][0]["markup"] = "tg"
+                    db[chat_id][0].mystic = run
+                    db[chat_id][0].markup = "tg"
 
                 else:
                     img = await get_thumb(videoid)
                     button = stream_markup(_, chat_id)
-                    try:
-                        run = await app.send_photo(
-                            chat_id=original_chat_id,
-                            photo=img,
-                            caption=_["stream_1"].format(
-                                f"https://t.me/{app.username}?start=info_{videoid}",
-                                title[:23],
-                                check[0]["dur"],
-                                user,
-                            ),
-                            reply_markup=InlineKeyboardMarkup(button),
-                        )
-                    except FloodWait as e:
-                        LOGGER(__name__).warning(f"FloodWait: Sleeping for {e.value}")
-                        await asyncio.sleep(e.value)
-                        run = await app.send_photo(
-                            chat_id=original_chat_id,
-                            photo=img,
-                            caption=_["stream_1"].format(
-                                f"https://t.me/{app.username}?start=info_{videoid}",
-                                title[:23],
-                                check[0]["dur"],
-                                user,
-                            ),
-                            reply_markup=InlineKeyboardMarkup(button),
-                        )
-                    db[chat_id][0]["mystic"] = run
-                    db[chat_id][0]["markup"] = "stream"
+                    run = await sender.call(
+                        app,
+                        "send_photo",
+                        original_chat_id,
+                        photo=img,
+                        caption=_["stream_1"].format(
+                            f"https://t.me/{app.username}?start=info_{videoid}",
+                            title[:23],
+                            check[0].dur,
+                            user,
+                        ),
+                        reply_markup=InlineKeyboardMarkup(button),
+                        priority=Priority.NOW_PLAYING,
+                    )
+                    db[chat_id][0].mystic = run
+                    db[chat_id][0].markup = "stream"
 
 
     async def start(self) -> None:
         LOGGER(__name__).info("Starting PyTgCalls Clients...")
-        if config.STRING1:
-            await self.one.start()
-        if config.STRING2:
-            await self.two.start()
-        if config.STRING3:
-            await self.three.start()
-        if config.STRING4:
-            await self.four.start()
-        if config.STRING5:
-            await self.five.start()
+        await asyncio.gather(*(call.start() for call in self.calls.values()))
 
     @capture_internal_err
     async def ping(self) -> str:
-        pings = []
-        if config.STRING1:
-            pings.append(self.one.ping)
-        if config.STRING2:
-            pings.append(self.two.ping)
-        if config.STRING3:
-            pings.append(self.three.ping)
-        if config.STRING4:
-            pings.append(self.four.ping)
-        if config.STRING5:
-            pings.append(self.five.ping)
+        pings = [call.ping for call in self.calls.values()]
         return str(round(sum(pings) / len(pings), 3)) if pings else "0.0"
 
     @capture_internal_err
     async def decorators(self) -> None:
-        assistants = list(filter(None, [self.one, self.two, self.three, self.four, self.five]))
-
         CRITICAL = (
             ChatUpdate.Status.KICKED
             | ChatUpdate.Status.LEFT_GROUP
@@ -519,7 +573,7 @@ class Call:
                     await self.stop_stream(update.chat_id)
                     return
 
-        for assistant in assistants:
+        for assistant in self.calls.values():
             assistant.on_update()(unified_update_handler)
 
 
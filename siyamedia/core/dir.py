@@ -7,6 +7,7 @@ DOWNLOAD_DIR = os.path.join(BASE_DIR, "downloads")
 COUPLE_DIR = os.path.join(BASE_DIR, "couples")
 CACHE_DIR = os.path.join(BASE_DIR, "cache")
 BACKUP_DIR = os.path.join(BASE_DIR, "siyamediaBackup")
+PLAYBACK_DIR = os.path.join(BASE_DIR, "playback")  # speed-changed renders
 
 def StorageManager():
 
@@ -0,0 +1,77 @@
+# Authored By Certified Coders � 2025
+from typing import Any, Dict, Optional
+
+from pyrogram import errors
+
+from ..logging import LOGGER
+from .mongo import mongodb
+
+# Errors Telegram (or pyrogram's decoder) raises for a file_id it will not take.
+REJECTED = (
+    errors.MediaEmpty,
+    errors.FileIdInvalid,
+    errors.FileReferenceExpired,
+    errors.FileReferenceInvalid,
+    ValueError,
+)
+
+
+class MediaRef:
+    """
+    Registry of remote media URLs that have already been sent, mapped to the
+    file_id Telegram assigned on the first send.
+
+    The mapping is kept in memory and mirrored to Mongo so it survives
+    restarts. ``MusicBotClient`` substitutes the file_id on later sends of the
+    same URL, so Telegram no longer refetches the URL each time, and drops the
+    entry if Telegram rejects the id.
+    """
+
+    def __init__(self) -> None:
+        self._coll = mongodb.media_refs
+        self._ids: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @staticmethod
+    def key(source: Any, kind: str) -> Optional[str]:
+        if isinstance(source, str) and source.startswith(("http://", "https://")):
+            return f"{kind}:{source}"
+        return None
+
+    async def load(self) -> int:
+        try:
+            self._ids = {doc["_id"]: doc["file_id"] async for doc in self._coll.find({})}
+        except Exception as e:
+            LOGGER(__name__).warning(f"Could not load media refs: {e}")
+        return len(self._ids)
+
+    def resolve(self, source: Any, kind: str) -> Any:
+        key = self.key(source, kind)
+        return self._ids.get(key, source) if key else source
+
+    async def remember(self, source: Any, kind: str, message) -> None:
+        key = self.key(source, kind)
+        media = getattr(message, kind, None) if key and message else None
+        # Telegram may store e.g. a silent mp4 as an animation; that id would
+        # not fit the next send_video, so only same-kind results are kept.
+        file_id = getattr(media, "file_id", None)
+        if not file_id or self._ids.get(key) == file_id:
+            return
+        self._ids[key] = file_id
+        try:
+            await self._coll.update_one({"_id": key}, {"$set": {"file_id": file_id}}, upsert=True)
+        except Exception as e:
+            LOGGER(__name__).warning(f"Could not save media ref {key}: {e}")
+
+    async def forget(self, source: Any, kind: str) -> None:
+        key = self.key(source, kind)
+        if key and self._ids.pop(key, None):
+            try:
+                await self._coll.delete_one({"_id": key})
+            except Exception:
+                pass
+
+
+media_refs = MediaRef()
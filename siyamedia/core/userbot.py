@@ -1,4 +1,7 @@
 # Authored By Certified Coders � 2025
+import asyncio
+from typing import Dict
+
 from pyrogram import Client
 
 import config
@@ -20,53 +23,18 @@ GROUPS_TO_JOIN = [
 # Initialize userbots
 class Userbot:
     def __init__(self):
-        self.one = Client(
-            "AnnieAssis1",
-            config.API_ID,
-            config.API_HASH,
-            session_string=str(config.STRING1),
-            no_updates=True,
-        )
-        self.two = Client(
-            "AnnieAssis2",
-            config.API_ID,
-            config.API_HASH,
-            session_string=str(config.STRING2),
-            no_updates=True,
-        )
-        self.three = Client(
-            "AnnieAssis3",
-            config.API_ID,
-            config.API_HASH,
-            session_string=str(config.STRING3),
-            no_updates=True,
-        )
-        self.four = Client(
-            "AnnieAssis4",
-            config.API_ID,
-            config.API_HASH,
-            session_string=str(config.STRING4),
-            no_updates=True,
-        )
-        self.five = Client(
-            "AnnieAssis5",
-            config.API_ID,
-            config.API_HASH,
-            session_string=str(config.STRING5),
-            no_updates=True,
-        )
+        self.clients: Dict[int, Client] = {
+            index: Client(
+                f"AnnieAssis{index}",
+                config.API_ID,
+                config.API_HASH,
+                session_string=str(session),
+                no_updates=True,
+            )
+            for index, session in config.STRING_SESSIONS.items()
+        }
 
     async def start_assistant(self, client: Client, index: int):
-        string_attr = [
-            config.STRING1,
-            config.STRING2,
-            config.STRING3,
-            config.STRING4,
-            config.STRING5,
-        ][index - 1]
-        if not string_attr:
-            return
-
         try:
             await client.start()
             for group in GROUPS_TO_JOIN:
@@ -98,24 +66,16 @@ class Userbot:
 
     async def start(self):
         LOGGER(__name__).info("Starting Annie's Assistants...")
-        await self.start_assistant(self.one, 1)
-        await self.start_assistant(self.two, 2)
-        await self.start_assistant(self.three, 3)
-        await self.start_assistant(self.four, 4)
-        await self.start_assistant(self.five, 5)
+        await asyncio.gather(
+            *(self.start_assistant(client, index) for index, client in self.clients.items())
+        )
+        assistants.sort()
 
     async def stop(self):
         LOGGER(__name__).info("Stopping Assistants...")
-        try:
-            if config.STRING1:
-                await self.one.stop()
-            if config.STRING2:
-                await self.two.stop()
-            if config.STRING3:
-                await self.three.stop()
-            if config.STRING4:
-                await self.four.stop()
-            if config.STRING5:
-                await self.five.stop()
-        except Exception as e:
-            LOGGER(__name__).error(f"Error while stopping assistants: {e}")
+        results = await asyncio.gather(
+            *(self.clients[index].stop() for index in assistants), return_exceptions=True
+        )
+        for index, result in zip(assistants, results):
+            if isinstance(result, Exception):
+                LOGGER(__name__).error(f"Error while stopping assistant {index}: {result}")
@@ -8,6 +8,7 @@ from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup, Voice
 
 import config
 from siyamedia import app
+from siyamedia.utils.mediacache import media_cache
 from siyamedia.utils.formatters import (
     check_duration,
     convert_bytes,
@@ -87,6 +88,7 @@ class TeleAPI:
         speed_counter = {}
 
         if os.path.exists(fname):
+            media_cache.touch(fname)
             return True
 
         async def down_load():
@@ -150,4 +152,5 @@ class TeleAPI:
         if not verify:
             return False
         config.lyrical.pop(mystic.id, None)
+        media_cache.add(fname)
         return True
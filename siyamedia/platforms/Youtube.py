@@ -1,14 +1,10 @@
 # Authored By Certified Coders � 2025
 import asyncio
-import contextlib
-import json
 import os
 import re
-import time
 from typing import Dict, List, Optional, Tuple, Union
 
 import aiohttp
-import yt_dlp
 from pyrogram.enums import MessageEntityType
 from pyrogram.types import Message
 from youtubesearchpython.aio import VideosSearch, Playlist
@@ -19,17 +15,20 @@ from siyamedia.core.mongo import mongodb
 from siyamedia.utils.cookie_handler import COOKIE_PATH
 from siyamedia.utils.database import is_on_off
 from siyamedia.utils.downloader import yt_dlp_download
+from siyamedia.utils.mediacache import media_cache
 from siyamedia.utils.errors import capture_internal_err
+from siyamedia.utils.extractor import extractor
 from siyamedia.utils.formatters import time_to_seconds
-from siyamedia.utils.tuning import YTDLP_TIMEOUT, YOUTUBE_META_MAX, YOUTUBE_META_TTL
+from siyamedia.utils.tuning import YOUTUBE_META_MAX, YOUTUBE_META_TTL
+from siyamedia.utils.ytmeta import MetaCache, search as youtube_search
 from config import LOGGER_ID
 
 
 # === Caches ===
-_cache: Dict[str, Tuple[float, List[Dict]]] = {}
-_cache_lock = asyncio.Lock()
-_formats_cache: Dict[str, Tuple[float, List[Dict], str]] = {}
-_formats_lock = asyncio.Lock()
+# Search/video metadata lives in siyamedia.utils.ytmeta (memory + Mongo).
+# Format lists only matter while a user picks a quality, so they are only
+# kept in memory.
+_formats_cache = MetaCache(None, YOUTUBE_META_MAX, YOUTUBE_META_TTL)
 
 
 # === Constants ===
@@ -54,25 +53,6 @@ def _cookiefile_path() -> Optional[str]:
     return None
 
 
-def _cookies_args() -> List[str]:
-    path = _cookiefile_path()
-    return ["--cookies", path] if path else []
-
-
-async def _exec_proc(*args: str) -> Tuple[bytes, bytes]:
-    proc = await asyncio.create_subprocess_exec(
-        *args,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    try:
-        return await asyncio.wait_for(proc.communicate(), timeout=YTDLP_TIMEOUT)
-    except asyncio.TimeoutError:
-        with contextlib.suppress(Exception):
-            proc.kill()
-        return b"", b"timeout"
-
-
 async def load_api_url():
     global YOUR_API_URL
     logger = LOGGER("siyamedia.platforms.Youtube")
@@ -394,18 +374,16 @@ async def download_with_cookies(link: str, file_type: str) -> Optional[str]:
         if os.path.exists(file_path):
             return file_path
         
-        cookies_args = _cookies_args()
-        if not cookies_args:
+        if not _cookiefile_path():
             return None  # No cookies available
         
         format_str = "best[height<=?720][width<=?1280]" if file_type == "video" else "bestaudio[ext=webm][acodec=opus]"
         
-        stdout, stderr = await _exec_proc(
-            "yt-dlp",
-            *cookies_args,
-            "-f", format_str,
-            "-o", file_path,
+        # Template rather than the literal path so the worker's YoutubeDL
+        # instance can be reused for every video id.
+        await extractor.download(
             full_link,
+            {"format": format_str, "outtmpl": os.path.join(download_dir, f"%(id)s.{ext}")},
         )
         
         if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
@@ -417,29 +395,7 @@ async def download_with_cookies(link: str, file_type: str) -> Optional[str]:
 
 @capture_internal_err
 async def cached_youtube_search(query: str) -> List[Dict]:
-    key = f"q:{query}"
-    now = time.time()
-
-    async with _cache_lock:
-        if key in _cache:
-            ts, val = _cache[key]
-            if now - ts < YOUTUBE_META_TTL:
-                return val
-            _cache.pop(key, None)
-        if len(_cache) > YOUTUBE_META_MAX:
-            _cache.clear()
-
-    try:
-        data = await VideosSearch(query, limit=1).next()
-        result = data.get("result", [])
-    except Exception:
-        result = []
-
-    if result:
-        async with _cache_lock:
-            _cache[key] = (now, result)
-
-    return result
+    return await youtube_search(query)
 
 
 # === Main Class ===
@@ -492,26 +448,18 @@ class YouTubeAPI:
 
     # === Metadata Fetching ===
     @capture_internal_err
-    async def _fetch_video_info(self, query: str, *, use_cache: bool = True) -> Optional[Dict]:
-        q = self._prepare_link(query)
-        if use_cache and not q.startswith("http"):
-            res = await cached_youtube_search(q)
-            return res[0] if res else None
-        data = await VideosSearch(q, limit=1).next()
-        result = data.get("result", [])
-        return result[0] if result else None
+    async def _fetch_video_info(self, query: str) -> Optional[Dict]:
+        res = await cached_youtube_search(self._prepare_link(query))
+        return res[0] if res else None
 
     @capture_internal_err
     async def is_live(self, link: str) -> bool:
         prepared = self._prepare_link(link)
-        stdout, _ = await _exec_proc("yt-dlp", *(_cookies_args()), "--dump-json", prepared)
-        if not stdout:
-            return False
         try:
-            info = json.loads(stdout.decode())
-            return bool(info.get("is_live"))
-        except json.JSONDecodeError:
+            info = await extractor.extract(prepared)
+        except Exception:
             return False
+        return bool(info and info.get("is_live"))
 
     @capture_internal_err
     async def details(
@@ -565,9 +513,6 @@ class YouTubeAPI:
                     f"for query/URL: '{prepared_link}'"
                 )
         except Exception as search_err:
-            stdout, stderr = await _exec_proc(
-                "yt-dlp", *(_cookies_args()), "--dump-json", "--no-warnings", prepared_link
-            )
 
             def _both_failed(details: str) -> ValueError:
                 return ValueError(
@@ -576,18 +521,12 @@ class YouTubeAPI:
                     f"{details}"
                 )
 
-            if not stdout:
-                stderr_msg = stderr.decode().strip() if stderr else "Empty response"
-                raise _both_failed(f"  2. yt-dlp error: {stderr_msg}")
-
             try:
-                info = json.loads(stdout.decode())
-            except json.JSONDecodeError as json_err:
-                raw = stdout.decode()[:400]
-                raise _both_failed(
-                    f"  2. yt-dlp JSON error: {json_err}\n"
-                    f"     Raw: {raw}..."
-                ) from json_err
+                info = await extractor.extract(prepared_link)
+            except Exception as ytdlp_err:
+                raise _both_failed(f"  2. yt-dlp error: {ytdlp_err!r}") from ytdlp_err
+            if not info:
+                raise _both_failed("  2. yt-dlp error: Empty response")
 
         thumb = (
             info.get("thumbnail")
@@ -639,70 +578,51 @@ class YouTubeAPI:
         except Exception:
             pass
 
-        stdout, _ = await _exec_proc(
-            "yt-dlp",
-            *(_cookies_args()),
-            "-i",
-            "--get-id",
-            "--flat-playlist",
-            "--playlist-end",
-            str(limit),
-            "--skip-download",
-            link,
-        )
-        items = stdout.decode().strip().split("\n") if stdout else []
-        return [i for i in items if i]
+        try:
+            info = await extractor.extract(
+                link,
+                {"extract_flat": "in_playlist", "playlistend": int(limit), "ignoreerrors": True},
+            )
+        except Exception:
+            return []
+        entries = (info or {}).get("entries") or []
+        return [e["id"] for e in entries if e and e.get("id")]
 
     @capture_internal_err
     async def formats(
         self, link: str, videoid: Union[str, bool, None] = None
     ) -> Tuple[List[Dict], str]:
         link = self._prepare_link(link, videoid)
-        key = f"f:{link}"
-        now = time.time()
-
-        async with _formats_lock:
-            cached = _formats_cache.get(key)
-            if cached and now - cached[0] < YOUTUBE_META_TTL:
-                return cached[1], cached[2]
-
-        opts = {"quiet": True}
-        if cf := _cookiefile_path():
-            opts["cookiefile"] = cf
+        out = await _formats_cache.get(f"f:{link}", lambda: self._list_formats(link))
+        return out or [], link
 
+    async def _list_formats(self, link: str) -> List[Dict]:
         out: List[Dict] = []
         try:
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                info = ydl.extract_info(link, download=False)
-                for fmt in info.get("formats", []):
-                    if "dash" in str(fmt.get("format", "")).lower():
-                        continue
-                    if not any(k in fmt for k in ("filesize", "filesize_approx")):
-                        continue
-                    if not all(k in fmt for k in ("format", "format_id", "ext", "format_note")):
-                        continue
-                    size = fmt.get("filesize") or fmt.get("filesize_approx")
-                    if not size:
-                        continue
-                    out.append(
-                        {
-                            "format": fmt["format"],
-                            "filesize": size,
-                            "format_id": fmt["format_id"],
-                            "ext": fmt["ext"],
-                            "format_note": fmt["format_note"],
-                            "yturl": link,
-                        }
-                    )
+            info = await extractor.extract(link)
+            for fmt in (info or {}).get("formats", []):
+                if "dash" in str(fmt.get("format", "")).lower():
+                    continue
+                if not any(k in fmt for k in ("filesize", "filesize_approx")):
+                    continue
+                if not all(k in fmt for k in ("format", "format_id", "ext", "format_note")):
+                    continue
+                size = fmt.get("filesize") or fmt.get("filesize_approx")
+                if not size:
+                    continue
+                out.append(
+                    {
+                        "format": fmt["format"],
+                        "filesize": size,
+                        "format_id": fmt["format_id"],
+                        "ext": fmt["ext"],
+                        "format_note": fmt["format_note"],
+                        "yturl": link,
+                    }
+                )
         except Exception:
             pass
-
-        async with _formats_lock:
-            if len(_formats_cache) > YOUTUBE_META_MAX:
-                _formats_cache.clear()
-            _formats_cache[key] = (now, out, link)
-
-        return out, link
+        return out
 
     @capture_internal_err
     async def slider(
@@ -745,6 +665,7 @@ class YouTubeAPI:
                 downloaded_file = await download_song(link)
 
             if downloaded_file:
+                media_cache.add(downloaded_file)
                 # We always return a local path, so this is "direct"
                 return downloaded_file, True
             else:
@@ -12,10 +12,10 @@ from siyamedia.core.userbot import assistants
 
 @app.on_message(filters.command("sg"))
 async def sg(client: Client, message: Message):
-    if not assistants or 1 not in assistants:
+    ubot = us.clients.get(assistants[0]) if assistants else None
+    if ubot is None:
         return await message.reply("? No active userbot assistant found!")
 
-    ubot = us.one
     status_msg = await message.reply("??")
 
     try:
@@ -1,11 +1,10 @@
 # Authored By Certified Coders  2025
-import asyncio
 import random
 from pyrogram import filters
 from pyrogram.enums import ChatType
-from pyrogram.errors import FloodWait
 from siyamedia import app
 from siyamedia.utils.admin_check import is_admin
+from siyamedia.utils.sender import Priority, sender
 from siyamedia.plugins.misc.funtag_messages import (
     GN_MESSAGES,
     GM_MESSAGES,
@@ -44,14 +43,14 @@ async def mention_members(client, message, message_pool, stop_cmd):
             if member.user.is_bot:
                 continue
             try:
-                await client.send_message(
+                await sender.call(
+                    client,
+                    "send_message",
                     chat_id,
                     f"[{member.user.first_name}](tg://user?id={member.user.id}) {random.choice(message_pool)}",
                     disable_web_page_preview=True,
+                    priority=Priority.BULK,
                 )
-                await asyncio.sleep(4)
-            except FloodWait as e:
-                await asyncio.sleep(e.value)
             except Exception as e:
                 print(f"Error tagging user: {e}")
                 continue
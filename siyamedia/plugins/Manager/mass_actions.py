@@ -15,8 +15,6 @@ Each command asks for a Yes/No confirmation via inline buttons.
 -------------------------------------------------------------------------
 """
 
-import asyncio
-
 from pyrogram import filters, Client
 from pyrogram.types import (
     InlineKeyboardButton, InlineKeyboardMarkup,
@@ -25,7 +23,9 @@ from pyrogram.types import (
 from pyrogram.enums import ChatMemberStatus, ChatMembersFilter
 
 from siyamedia import app
+from siyamedia.utils.fanout import DONE, FanOutAction, FanOutJob, fanout
 from siyamedia.utils.permissions import is_owner_or_sudoer, mention
+from siyamedia.utils.sender import Priority, sender
 
 MASS_CMDS = ["kickall", "banall", "unbanall", "muteall", "unmuteall", "unpinall"]
 
@@ -83,105 +83,122 @@ async def handle_mass_confirm(client: Client, callback: CallbackQuery):
     await callback.message.edit(f"? `{cmd}` in progress")
 
     try:
-        if cmd == "kickall":
-            await _do_kickall(client, chat_id)
-        elif cmd == "banall":
-            await _do_banall(client, chat_id)
-        elif cmd == "unbanall":
-            await _do_unbanall(client, chat_id)
-        elif cmd == "muteall":
-            await _do_muteall(client, chat_id)
-        elif cmd == "unmuteall":
-            await _do_unmuteall(client, chat_id)
-        elif cmd == "unpinall":
+        if cmd == "unpinall":
             await _do_unpinall(client, chat_id)
+        elif await _run_mass_action(cmd, chat_id, callback.message.id) != DONE:
+            return  # cancelled; the progress message already shows it
 
         await callback.message.edit(f"? `{cmd}` completed.")
     except Exception as e:
         await callback.message.edit(f"? Error during `{cmd}`:\n{e}")
 
 
+@app.on_message(filters.command(["cancelall"]) & filters.group)
+async def cancel_mass_action(client: Client, message: Message):
+    ok, _ = await is_owner_or_sudoer(client, message.chat.id, message.from_user.id)
+    if not ok:
+        return
+    jobs = [job for job in fanout.active() if job.action in MASS_CMDS and job.scope == message.chat.id]
+    for job in jobs:
+        await fanout.cancel(job)
+    if jobs:
+        await message.reply_text(f"Cancelled `{jobs[0].action}`.")
+    else:
+        await message.reply_text("Nothing to cancel.")
+
+
 # -----------------------------------------------------
 # Implementations
 # -----------------------------------------------------
-async def _do_kickall(client, chat_id: int):
-    kicked, errors = 0, 0
-    async for m in client.get_chat_members(chat_id):
-        if m.user.is_bot or m.status == ChatMemberStatus.OWNER:
-            continue
-        try:
-            await client.ban_chat_member(chat_id, m.user.id)
-            await asyncio.sleep(0.1)
-            await client.unban_chat_member(chat_id, m.user.id)
-            kicked += 1
-        except:
-            errors += 1
-        await asyncio.sleep(0.05)
-    await client.send_message(chat_id, f"Kicked: {kicked}\nFailures: {errors}")
-
-
-async def _do_banall(client, chat_id: int):
-    banned, errors = 0, 0
-    async for m in client.get_chat_members(chat_id):
-        if m.user.is_bot or m.status == ChatMemberStatus.OWNER:
-            continue
-        try:
-            await client.ban_chat_member(chat_id, m.user.id)
-            banned += 1
-        except:
-            errors += 1
-        await asyncio.sleep(0.05)
-    await client.send_message(chat_id, f"Banned: {banned}\nFailures: {errors}")
-
-
-
-async def _do_unbanall(client, chat_id: int):
-    unbanned, errors = 0, 0
-    async for m in client.get_chat_members(chat_id, filter=ChatMembersFilter.BANNED):
-        try:
-            await client.unban_chat_member(chat_id, m.user.id)
-            unbanned += 1
-        except:
-            errors += 1
-        await asyncio.sleep(0.05)
-    await client.send_message(chat_id, f"Unbanned: {unbanned}\nFailures: {errors}")
-
-
-async def _do_muteall(client, chat_id: int):
-    muted, errors = 0, 0
-    perms = ChatPermissions()
-    async for m in client.get_chat_members(chat_id):
-        if m.user.is_bot or m.status in (ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER):
-            continue
-        try:
-            await client.restrict_chat_member(chat_id, m.user.id, perms)
-            muted += 1
-        except:
-            errors += 1
-        await asyncio.sleep(0.05)
-    await client.send_message(chat_id, f"Muted: {muted}\nFailures: {errors}")
-
-
-async def _do_unmuteall(client, chat_id: int):
-    unmuted, errors = 0, 0
-    perms = ChatPermissions(
-        can_send_messages=True,
-        can_send_media_messages=True,
-        can_send_polls=True,
-        can_send_other_messages=True,
-        can_add_web_page_previews=True,
-        can_invite_users=True,
+# Every action except unpinall runs on the shared fan-out executor: members
+# are paged lazily, acted on by a bounded set of workers under the send
+# scheduler, and the confirmation message shows live progress.
+UNMUTE_PERMS = ChatPermissions(
+    can_send_messages=True,
+    can_send_media_messages=True,
+    can_send_polls=True,
+    can_send_other_messages=True,
+    can_add_web_page_previews=True,
+    can_invite_users=True,
+)
+STAFF = (ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER)
+
+
+def _members(skip=(ChatMemberStatus.OWNER,), filter=ChatMembersFilter.SEARCH, bots=False):
+    async def source(job: FanOutJob):
+        async for m in app.get_chat_members(job.scope, filter=filter):
+            if (m.user.is_bot and not bots) or m.status in skip:
+                continue
+            yield None, m.user.id
+    return source
+
+
+def _summary(label: str):
+    async def finish(job: FanOutJob):
+        await app.send_message(job.scope, f"{label}: {job.done}\nFailures: {job.failed}")
+    return finish
+
+
+def _mass_status(job: FanOutJob) -> str:
+    return (
+        f"`{job.action}` {job.state}: {job.processed}/{job.total or '?'}\n"
+        f"Done: {job.done} | Failures: {job.failed}\n\n/cancelall to stop."
+    )
+
+
+async def _kick(job: FanOutJob, user_id: int):
+    await sender.call(app, "ban_chat_member", job.scope, user_id, priority=Priority.BULK)
+    await sender.call(app, "unban_chat_member", job.scope, user_id, priority=Priority.BULK)
+
+
+async def _ban(job: FanOutJob, user_id: int):
+    await sender.call(app, "ban_chat_member", job.scope, user_id, priority=Priority.BULK)
+
+
+async def _unban(job: FanOutJob, user_id: int):
+    await sender.call(app, "unban_chat_member", job.scope, user_id, priority=Priority.BULK)
+
+
+async def _mute(job: FanOutJob, user_id: int):
+    await sender.call(
+        app, "restrict_chat_member", job.scope, user_id, ChatPermissions(), priority=Priority.BULK
+    )
+
+
+async def _unmute(job: FanOutJob, user_id: int):
+    await sender.call(
+        app, "restrict_chat_member", job.scope, user_id, UNMUTE_PERMS, priority=Priority.BULK
+    )
+
+
+for _cmd, _source, _apply, _label in (
+    ("kickall", _members(), _kick, "Kicked"),
+    ("banall", _members(), _ban, "Banned"),
+    ("unbanall", _members((), ChatMembersFilter.BANNED, bots=True), _unban, "Unbanned"),
+    ("muteall", _members(STAFF), _mute, "Muted"),
+    ("unmuteall", _members(STAFF), _unmute, "Unmuted"),
+):
+    fanout.register(
+        _cmd, FanOutAction(_source, _apply, _mass_status, _summary(_label), resumable=False)
+    )
+
+
+async def _run_mass_action(cmd: str, chat_id: int, status_msg: int) -> str:
+    total = 0
+    if cmd != "unbanall":
+        total = await app.get_chat_members_count(chat_id)
+    job = await fanout.start(
+        FanOutJob(
+            id=fanout.new_id(),
+            action=cmd,
+            scope=chat_id,
+            total=total,
+            status_chat=chat_id,
+            status_msg=status_msg,
+        )
     )
-    async for m in client.get_chat_members(chat_id):
-        if m.user.is_bot or m.status in (ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER):
-            continue
-        try:
-            await client.restrict_chat_member(chat_id, m.user.id, perms)
-            unmuted += 1
-        except:
-            errors += 1
-        await asyncio.sleep(0.05)
-    await client.send_message(chat_id, f"Unmuted: {unmuted}\nFailures: {errors}")
+    await fanout.wait(job)
+    return job.state
 
 
 async def _do_unpinall(client, chat_id: int):
@@ -1,12 +1,12 @@
 # Authored By Certified Coders  2025
-import asyncio
 from pyrogram import Client, filters
 from pyrogram.enums import ChatMemberStatus
-from pyrogram.errors import UserNotParticipant, FloodWait
+from pyrogram.errors import UserNotParticipant
 from pyrogram.types import Message
 
 from siyamedia import app
 from siyamedia.utils.admin_filters import admin_filter
+from siyamedia.utils.sender import Priority, sender
 
 spam_chats = set()
 
@@ -36,16 +36,17 @@ async def tag_all_users(client: Client, message: Message):
 
             if usernum == 5:
                 try:
-                    if replied:
-                        await replied.reply_text(f"{text}\n{usertxt}\n?? ??????? {total_tagged} ?s??s ????...")
-                    else:
-                        await message.reply_text(f"{text}\n{usertxt}\n?? ??????? {total_tagged} ?s??s ????...")
-                except FloodWait as e:
-                    await asyncio.sleep(e.value)
+                    await sender.call(
+                        client,
+                        "send_message",
+                        message.chat.id,
+                        f"{text}\n{usertxt}\n?? ??????? {total_tagged} ?s??s ????...",
+                        reply_to_message_id=(replied or message).id,
+                        priority=Priority.BULK,
+                    )
                 except Exception:
                     pass
 
-                await asyncio.sleep(3)
                 usernum, usertxt = 0, ""
 
         if usertxt:
@@ -1,17 +1,12 @@
 # Authored By Certified Coders  2025
 import os
 import asyncio
-from functools import lru_cache
-from PIL import Image, ImageDraw, ImageFont
 from pyrogram import filters, enums
 from pyrogram.types import Message, ChatMemberUpdated, InlineKeyboardMarkup, InlineKeyboardButton
 from pyrogram.errors import TopicClosed, PeerIdInvalid, ChannelPrivate, SlowmodeWait
 from siyamedia import app
 from siyamedia.mongo.welcomedb import is_on, set_state, bump, cool, auto_on
-
-BG_PATH = "siyamedia/assets/annie/welcome.png"
-FALLBACK_PIC = "siyamedia/assets/upic.png"
-FONT_PATH = "siyamedia/assets/annie/Arimo.ttf"
+from siyamedia.utils.render import FALLBACK_PIC, renderer, welcome_card
 
 BTN_VIEW = "? ???? ??? ?????? ?"
 BTN_ADD = "? ?????? ?? ?"
@@ -35,35 +30,6 @@ WELCOME_LIMIT = 5
 
 last_messages = {}
 
-@lru_cache(maxsize=1)
-def cached_bg():
-    return Image.open(BG_PATH).convert("RGBA")
-
-@lru_cache(maxsize=2)
-def cached_font(size=65):
-    return ImageFont.truetype(FONT_PATH, size)
-
-def circle(im, size=(835, 839)):
-    im = im.resize(size, Image.LANCZOS).convert("RGBA")
-    mask = Image.new("L", size, 0)
-    ImageDraw.Draw(mask).ellipse((0, 0, *size), fill=255)
-    im.putalpha(mask)
-    return im
-
-def build_pic(av, fn, uid, un):
-    os.makedirs("downloads", exist_ok=True)
-    bg = cached_bg().copy()
-    avatar = circle(Image.open(av))
-    bg.paste(avatar, (1887, 390), avatar)
-    d = ImageDraw.Draw(bg)
-    f = cached_font()
-    d.text((421, 715), fn, fill=(242, 242, 242), font=f)
-    d.text((270, 1005), str(uid), fill=(242, 242, 242), font=f)
-    d.text((570, 1308), un, fill=(242, 242, 242), font=f)
-    path = f"downloads/welcome_{uid}.png"
-    bg.save(path)
-    return path
-
 async def safe_send(func, *args, **kwargs):
     try:
         return await func(*args, **kwargs)
@@ -139,7 +105,17 @@ async def welcome(client, update: ChatMemberUpdated):
     if not avatar:
         avatar = FALLBACK_PIC
 
-    img = build_pic(avatar, user.first_name, user.id, user.username or "No Username")
+    async def cleanup(path):
+        if path and os.path.exists(path) and not os.path.abspath(path).startswith(os.path.abspath("siyamedia/assets")):
+            try:
+                os.remove(path)
+            except:
+                pass
+
+    img = await safe_send(renderer.submit, welcome_card, avatar, user.first_name, user.id, user.username or "No Username")
+    if not img:
+        asyncio.create_task(cleanup(avatar))
+        return
 
     members = await safe_send(client.get_chat_members_count, cid) or "?"
 
@@ -169,12 +145,5 @@ async def welcome(client, update: ChatMemberUpdated):
             if old_msg:
                 await safe_send(old_msg.delete)
 
-    async def cleanup(path):
-        if path and os.path.exists(path) and not os.path.abspath(path).startswith(os.path.abspath("siyamedia/assets")):
-            try:
-                os.remove(path)
-            except:
-                pass
-
     asyncio.create_task(cleanup(avatar))
     asyncio.create_task(cleanup(img))
@@ -4,6 +4,7 @@ from pyrogram.types import Message
 
 from siyamedia import app
 from siyamedia.utils import extract_user, int_to_alpha
+from siyamedia.utils.admincache import admin_cache
 from siyamedia.utils.database import (
     delete_authuser,
     get_authuser,
@@ -12,7 +13,7 @@ from siyamedia.utils.database import (
 )
 from siyamedia.utils.decorators import AdminActual, language
 from siyamedia.utils.inline import close_markup
-from config import BANNED_USERS, adminlist
+from config import BANNED_USERS
 
 
 @app.on_message(filters.command("auth") & filters.group & ~BANNED_USERS)
@@ -34,10 +35,7 @@ async def auth(client, message: Message, _):
             "admin_id": message.from_user.id,
             "admin_name": message.from_user.first_name,
         }
-        get = adminlist.get(message.chat.id)
-        if get:
-            if user.id not in get:
-                get.append(user.id)
+        admin_cache.add_auth(message.chat.id, user.id)
         await save_authuser(message.chat.id, token, assis)
         return await message.reply_text(_["auth_2"].format(user.mention))
     else:
@@ -53,10 +51,7 @@ async def unauthusers(client, message: Message, _):
     user = await extract_user(message)
     token = await int_to_alpha(user.id)
     deleted = await delete_authuser(message.chat.id, token)
-    get = adminlist.get(message.chat.id)
-    if get:
-        if user.id in get:
-            get.remove(user.id)
+    admin_cache.remove_auth(message.chat.id, user.id)
     if deleted:
         return await message.reply_text(_["auth_4"].format(user.mention))
     else:
@@ -1,6 +1,5 @@
 # Authored By Certified Coders  2025
 import asyncio
-import random
 from pyrogram import filters
 from pyrogram.types import CallbackQuery, InlineKeyboardMarkup
 from config import (
@@ -30,6 +29,8 @@ from siyamedia.utils.decorators import ActualAdminCB, languageCB
 from siyamedia.utils.formatters import seconds_to_min
 from siyamedia.utils.inline import close_markup, stream_markup, stream_markup_timer
 from siyamedia.utils.stream.autoclear import auto_clean
+from siyamedia.utils.stream.clock import get_played
+from siyamedia.utils.stream.prefetch import prefetcher
 from siyamedia.utils.thumbnails import get_thumb
 
 
@@ -102,16 +103,10 @@ async def manage_callback(client, callback: CallbackQuery, _):
         playlist = db.get(chat_id)
         if not playlist:
             return await callback.answer(_["admin_42"], show_alert=True)
-        try:
-            popped = playlist.pop(0)
-        except Exception:
-            return await callback.answer(_["admin_43"], show_alert=True)
-        if not playlist:
-            playlist.insert(0, popped)
+        if not playlist.shuffle():
             return await callback.answer(_["admin_43"], show_alert=True)
+        prefetcher.schedule(chat_id)
         await callback.answer()
-        random.shuffle(playlist)
-        playlist.insert(0, popped)
         await callback.message.reply_text(_["admin_44"].format(user_mention))
 
     elif command in ["Skip", "Replay"]:
@@ -130,7 +125,7 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
     if command == "Skip":
         text_msg = f"? s????? s?????? ??\n \n+?? : {user_mention} ??"
         try:
-            popped = playlist.pop(0)
+            popped = playlist.popleft()
             if popped:
                 await auto_clean(popped)
             if not playlist:
@@ -156,20 +151,16 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
         return await callback.answer(_["queue_2"], show_alert=True)
 
     current_track = playlist[0]
-    queued = current_track["file"]
-    title = current_track["title"].title()
-    user = current_track["by"]
-    duration = current_track["dur"]
-    streamtype = current_track["streamtype"]
-    videoid = current_track["vidid"]
+    await prefetcher.ready(chat_id, current_track)
+    queued = current_track.file
+    title = current_track.title.title()
+    user = current_track.by
+    duration = current_track.dur
+    streamtype = current_track.streamtype
+    videoid = current_track.vidid
     status = True if str(streamtype) == "video" else None
 
-    db[chat_id][0]["played"] = 0
-    if current_track.get("old_dur"):
-        db[chat_id][0]["dur"] = current_track["old_dur"]
-        db[chat_id][0]["seconds"] = current_track["old_second"]
-        db[chat_id][0]["speed_path"] = None
-        db[chat_id][0]["speed"] = 1.0
+    current_track.reset_speed()
 
     if "live_" in queued:
         n, new_link = await YouTube.video(videoid, True)
@@ -193,8 +184,8 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
             caption=_["stream_1"].format(f"https://t.me/{app.username}?start=info_{videoid}", title[:23], duration, user),
             reply_markup=InlineKeyboardMarkup(buttons)
         )
-        db[chat_id][0]["mystic"] = run
-        db[chat_id][0]["markup"] = "tg"
+        db[chat_id][0].mystic = run
+        db[chat_id][0].markup = "tg"
         await callback.edit_message_text(text_msg, reply_markup=close_markup(_))
 
     elif "vid_" in queued:
@@ -218,8 +209,8 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
             caption=_["stream_1"].format(f"https://t.me/{app.username}?start=info_{videoid}", title[:23], duration, user),
             reply_markup=InlineKeyboardMarkup(buttons)
         )
-        db[chat_id][0]["mystic"] = run
-        db[chat_id][0]["markup"] = "stream"
+        db[chat_id][0].mystic = run
+        db[chat_id][0].markup = "stream"
         await callback.edit_message_text(text_msg, reply_markup=close_markup(_))
         await mystic.delete()
 
@@ -234,8 +225,8 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
             caption=_["stream_2"].format(user),
             reply_markup=InlineKeyboardMarkup(buttons)
         )
-        db[chat_id][0]["mystic"] = run
-        db[chat_id][0]["markup"] = "tg"
+        db[chat_id][0].mystic = run
+        db[chat_id][0].markup = "tg"
         await callback.edit_message_text(text_msg, reply_markup=close_markup(_))
 
     else:
@@ -257,8 +248,8 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
                 caption=_["stream_1"].format(SUPPORT_CHAT, title[:23], duration, user),
                 reply_markup=InlineKeyboardMarkup(buttons)
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
         elif videoid == "soundcloud":
             buttons = stream_markup(_, chat_id)
             run = await callback.message.reply_photo(
@@ -266,8 +257,8 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
                 caption=_["stream_1"].format(SUPPORT_CHAT, title[:23], duration, user),
                 reply_markup=InlineKeyboardMarkup(buttons)
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
         else:
             buttons = stream_markup(_, chat_id)
             img = await get_thumb(videoid)
@@ -276,8 +267,8 @@ async def handle_skip_replay(callback: CallbackQuery, _, chat_id: int, command:
                 caption=_["stream_1"].format(f"https://t.me/{app.username}?start=info_{videoid}", title[:23], duration, user),
                 reply_markup=InlineKeyboardMarkup(buttons)
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "stream"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "stream"
         await callback.edit_message_text(text_msg, reply_markup=close_markup(_))
 
 
@@ -285,15 +276,15 @@ async def handle_seek(callback: CallbackQuery, _, chat_id: int, command: str, us
     playing = db.get(chat_id)
     if not playing or len(playing) == 0:
         return await callback.answer(_["queue_2"], show_alert=True)
-    duration_seconds = int(playing[0]["seconds"])
+    duration_seconds = int(playing[0].seconds)
     if duration_seconds == 0:
         return await callback.answer(_["admin_22"], show_alert=True)
-    file_path = playing[0]["file"]
+    file_path = playing[0].file
     if "index_" in file_path or "live_" in file_path:
         return await callback.answer(_["admin_22"], show_alert=True)
-    duration_played = int(playing[0]["played"])
+    duration_played = get_played(chat_id)
     duration_to_skip = 10 if int(command) in [1, 2] else 30
-    duration = playing[0]["dur"]
+    duration = playing[0].dur
     if int(command) in [1, 3]:
         if (duration_played - duration_to_skip) <= 10:
             bet = seconds_to_min(duration_played)
@@ -315,7 +306,7 @@ async def handle_seek(callback: CallbackQuery, _, chat_id: int, command: str, us
     await callback.answer()
     mystic = await callback.message.reply_text(_["admin_24"])
     if "vid_" in file_path:
-        n, file_path = await YouTube.video(playing[0]["vidid"], True)
+        n, file_path = await YouTube.video(playing[0].vidid, True)
         if n == 0:
             return await mystic.edit_text(_["admin_22"])
     try:
@@ -324,14 +315,10 @@ async def handle_seek(callback: CallbackQuery, _, chat_id: int, command: str, us
             file_path,
             seconds_to_min(to_seek),
             duration,
-            playing[0]["streamtype"],
+            playing[0].streamtype,
         )
     except Exception:
         return await mystic.edit_text(_["admin_26"])
-    if int(command) in [1, 3]:
-        db[chat_id][0]["played"] -= duration_to_skip
-    else:
-        db[chat_id][0]["played"] += duration_to_skip
     seek_message = _["admin_25"].format(seconds_to_min(to_seek))
     await mystic.edit_text(f"{seek_message}\n\n??????s ???? ?? : {user_mention} !")
 
@@ -347,10 +334,10 @@ async def markup_timer():
                 playing = db.get(chat_id)
                 if not playing:
                     continue
-                duration_seconds = int(playing[0]["seconds"])
+                duration_seconds = int(playing[0].seconds)
                 if duration_seconds == 0:
                     continue
-                mystic = playing[0].get("mystic")
+                mystic = playing[0].mystic
                 if not mystic:
                     continue
                 if chat_id in checker and mystic.id in checker[chat_id]:
@@ -365,8 +352,8 @@ async def markup_timer():
                     buttons = stream_markup_timer(
                         _lang,
                         chat_id,
-                        seconds_to_min(playing[0]["played"]),
-                        playing[0]["dur"],
+                        seconds_to_min(get_played(chat_id)),
+                        playing[0].dur,
                     )
                     await mystic.edit_reply_markup(reply_markup=InlineKeyboardMarkup(buttons))
                 except Exception:
@@ -1,6 +1,4 @@
 # Authored By Certified Coders  2025
-import random
-
 from pyrogram import filters
 from pyrogram.types import Message
 
@@ -8,6 +6,7 @@ from siyamedia import app
 from siyamedia.misc import db
 from siyamedia.utils.decorators import AdminRightsCheck
 from siyamedia.utils.inline import close_markup
+from siyamedia.utils.stream.prefetch import prefetcher
 from config import BANNED_USERS
 
 
@@ -19,16 +18,9 @@ async def admins(Client, message: Message, _, chat_id):
     check = db.get(chat_id)
     if not check:
         return await message.reply_text(_["queue_2"])
-    try:
-        popped = check.pop(0)
-    except:
-        return await message.reply_text(_["admin_15"], reply_markup=close_markup(_))
-    check = db.get(chat_id)
-    if not check:
-        check.insert(0, popped)
+    if not check.shuffle():
         return await message.reply_text(_["admin_15"], reply_markup=close_markup(_))
-    random.shuffle(check)
-    check.insert(0, popped)
+    prefetcher.schedule(chat_id)
     await message.reply_text(
         _["admin_16"].format(message.from_user.mention), reply_markup=close_markup(_)
     )
@@ -10,6 +10,7 @@ from siyamedia.utils.database import get_loop
 from siyamedia.utils.decorators import AdminRightsCheck
 from siyamedia.utils.inline import close_markup, stream_markup
 from siyamedia.utils.stream.autoclear import auto_clean
+from siyamedia.utils.stream.prefetch import prefetcher
 from siyamedia.utils.thumbnails import get_thumb
 from config import BANNED_USERS
 
@@ -35,7 +36,7 @@ async def skip(cli, message: Message, _, chat_id):
                         for x in range(state):
                             popped = None
                             try:
-                                popped = check.pop(0)
+                                popped = check.popleft()
                             except:
                                 return await message.reply_text(_["admin_12"])
                             if popped:
@@ -66,7 +67,7 @@ async def skip(cli, message: Message, _, chat_id):
         popped = None
         try:
             if check:
-                popped = check.pop(0)
+                popped = check.popleft()
             if popped:
                 await auto_clean(popped)
             if not check:
@@ -95,19 +96,14 @@ async def skip(cli, message: Message, _, chat_id):
     if not check:
         return
     
-    queued = check[0]["file"]
-    title = (check[0]["title"]).title()
-    user = check[0]["by"]
-    streamtype = check[0]["streamtype"]
-    videoid = check[0]["vidid"]
+    await prefetcher.ready(chat_id, check[0])
+    queued = check[0].file
+    title = (check[0].title).title()
+    user = check[0].by
+    streamtype = check[0].streamtype
+    videoid = check[0].vidid
     status = True if str(streamtype) == "video" else None
-    db[chat_id][0]["played"] = 0
-    exis = (check[0]).get("old_dur")
-    if exis:
-        db[chat_id][0]["dur"] = exis
-        db[chat_id][0]["seconds"] = check[0]["old_second"]
-        db[chat_id][0]["speed_path"] = None
-        db[chat_id][0]["speed"] = 1.0
+    check[0].reset_speed()
     if "live_" in queued:
         n, link = await YouTube.video(videoid, True)
         if n == 0:
@@ -127,13 +123,13 @@ async def skip(cli, message: Message, _, chat_id):
             caption=_["stream_1"].format(
                 f"https://t.me/{app.username}?start=info_{videoid}",
                 title[:23],
-                check[0]["dur"],
+                check[0].dur,
                 user,
             ),
             reply_markup=InlineKeyboardMarkup(button),
         )
-        db[chat_id][0]["mystic"] = run
-        db[chat_id][0]["markup"] = "tg"
+        db[chat_id][0].mystic = run
+        db[chat_id][0].markup = "tg"
     elif "vid_" in queued:
         mystic = await message.reply_text(_["call_7"], disable_web_page_preview=True)
         try:
@@ -160,13 +156,13 @@ async def skip(cli, message: Message, _, chat_id):
             caption=_["stream_1"].format(
                 f"https://t.me/{app.username}?start=info_{videoid}",
                 title[:23],
-                check[0]["dur"],
+                check[0].dur,
                 user,
             ),
             reply_markup=InlineKeyboardMarkup(button),
         )
-        db[chat_id][0]["mystic"] = run
-        db[chat_id][0]["markup"] = "stream"
+        db[chat_id][0].mystic = run
+        db[chat_id][0].markup = "stream"
         await mystic.delete()
     elif "index_" in queued:
         try:
@@ -179,8 +175,8 @@ async def skip(cli, message: Message, _, chat_id):
             caption=_["stream_2"].format(user),
             reply_markup=InlineKeyboardMarkup(button),
         )
-        db[chat_id][0]["mystic"] = run
-        db[chat_id][0]["markup"] = "tg"
+        db[chat_id][0].mystic = run
+        db[chat_id][0].markup = "tg"
     else:
         if videoid == "telegram":
             image = None
@@ -202,12 +198,12 @@ async def skip(cli, message: Message, _, chat_id):
                 if str(streamtype) == "audio"
                 else config.TELEGRAM_VIDEO_URL,
                 caption=_["stream_1"].format(
-                    config.SUPPORT_CHAT, title[:23], check[0]["dur"], user
+                    config.SUPPORT_CHAT, title[:23], check[0].dur, user
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
         elif videoid == "soundcloud":
             button = stream_markup(_, chat_id)
             run = await message.reply_photo(
@@ -215,12 +211,12 @@ async def skip(cli, message: Message, _, chat_id):
                 if str(streamtype) == "audio"
                 else config.TELEGRAM_VIDEO_URL,
                 caption=_["stream_1"].format(
-                    config.SUPPORT_CHAT, title[:23], check[0]["dur"], user
+                    config.SUPPORT_CHAT, title[:23], check[0].dur, user
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
         else:
             button = stream_markup(_, chat_id)
             img = await get_thumb(videoid)
@@ -229,10 +225,10 @@ async def skip(cli, message: Message, _, chat_id):
                 caption=_["stream_1"].format(
                     f"https://t.me/{app.username}?start=info_{videoid}",
                     title[:23],
-                    check[0]["dur"],
+                    check[0].dur,
                     user,
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "stream"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "stream"
@@ -2,11 +2,12 @@
 from pyrogram import filters
 from pyrogram.types import Message
 
-from config import BANNED_USERS, adminlist
+from config import BANNED_USERS
 from siyamedia import app
 from siyamedia.core.call import StreamController
 from siyamedia.misc import SUDOERS, db
 from siyamedia.utils import AdminRightsCheck
+from siyamedia.utils.admincache import admin_cache
 from siyamedia.utils.database import is_active_chat, is_nonadmin_chat
 from siyamedia.utils.decorators.language import languageCB
 from siyamedia.utils.inline import close_markup, speed_markup
@@ -24,10 +25,10 @@ async def playback(cli, message: Message, _, chat_id):
     playing = db.get(chat_id)
     if not playing:
         return await message.reply_text(_["queue_2"])
-    duration_seconds = int(playing[0]["seconds"])
+    duration_seconds = int(playing[0].seconds)
     if duration_seconds == 0:
         return await message.reply_text(_["admin_27"])
-    file_path = playing[0]["file"]
+    file_path = playing[0].file
     if "downloads" not in file_path:
         return await message.reply_text(_["admin_27"])
     upl = speed_markup(_, chat_id)
@@ -49,22 +50,22 @@ async def manage_callback(client, CallbackQuery, _):
     is_non_admin = await is_nonadmin_chat(CallbackQuery.message.chat.id)
     if not is_non_admin:
         if CallbackQuery.from_user.id not in SUDOERS:
-            admins = adminlist.get(CallbackQuery.message.chat.id)
+            admins = await admin_cache.get(CallbackQuery.message.chat.id)
             if not admins:
                 return await CallbackQuery.answer(_["admin_13"], show_alert=True)
             else:
-                if CallbackQuery.from_user.id not in admins:
+                if not admins.can_manage(CallbackQuery.from_user.id):
                     return await CallbackQuery.answer(_["admin_14"], show_alert=True)
     playing = db.get(chat_id)
     if not playing:
         return await CallbackQuery.answer(_["queue_2"], show_alert=True)
-    duration_seconds = int(playing[0]["seconds"])
+    duration_seconds = int(playing[0].seconds)
     if duration_seconds == 0:
         return await CallbackQuery.answer(_["admin_27"], show_alert=True)
-    file_path = playing[0]["file"]
+    file_path = playing[0].file
     if "downloads" not in file_path:
         return await CallbackQuery.answer(_["admin_27"], show_alert=True)
-    checkspeed = (playing[0]).get("speed")
+    checkspeed = playing[0].speed
     if checkspeed:
         if str(checkspeed) == str(speed):
             if str(speed) == str("1.0"):
@@ -4,46 +4,35 @@ from pyrogram.types import (
     InlineKeyboardMarkup,
     InlineQueryResultPhoto,
 )
-from youtubesearchpython.aio import VideosSearch
 
 from siyamedia.utils.inlinequery import answer
+from siyamedia.utils.inlinesearch import inline_search
+from siyamedia.utils.tuning import INLINE_CACHE_TIME
 from config import BANNED_USERS
 from siyamedia import app
 
 
-@app.on_inline_query(~BANNED_USERS)
-async def inline_query_handler(client, query):
-    text = query.query.strip().lower()
-    answers = []
-    if text.strip() == "":
-        try:
-            await client.answer_inline_query(query.id, results=answer, cache_time=10)
-        except:
-            return
-    else:
-        a = VideosSearch(text, limit=20)
-        result = (await a.next()).get("result")
-        for x in range(15):
-            title = (result[x]["title"]).title()
-            duration = result[x]["duration"]
-            views = result[x]["viewCount"]["short"]
-            thumbnail = result[x]["thumbnails"][0]["url"].split("?")[0]
-            channellink = result[x]["channel"]["link"]
-            channel = result[x]["channel"]["name"]
-            link = result[x]["link"]
-            published = result[x]["publishedTime"]
-            description = f"{views} | {duration} ??????s | {channel}  | {published}"
-            buttons = InlineKeyboardMarkup(
-                [
-                    [
-                        InlineKeyboardButton(
-                            text="??????? ??",
-                            url=link,
-                        )
-                    ],
-                ]
-            )
-            searched_text = f"""
+def search_result(result: dict) -> InlineQueryResultPhoto:
+    title = (result.get("title") or "").title()
+    duration = result.get("duration") or "LIVE"
+    views = (result.get("viewCount") or {}).get("short") or "0"
+    thumbnail = result["thumbnails"][0]["url"].split("?")[0]
+    channellink = (result.get("channel") or {}).get("link")
+    channel = (result.get("channel") or {}).get("name")
+    link = result["link"]
+    published = result.get("publishedTime") or ""
+    description = f"{views} | {duration} ??????s | {channel}  | {published}"
+    buttons = InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(
+                    text="??????? ??",
+                    url=link,
+                )
+            ],
+        ]
+    )
+    searched_text = f"""
 ? <b>????? :</b> <a href={link}>{title}</a>
 
 ? <b>???????? :</b> {duration} ??????s
@@ -53,17 +42,41 @@ async def inline_query_handler(client, query):
 
 
 <u><b>? ?????? s????? ???? ?? {app.name}</b></u>"""
-            answers.append(
-                InlineQueryResultPhoto(
-                    photo_url=thumbnail,
-                    title=title,
-                    thumb_url=thumbnail,
-                    description=description,
-                    caption=searched_text,
-                    reply_markup=buttons,
-                )
-            )
+    return InlineQueryResultPhoto(
+        photo_url=thumbnail,
+        title=title,
+        thumb_url=thumbnail,
+        description=description,
+        caption=searched_text,
+        reply_markup=buttons,
+    )
+
+
+@app.on_inline_query(~BANNED_USERS)
+async def inline_query_handler(client, query):
+    text = query.query.strip()
+    if text == "":
         try:
-            return await client.answer_inline_query(query.id, results=answers)
+            return await client.answer_inline_query(query.id, results=answer, cache_time=10)
         except:
             return
+
+    results = await inline_search.search(query.from_user.id, text)
+    if results is None:
+        return  # superseded by a newer query from the same user
+    page, next_offset = inline_search.page(results, query.offset)
+    answers = []
+    for result in page:
+        try:
+            answers.append(search_result(result))
+        except (KeyError, IndexError, TypeError):
+            continue
+    try:
+        return await client.answer_inline_query(
+            query.id,
+            results=answers,
+            cache_time=INLINE_CACHE_TIME,
+            next_offset=next_offset,
+        )
+    except:
+        return
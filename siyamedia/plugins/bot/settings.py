@@ -9,6 +9,7 @@ from siyamedia.utils.database import (
     add_nonadmin_chat,
     get_authuser,
     get_authuser_names,
+    get_chat_settings,
     get_playmode,
     get_playtype,
     get_upvote_count,
@@ -125,12 +126,10 @@ async def without_admin_rights(client, callback: CallbackQuery, _):
             await callback.answer(_["set_cb_2"], show_alert=True)
         except Exception:
             pass
-        playmode = await get_playmode(callback.message.chat.id)
-        Direct = True if playmode == "Direct" else None
-        is_non_admin = await is_nonadmin_chat(callback.message.chat.id)
-        Group = True if not is_non_admin else None
-        playty = await get_playtype(callback.message.chat.id)
-        Playtype = None if playty == "Everyone" else True
+        settings = await get_chat_settings(callback.message.chat.id)
+        Direct = True if settings.playmode == "Direct" else None
+        Group = True if not settings.nonadmin else None
+        Playtype = None if settings.playtype == "Everyone" else True
         buttons = playmode_users_markup(_, Direct, Group, Playtype)
     if command == "AUTH_SETTINGS":
         try:
@@ -140,9 +139,8 @@ async def without_admin_rights(client, callback: CallbackQuery, _):
         is_non_admin = await is_nonadmin_chat(callback.message.chat.id)
         buttons = auth_users_markup(_, True) if not is_non_admin else auth_users_markup(_)
     if command == "VOTE_SETTINGS":
-        mode = await is_skipmode(callback.message.chat.id)
-        current = await get_upvote_count(callback.message.chat.id)
-        buttons = vote_mode_markup(_, current, mode)
+        settings = await get_chat_settings(callback.message.chat.id)
+        buttons = vote_mode_markup(_, settings.upvotes, settings.skipmode)
     try:
         return await callback.edit_message_reply_markup(reply_markup=InlineKeyboardMarkup(buttons))
     except MessageNotModified:
@@ -15,12 +15,12 @@ from siyamedia.utils import bot_sys_stats
 from siyamedia.utils.database import (
     add_served_chat,
     add_served_user,
-    blacklisted_chats,
     get_lang,
-    get_served_chats,
-    get_served_users,
     is_banned_user,
+    is_blacklisted_chat,
     is_on_off,
+    served_chats_count,
+    served_users_count,
 )
 from siyamedia.utils.decorators.language import LanguageStart
 from siyamedia.utils.formatters import get_readable_time
@@ -125,8 +125,8 @@ async def start_pm(client, message: Message, _):
     sticker_message = await message.reply_sticker(sticker=random.choice(STICKERS))
     asyncio.create_task(delete_sticker_after_delay(sticker_message, 2))
 
-    served_chats_coro = get_served_chats()
-    served_users_coro = get_served_users()
+    served_chats_coro = served_chats_count()
+    served_users_coro = served_users_count()
     stats_coro = bot_sys_stats()
     served_chats, served_users, (UP, CPU, RAM, DISK) = await asyncio.gather(
         served_chats_coro, served_users_coro, stats_coro
@@ -135,7 +135,7 @@ async def start_pm(client, message: Message, _):
     await message.reply_video(
         random.choice(START_VIDS),
         caption=random.choice(AYUV).format(
-            message.from_user.mention, app.mention, UP, DISK, CPU, RAM, len(served_users), len(served_chats)
+            message.from_user.mention, app.mention, UP, DISK, CPU, RAM, served_users, served_chats
         ),
         reply_markup=InlineKeyboardMarkup(out),
     )
@@ -186,7 +186,7 @@ async def welcome(client, message: Message):
                     await message.reply_text(_["start_4"])
                     return await app.leave_chat(message.chat.id)
 
-                if message.chat.id in await blacklisted_chats():
+                if await is_blacklisted_chat(message.chat.id):
                     await message.reply_text(
                         _["start_5"].format(
                             app.mention,
@@ -2,32 +2,25 @@
 import asyncio
 
 from pyrogram import filters
-from pyrogram.enums import ChatMembersFilter
-from pyrogram.errors import FloodWait
 
 from siyamedia import app
 from siyamedia.misc import SUDOERS
 from siyamedia.utils.database import (
-    get_active_chats,
-    get_authuser_names,
     get_client,
-    get_served_chats,
-    get_served_users,
+    get_lang,
 )
+from siyamedia.utils.broadcaster import BroadcastJob, broadcaster
 from siyamedia.utils.decorators.language import language
-from siyamedia.utils.formatters import alpha_to_int
-from config import adminlist
-
-IS_BROADCASTING = False
+from siyamedia.utils.sender import Priority, sender
 
 
 @app.on_message(filters.command("broadcast") & SUDOERS)
 @language
 async def braodcast_message(client, message, _):
-    global IS_BROADCASTING
     if message.reply_to_message:
         x = message.reply_to_message.id
         y = message.chat.id
+        query = None
     else:
         if len(message.command) < 2:
             return await message.reply_text(_["broad_2"])
@@ -44,76 +37,30 @@ async def braodcast_message(client, message, _):
             query = query.replace("-user", "")
         if query == "":
             return await message.reply_text(_["broad_8"])
+        x = y = None
 
-    IS_BROADCASTING = True
     await message.reply_text(_["broad_1"])
+    lang = await get_lang(message.chat.id)
+    pin = "loud" if "-pinloud" in message.text else "quiet" if "-pin" in message.text else None
 
+    targets = []
     if "-nobot" not in message.text:
-        sent = 0
-        pin = 0
-        chats = []
-        schats = await get_served_chats()
-        for chat in schats:
-            chats.append(int(chat["chat_id"]))
-        for i in chats:
-            try:
-                m = (
-                    await app.forward_messages(i, y, x)
-                    if message.reply_to_message
-                    else await app.send_message(i, text=query)
-                )
-                if "-pin" in message.text:
-                    try:
-                        await m.pin(disable_notification=True)
-                        pin += 1
-                    except:
-                        continue
-                elif "-pinloud" in message.text:
-                    try:
-                        await m.pin(disable_notification=False)
-                        pin += 1
-                    except:
-                        continue
-                sent += 1
-                await asyncio.sleep(0.2)
-            except FloodWait as fw:
-                flood_time = int(fw.value)
-                if flood_time > 200:
-                    continue
-                await asyncio.sleep(flood_time)
-            except:
-                continue
-        try:
-            await message.reply_text(_["broad_3"].format(sent, pin))
-        except:
-            pass
-
+        targets.append("chats")
     if "-user" in message.text:
-        susr = 0
-        served_users = []
-        susers = await get_served_users()
-        for user in susers:
-            served_users.append(int(user["user_id"]))
-        for i in served_users:
-            try:
-                m = (
-                    await app.forward_messages(i, y, x)
-                    if message.reply_to_message
-                    else await app.send_message(i, text=query)
-                )
-                susr += 1
-                await asyncio.sleep(0.2)
-            except FloodWait as fw:
-                flood_time = int(fw.value)
-                if flood_time > 200:
-                    continue
-                await asyncio.sleep(flood_time)
-            except:
-                pass
-        try:
-            await message.reply_text(_["broad_4"].format(susr))
-        except:
-            pass
+        targets.append("users")
+    for target in targets:
+        job = BroadcastJob(
+            id=broadcaster.new_id(),
+            target=target,
+            from_chat=y,
+            message_id=x,
+            text=query,
+            pin=pin if target == "chats" else None,
+            lang=lang,
+        )
+        status = await message.reply_text(broadcaster.status_text(job))
+        job.status_chat, job.status_msg = status.chat.id, status.id
+        await broadcaster.start(job)
 
     if "-assistant" in message.text:
         aw = await message.reply_text(_["broad_5"])
@@ -125,18 +72,12 @@ async def braodcast_message(client, message, _):
             client = await get_client(num)
             async for dialog in client.get_dialogs():
                 try:
-                    await client.forward_messages(
-                        dialog.chat.id, y, x
-                    ) if message.reply_to_message else await client.send_message(
-                        dialog.chat.id, text=query
+                    await (
+                        sender.call(client, "forward_messages", dialog.chat.id, y, x, priority=Priority.BULK)
+                        if message.reply_to_message
+                        else sender.call(client, "send_message", dialog.chat.id, text=query, priority=Priority.BULK)
                     )
                     sent += 1
-                    await asyncio.sleep(3)
-                except FloodWait as fw:
-                    flood_time = int(fw.value)
-                    if flood_time > 200:
-                        continue
-                    await asyncio.sleep(flood_time)
                 except:
                     continue
             text += _["broad_7"].format(num, sent)
@@ -144,27 +85,23 @@ async def braodcast_message(client, message, _):
             await aw.edit_text(text)
         except:
             pass
-    IS_BROADCASTING = False
 
 
-async def auto_clean():
-    while not await asyncio.sleep(10):
-        try:
-            served_chats = await get_active_chats()
-            for chat_id in served_chats:
-                if chat_id not in adminlist:
-                    adminlist[chat_id] = []
-                    async for user in app.get_chat_members(
-                        chat_id, filter=ChatMembersFilter.ADMINISTRATORS
-                    ):
-                        if getattr(user.privileges, 'can_manage_video_chats', False):
-                            adminlist[chat_id].append(user.user.id)
-                    authusers = await get_authuser_names(chat_id)
-                    for user in authusers:
-                        user_id = await alpha_to_int(user)
-                        adminlist[chat_id].append(user_id)
-        except:
-            continue
+@app.on_message(filters.command(["bstatus", "bpause", "bresume", "bcancel"]) & SUDOERS)
+@language
+async def broadcast_control(client, message, _):
+    job = broadcaster.get(message.command[1] if len(message.command) > 1 else None)
+    if not job:
+        return await message.reply_text(_["broad_10"])
+    action = message.command[0].lower()
+    if action == "bstatus":
+        return await message.reply_text(broadcaster.status_text(job))
+    changed = await {
+        "bpause": broadcaster.pause,
+        "bresume": broadcaster.resume,
+        "bcancel": broadcaster.cancel,
+    }[action](job)
+    await message.reply_text(_["broad_11" if changed else "broad_12"].format(job.id, job.state))
 
 
-asyncio.create_task(auto_clean())
+asyncio.create_task(broadcaster.resume_all())
@@ -2,75 +2,15 @@
 # Authored By Certified Coders  2025
 
 import os
-import json
-import shutil
-import zipfile
 import asyncio
 from datetime import datetime, timedelta
-from motor.motor_asyncio import AsyncIOMotorClient
 from pyrogram import Client, filters
 from pyrogram.types import Message
 from siyamedia import app
-from config import MONGO_DB_URI, LOGGER_ID, OWNER_ID
+from config import LOGGER_ID, OWNER_ID
 from siyamedia.logging import LOGGER
 from siyamedia.core.dir import BACKUP_DIR
-
-DB_NAME = "Annie"
-TEMP_DIR = os.path.join(BACKUP_DIR, "tmp")
-
-async def _dump_collection(collection, path: str):
-    data = []
-    async for doc in collection.find({}):
-        doc.pop("_id", None)
-        for key, value in doc.items():
-            if isinstance(value, datetime):
-                doc[key] = value.isoformat()
-        data.append(doc)
-    if data:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-async def _create_backup_zip() -> str:
-    LOGGER(__name__).info("??? Starting backup process for all collections")
-
-    client = AsyncIOMotorClient(MONGO_DB_URI)
-    db = client[DB_NAME]
-    collections = await db.list_collection_names()
-
-    for fname in os.listdir(BACKUP_DIR):
-        fpath = os.path.join(BACKUP_DIR, fname)
-        if os.path.isfile(fpath) and fname.endswith(".zip"):
-            try:
-                os.remove(fpath)
-            except Exception:
-                pass
-
-    if os.path.exists(TEMP_DIR):
-        shutil.rmtree(TEMP_DIR)
-    os.makedirs(TEMP_DIR, exist_ok=True)
-
-    tasks = [
-        _dump_collection(db[coll], os.path.join(TEMP_DIR, f"{coll}.json"))
-        for coll in collections
-    ]
-    await asyncio.gather(*tasks)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    zip_name = f"siyamedia_Backup_{timestamp}.zip"
-    zip_path = os.path.join(BACKUP_DIR, zip_name)
-
-    LOGGER(__name__).info(f"?? Creating backup archive: {zip_name}")
-
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for root, _, files in os.walk(TEMP_DIR):
-            for file in files:
-                fp = os.path.join(root, file)
-                arc = os.path.join("Annie", os.path.relpath(fp, TEMP_DIR))
-                zf.write(fp, arc)
-
-    shutil.rmtree(TEMP_DIR)
-    return zip_path
+from siyamedia.utils.dbbackup import commit_marks, create_backup, full_backup_due, restore_backup
 
 async def _send_backup(zip_path: str, chat_id: int, caption: str):
     await app.send_document(chat_id=chat_id, document=zip_path, caption=caption)
@@ -86,14 +26,16 @@ async def manual_backup(_: Client, message: Message):
         "?? **Starting Backup**\n"
         "__Please wait while we securely export your database.__ ??"
     )
+    incremental = len(message.command) > 1 and message.command[1].lower() in ("inc", "incremental")
     try:
-        zip_path = await _create_backup_zip()
+        zip_path, marks = await create_backup(incremental)
         caption = (
             "? **Backup Successfully Completed!**\n"
             "__Your MongoDB database has been exported.__ ???\n\n"
             f"**File:** `{os.path.basename(zip_path)}`"
         )
         await _send_backup(zip_path, message.chat.id, caption)
+        await commit_marks(marks, full=not incremental)
         await processing.delete()
     except Exception as e:
         await processing.edit_text(
@@ -110,14 +52,44 @@ async def daily_backup_task():
             target += timedelta(days=1)
         await asyncio.sleep((target - now).total_seconds())
         try:
-            zip_path = await _create_backup_zip()
+            full = await full_backup_due()
+            zip_path, marks = await create_backup(incremental=not full)
             caption = (
                 "?? **Daily Backup  Completed??**\n"
-                "__Your automatic full database backup is ready.__ ????"
+                f"__Your automatic {'full' if full else 'incremental'} database backup is ready.__ ????"
             )
             await _send_backup(zip_path, LOGGER_ID, caption)
+            await commit_marks(marks, full=full)
             LOGGER(__name__).info("Daily backup sent to LOGGER_ID.")
         except Exception as e:
             LOGGER(__name__).error(f"Daily backup failed: {e}")
 
+@app.on_message(filters.command("restore") & filters.user(OWNER_ID))
+async def restore_command(_: Client, message: Message):
+    reply = message.reply_to_message
+    if not reply or not reply.document or not (reply.document.file_name or "").endswith(".zip"):
+        return await message.reply_text(
+            "**Usage:** reply to a backup archive with `/restore [collection]`.\n"
+            "__Restore the full backup first, then each incremental one in order.__\n"
+            "__Incremental archives only hold newly inserted documents; edits and "
+            "deletions made since the last full backup are not included.__"
+        )
+    only = message.command[1] if len(message.command) > 1 else None
+    processing = await message.reply_text("**Restoring Backup...**")
+    path = None
+    try:
+        path = await reply.download(file_name=os.path.join(BACKUP_DIR, "restore", ""))
+        restored, skipped = await restore_backup(path, only)
+        lines = "\n".join(
+            f"`{name}`: {count}" + (f" ({skipped[name]} skipped, duplicate key)" if skipped.get(name) else "")
+            for name, count in sorted(restored.items())
+        )
+        await processing.edit_text(f"**Restore Completed!**\n\n{lines or 'Nothing to restore.'}")
+    except Exception as e:
+        await processing.edit_text(f"**Restore Failed!**\n**Error:** `{e}`")
+        LOGGER(__name__).error(f"Restore failed: {e}")
+    finally:
+        if path and os.path.exists(path):
+            os.remove(path)
+
 asyncio.create_task(daily_backup_task())
@@ -4,7 +4,12 @@ from pyrogram.types import Message
 
 from siyamedia import app
 from siyamedia.misc import SUDOERS
-from siyamedia.utils.database import blacklist_chat, blacklisted_chats, whitelist_chat
+from siyamedia.utils.database import (
+    blacklist_chat,
+    blacklisted_chats,
+    is_blacklisted_chat,
+    whitelist_chat,
+)
 from siyamedia.utils.decorators.language import language
 from config import BANNED_USERS
 
@@ -15,7 +20,7 @@ async def blacklist_chat_func(client, message: Message, _):
     if len(message.command) != 2:
         return await message.reply_text(_["black_1"])
     chat_id = int(message.text.strip().split()[1])
-    if chat_id in await blacklisted_chats():
+    if await is_blacklisted_chat(chat_id):
         return await message.reply_text(_["black_2"])
     blacklisted = await blacklist_chat(chat_id)
     if blacklisted:
@@ -36,7 +41,7 @@ async def white_funciton(client, message: Message, _):
     if len(message.command) != 2:
         return await message.reply_text(_["black_4"])
     chat_id = int(message.text.strip().split()[1])
-    if chat_id not in await blacklisted_chats():
+    if not await is_blacklisted_chat(chat_id):
         return await message.reply_text(_["black_5"])
     whitelisted = await whitelist_chat(chat_id)
     if whitelisted:
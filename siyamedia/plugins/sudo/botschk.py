@@ -7,6 +7,7 @@ from siyamedia.core.userbot import Userbot
 from config import OWNER_ID
 
 userbot = Userbot()
+assistant = next(iter(userbot.clients.values()), None)
 
 BOT_LIST = [
     "TuneviaBot",
@@ -23,8 +24,8 @@ async def check_bots_command(client, message):
     if message.from_user.id != OWNER_ID:
         return await message.reply_text("?? You are not authorized to use this command.")
 
-    if not userbot.one.is_connected:
-        await userbot.one.start()
+    if not assistant.is_connected:
+        await assistant.start()
 
     processing_msg = await message.reply_photo(
         photo="https://graph.org/file/e6b215db83839e8edf831.jpg",
@@ -37,12 +38,12 @@ async def check_bots_command(client, message):
 
     for bot_username in BOT_LIST:
         try:
-            bot = await userbot.one.get_users(bot_username)
+            bot = await assistant.get_users(bot_username)
             await asyncio.sleep(0.5)
-            await userbot.one.send_message(bot.id, "/start")
+            await assistant.send_message(bot.id, "/start")
             await asyncio.sleep(3)
             
-            async for bot_message in userbot.one.get_chat_history(bot.id, limit=1):
+            async for bot_message in assistant.get_chat_history(bot.id, limit=1):
                 status = "?????? ?" if bot_message.from_user.id == bot.id else "??????? ?"
                 response += f"?? {bot.mention}\n?? **s????s: {status}**\n\n"
         except Exception:
@@ -51,5 +52,5 @@ async def check_bots_command(client, message):
     last_checked_time = start_time.strftime("%Y-%m-%d")
     await processing_msg.edit_caption(f"{response}?? ??s? ?????: {last_checked_time}")
 
-    if userbot.one.is_connected:
-        await userbot.one.stop()
+    if assistant.is_connected:
+        await assistant.stop()
@@ -2,7 +2,6 @@
 import asyncio
 
 from pyrogram import filters
-from pyrogram.errors import FloodWait
 from pyrogram.types import Message
 
 from siyamedia import app
@@ -12,15 +11,84 @@ from siyamedia.utils.database import (
     add_banned_user,
     get_banned_count,
     get_banned_users,
-    get_served_chats,
+    get_lang,
     is_banned_user,
     remove_banned_user,
+    served_chats_count,
 )
 from siyamedia.utils.decorators.language import language
 from siyamedia.utils.extraction import extract_user
+from siyamedia.utils.fanout import DONE, FanOutAction, FanOutJob, fanout, served_chat_targets
+from siyamedia.utils.sender import Priority, sender
+from strings import get_string
 from config import BANNED_USERS
 
 
+def gban_status(job: FanOutJob) -> str:
+    _ = get_string(job.lang)
+    return _["gban_13"].format(
+        job.id, job.action, job.meta.get("mention"), job.state,
+        job.processed, job.total, job.done, job.failed,
+    )
+
+
+async def gban_finished(job: FanOutJob) -> None:
+    if job.state != DONE:
+        return
+    _ = get_string(job.lang)
+    meta = job.meta
+    if job.action == "gban":
+        text = _["gban_6"].format(
+            app.mention,
+            meta.get("chat_title"),
+            job.status_chat,
+            meta.get("mention"),
+            job.subject,
+            meta.get("by"),
+            job.done,
+        )
+    else:
+        text = _["gban_9"].format(meta.get("mention"), job.done)
+    await app.send_message(job.status_chat, text, reply_to_message_id=meta.get("reply_to"))
+    await app.delete_messages(job.status_chat, job.status_msg)
+
+
+async def ban_in_chat(job: FanOutJob, chat_id: int) -> None:
+    await sender.call(app, "ban_chat_member", chat_id, job.subject, priority=Priority.BULK)
+
+
+async def unban_in_chat(job: FanOutJob, chat_id: int) -> None:
+    await sender.call(app, "unban_chat_member", chat_id, job.subject, priority=Priority.BULK)
+
+
+fanout.register("gban", FanOutAction(served_chat_targets, ban_in_chat, gban_status, gban_finished))
+fanout.register("ungban", FanOutAction(served_chat_targets, unban_in_chat, gban_status, gban_finished))
+
+
+async def start_gban(action: str, message: Message, user, status) -> None:
+    # A gban and an ungban of the same user must not race each other.
+    opposite = "ungban" if action == "gban" else "gban"
+    for job in fanout.active(opposite, user.id):
+        await fanout.cancel(job)
+    await fanout.start(
+        FanOutJob(
+            id=fanout.new_id(),
+            action=action,
+            subject=user.id,
+            total=await served_chats_count(),
+            lang=await get_lang(message.chat.id),
+            status_chat=message.chat.id,
+            status_msg=status.id,
+            meta={
+                "mention": user.mention,
+                "by": message.from_user.mention,
+                "chat_title": message.chat.title,
+                "reply_to": message.id,
+            },
+        )
+    )
+
+
 @app.on_message(filters.command(["gban", "globalban"]) & SUDOERS)
 @language
 async def global_ban(client, message: Message, _):
@@ -39,34 +107,10 @@ async def global_ban(client, message: Message, _):
         return await message.reply_text(_["gban_4"].format(user.mention))
     if user.id not in BANNED_USERS:
         BANNED_USERS.add(user.id)
-    served_chats = []
-    chats = await get_served_chats()
-    for chat in chats:
-        served_chats.append(int(chat["chat_id"]))
-    time_expected = get_readable_time(len(served_chats))
-    mystic = await message.reply_text(_["gban_5"].format(user.mention, time_expected))
-    number_of_chats = 0
-    for chat_id in served_chats:
-        try:
-            await app.ban_chat_member(chat_id, user.id)
-            number_of_chats += 1
-        except FloodWait as fw:
-            await asyncio.sleep(int(fw.value))
-        except:
-            continue
     await add_banned_user(user.id)
-    await message.reply_text(
-        _["gban_6"].format(
-            app.mention,
-            message.chat.title,
-            message.chat.id,
-            user.mention,
-            user.id,
-            message.from_user.mention,
-            number_of_chats,
-        )
-    )
-    await mystic.delete()
+    time_expected = get_readable_time(await served_chats_count())
+    mystic = await message.reply_text(_["gban_5"].format(user.mention, time_expected))
+    await start_gban("gban", message, user, mystic)
 
 
 @app.on_message(filters.command(["ungban"]) & SUDOERS)
@@ -81,24 +125,24 @@ async def global_un(client, message: Message, _):
         return await message.reply_text(_["gban_7"].format(user.mention))
     if user.id in BANNED_USERS:
         BANNED_USERS.remove(user.id)
-    served_chats = []
-    chats = await get_served_chats()
-    for chat in chats:
-        served_chats.append(int(chat["chat_id"]))
-    time_expected = get_readable_time(len(served_chats))
-    mystic = await message.reply_text(_["gban_8"].format(user.mention, time_expected))
-    number_of_chats = 0
-    for chat_id in served_chats:
-        try:
-            await app.unban_chat_member(chat_id, user.id)
-            number_of_chats += 1
-        except FloodWait as fw:
-            await asyncio.sleep(int(fw.value))
-        except:
-            continue
     await remove_banned_user(user.id)
-    await message.reply_text(_["gban_9"].format(user.mention, number_of_chats))
-    await mystic.delete()
+    time_expected = get_readable_time(await served_chats_count())
+    mystic = await message.reply_text(_["gban_8"].format(user.mention, time_expected))
+    await start_gban("ungban", message, user, mystic)
+
+
+@app.on_message(filters.command(["gcancel"]) & SUDOERS)
+@language
+async def gban_cancel(client, message: Message, _):
+    if len(message.command) > 1:
+        job = fanout.get(message.command[1])
+    else:
+        jobs = fanout.active("gban") + fanout.active("ungban")
+        job = max(jobs, key=lambda job: job.started) if jobs else None
+    if not job or job.action not in ("gban", "ungban"):
+        return await message.reply_text(_["gban_14"])
+    await fanout.cancel(job)
+    await message.reply_text(_["gban_15"].format(job.id, job.state))
 
 
 @app.on_message(filters.command(["gbannedusers", "gbanlist"]) & SUDOERS)
@@ -124,3 +168,7 @@ async def gbanned_list(client, message: Message, _):
         return await mystic.edit_text(_["gban_10"])
     else:
         return await mystic.edit_text(msg)
+
+
+asyncio.create_task(fanout.resume_all("gban"))
+asyncio.create_task(fanout.resume_all("ungban"))
@@ -0,0 +1,17 @@
+# Authored By Certified Coders � 2025
+from pyrogram import filters
+from pyrogram.types import Message
+
+from siyamedia import app
+from siyamedia.misc import SUDOERS
+from siyamedia.utils.database import migrate_chat_settings
+
+
+@app.on_message(filters.command("migratesettings") & SUDOERS)
+async def migrate_settings(_, message: Message):
+    mystic = await message.reply_text("Folding legacy chat settings into chat_settings...")
+    try:
+        moved = await migrate_chat_settings(force=True)
+    except Exception as e:
+        return await mystic.edit_text(f"Migration failed: <code>{type(e).__name__}: {e}</code>")
+    await mystic.edit_text(f"Migration finished. Legacy documents merged: <code>{moved}</code>")
@@ -1,10 +1,8 @@
 # Authored By Certified Coders  2025
-import os
 import random
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from PIL import Image, ImageDraw, UnidentifiedImageError
 from pyrogram import errors, filters
 from pyrogram.enums import ChatType
 from pyrogram.types import Message
@@ -12,6 +10,7 @@ from pyrogram.types import Message
 from siyamedia import app
 from siyamedia.core.dir import COUPLE_DIR
 from siyamedia.mongo.couples_db import get_couple, save_couple
+from siyamedia.utils.render import couple_card, renderer
 
 
 ASSETS = Path("siyamedia/assets")
@@ -27,17 +26,6 @@ def tomorrow() -> str:
     return (datetime.now() + timedelta(days=1)).strftime("%d/%m/%Y")
 
 
-def circular(path: str | Path) -> Image.Image:
-    try:
-        img = Image.open(path).convert("RGBA").resize((486, 486))
-    except (FileNotFoundError, UnidentifiedImageError):
-        img = Image.open(FALLBACK).convert("RGBA").resize((486, 486))
-    mask = Image.new("L", img.size, 0)
-    ImageDraw.Draw(mask).ellipse((0, 0) + img.size, fill=255)
-    img.putalpha(mask)
-    return img
-
-
 async def safe_get_user(uid: int):
     try:
         return await app.get_users(uid)
@@ -57,26 +45,19 @@ async def safe_photo(uid: int, name: str) -> Path:
 
 
 async def generate_image(chat_id: int, uid1: int, uid2: int, date: str) -> str:
-    base = Image.open(ASSETS / "annie/couple.png").convert("RGBA")
-    p1 = await safe_photo(uid1, "pfp1.png")
-    p2 = await safe_photo(uid2, "pfp2.png")
-
-    a1 = circular(p1)
-    a2 = circular(p2)
-    base.paste(a1, (410, 500), a1)
-    base.paste(a2, (1395, 500), a2)
+    p1 = await safe_photo(uid1, f"pfp1_{chat_id}.png")
+    p2 = await safe_photo(uid2, f"pfp2_{chat_id}.png")
 
     out_path = OUT_DIR / f"couple_{chat_id}_{date.replace('/','-')}.png"
-    base.save(out_path)
-
-    for pf in (p1, p2):
-        try:
-            if pf != FALLBACK and pf.exists() and pf.parent == OUT_DIR:
-                pf.unlink()
-        except Exception:
-            pass
-
-    return str(out_path)
+    try:
+        return await renderer.submit(couple_card, str(p1), str(p2), str(out_path))
+    finally:
+        for pf in (p1, p2):
+            try:
+                if pf != FALLBACK and pf.exists() and pf.parent == OUT_DIR:
+                    pf.unlink()
+            except Exception:
+                pass
 
 
 @app.on_message(filters.command("couple"))
@@ -118,7 +99,12 @@ async def couples_handler(_, message: Message):
             await wait.edit("**????? ??? ???? ????? ???????.**")
             return
 
-        img_path = await generate_image(cid, uid1, uid2, date)
+        try:
+            img_path = await generate_image(cid, uid1, uid2, date)
+        except Exception:
+            # Render pool busy, timed out or broken: nothing to save today.
+            await wait.edit("**Couldn't draw the couple image right now, try again in a bit.**")
+            return
         await save_couple(cid, date, {"user1": uid1, "user2": uid2}, img_path)
 
     caption = (
@@ -1,10 +1,9 @@
 # Authored By Certified Coders  2025
 import os
-import textwrap
-from PIL import Image, ImageDraw, ImageFont
 from pyrogram import filters
 from pyrogram.types import Message
 from siyamedia import app
+from siyamedia.utils.render import meme, renderer
 
 @app.on_message(filters.command("mmf"))
 async def mmf(_, message: Message):
@@ -23,141 +22,18 @@ async def mmf(_, message: Message):
         await msg.edit(f"? Failed to download media.\nError: {e}")
         return
 
-    meme = await drawText(file, text)
-    await app.send_document(chat_id, document=meme)
+    out = f"memify_{chat_id}_{msg.id}.webp"
+    try:
+        memified = await drawText(file, text, out)
+    except Exception as e:
+        await msg.edit(f"? Failed to memify.\nError: {e}")
+        return
+    await app.send_document(chat_id, document=memified, file_name="memify.webp")
 
     await msg.delete()
 
-    os.remove(meme)
-
-
-async def drawText(image_path, text):
-    img = Image.open(image_path)
-
-    os.remove(image_path)
-
-    i_width, i_height = img.size
-
-    if os.name == "nt":
-        fnt = "arial.ttf"
-    else:
-        fnt = "./siyamedia/assets/default.ttf"
-
-    m_font = ImageFont.truetype(fnt, int((70 / 640) * i_width))
-
-    if ";" in text:
-        upper_text, lower_text = text.split(";")
-    else:
-        upper_text = text
-        lower_text = ""
-
-    draw = ImageDraw.Draw(img)
-
-    current_h, pad = 10, 5
-
-    if upper_text:
-        for u_text in textwrap.wrap(upper_text, width=15):
-            uwl, uht, uwr, uhb = m_font.getbbox(u_text)
-            u_width, u_height = uwr - uwl, uhb - uht
-
-            draw.text(
-                xy=(((i_width - u_width) / 2) - 2, int((current_h / 640) * i_width)),
-                text=u_text,
-                font=m_font,
-                fill=(0, 0, 0),
-            )
-
-            draw.text(
-                xy=(((i_width - u_width) / 2) + 2, int((current_h / 640) * i_width)),
-                text=u_text,
-                font=m_font,
-                fill=(0, 0, 0),
-            )
-
-            draw.text(
-                xy=((i_width - u_width) / 2, int(((current_h / 640) * i_width)) - 2),
-                text=u_text,
-                font=m_font,
-                fill=(0, 0, 0),
-            )
-
-            draw.text(
-                xy=(((i_width - u_width) / 2), int(((current_h / 640) * i_width)) + 2),
-                text=u_text,
-                font=m_font,
-                fill=(0, 0, 0),
-            )
-
-            draw.text(
-                xy=((i_width - u_width) / 2, int((current_h / 640) * i_width)),
-                text=u_text,
-                font=m_font,
-                fill=(255, 255, 255),
-            )
-
-            current_h += u_height + pad
-
-    if lower_text:
-        for l_text in textwrap.wrap(lower_text, width=15):
-            uwl, uht, uwr, uhb = m_font.getbbox(l_text)
-            u_width, u_height = uwr - uwl, uhb - uht
-
-            draw.text(
-                xy=(
-                    ((i_width - u_width) / 2) - 2,
-                    i_height - u_height - int((20 / 640) * i_width),
-                ),
-                text=l_text,
-                font=m_font,
-                fill=(0, 0, 0),
-            )
-
-            draw.text(
-                xy=(
-                    ((i_width - u_width) / 2) + 2,
-                    i_height - u_height - int((20 / 640) * i_width),
-                ),
-                text=l_text,
-                font=m_font,
-                fill=(0, 0, 0),
-            )
-
-            draw.text(
-                xy=(
-                    (i_width - u_width) / 2,
-                    (i_height - u_height - int((20 / 640) * i_width)) - 2,
-                ),
-                text=l_text,
-                font=m_font,
-                fill=(0, 0, 0),
-            )
-
-            draw.text(
-                xy=(
-                    (i_width - u_width) / 2,
-                    (i_height - u_height - int((20 / 640) * i_width)) + 2,
-                ),
-                text=l_text,
-                font=m_font,
-                fill=(0, 0, 0),
-            )
-
-            draw.text(
-                xy=(
-                    (i_width - u_width) / 2,
-                    i_height - u_height - int((20 / 640) * i_width),
-                ),
-                text=l_text,
-                font=m_font,
-                fill=(255, 255, 255),
-            )
-
-            current_h += u_height + pad
-
-    image_name = "memify.webp"
-
-    webp_file = os.path.join(image_name)
+    os.remove(memified)
 
-    img.save(webp_file, "webp")
 
-    return webp_file
+async def drawText(image_path, text, out_path="memify.webp"):
+    return await renderer.submit(meme, image_path, text, out_path)
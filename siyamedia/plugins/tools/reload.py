@@ -3,16 +3,17 @@ import asyncio
 import time
 
 from pyrogram import filters
-from pyrogram.enums import ChatMembersFilter
-from pyrogram.types import Message
+from pyrogram.types import ChatMemberUpdated, Message
 
 from siyamedia import app
 from siyamedia.core.call import StreamController
 from siyamedia.misc import db
-from siyamedia.utils.database import get_assistant, get_authuser_names, get_cmode
+from siyamedia.utils.admincache import admin_cache
+from siyamedia.utils.database import get_assistant, get_cmode
 from siyamedia.utils.decorators import AdminActual, language
-from siyamedia.utils.formatters import alpha_to_int, get_readable_time
-from config import BANNED_USERS, adminlist, lyrical
+from siyamedia.utils.formatters import get_readable_time
+from siyamedia.utils.stream.queue import new_queue
+from config import BANNED_USERS, lyrical
 
 
 
@@ -31,15 +32,8 @@ async def reload_admin_cache(client, message: Message, _):
             left = get_readable_time((int(rel[message.chat.id]) - int(time.time())))
             return await message.reply_text(_["reload_1"].format(left))
 
-        adminlist[message.chat.id] = []
-        async for user in app.get_chat_members(message.chat.id, filter=ChatMembersFilter.ADMINISTRATORS):
-            if user.privileges and user.privileges.can_manage_video_chats:
-                adminlist[message.chat.id].append(user.user.id)
-
-        authusers = await get_authuser_names(message.chat.id)
-        for user in authusers:
-            user_id = await alpha_to_int(user)
-            adminlist[message.chat.id].append(user_id)
+        if not await admin_cache.refresh(message.chat.id):
+            return await message.reply_text(_["reload_3"])
 
         rel[message.chat.id] = int(time.time()) + 180
         await message.reply_text(_["reload_2"])
@@ -47,6 +41,12 @@ async def reload_admin_cache(client, message: Message, _):
         await message.reply_text(_["reload_3"])
 
 
+# -- keep the admin cache in step with promotions/demotions --
+@app.on_chat_member_updated(filters.group, group=-4)
+async def track_admin_changes(client, update: ChatMemberUpdated):
+    admin_cache.on_member_updated(update)
+
+
 # -- /reboot --
 @app.on_message(filters.command("reboot") & filters.group & ~BANNED_USERS)
 @AdminActual
@@ -55,7 +55,7 @@ async def restart_bot(client, message: Message, _):
     await asyncio.sleep(1)
 
     try:
-        db[message.chat.id] = []
+        db[message.chat.id] = new_queue()
         await StreamController.force_stop_stream(message.chat.id)
     except:
         pass
@@ -72,7 +72,7 @@ async def restart_bot(client, message: Message, _):
             got = await app.get_chat(chat_id)
             userbot = await get_assistant(chat_id)
             await userbot.resolve_peer(got.username or chat_id)
-            db[chat_id] = []
+            db[chat_id] = new_queue()
             await StreamController.force_stop_stream(chat_id)
         except:
             pass
@@ -14,7 +14,7 @@ from siyamedia import app
 from siyamedia.core.userbot import assistants
 from siyamedia.misc import SUDOERS, mongodb
 from siyamedia.plugins import ALL_MODULES
-from siyamedia.utils.database import get_served_chats, get_served_users, get_sudoers
+from siyamedia.utils.database import get_sudoers, served_chats_count, served_users_count
 from siyamedia.utils.decorators.language import language, languageCB
 from siyamedia.utils.inline.stats import (
     build_stats_keyboard,
@@ -62,8 +62,8 @@ async def handle_show_overview(client, callback_query, _):
     await callback_query.answer()
     back_keyboard = build_back_keyboard(_)
     await callback_query.edit_message_text(_["gstats_1"].format(app.mention))
-    served_chats = len(await get_served_chats())
-    served_users = len(await get_served_users())
+    served_chats = await served_chats_count()
+    served_users = await served_users_count()
     caption = _["gstats_3"].format(
         app.mention,
         len(assistants),
@@ -109,8 +109,8 @@ async def handle_show_bot_stats(client, callback_query, _):
     storage_kb = db_stats["storageSize"] / 1024
     collections = db_stats["collections"]
     objects = db_stats["objects"]
-    served_chats = len(await get_served_chats())
-    served_users = len(await get_served_users())
+    served_chats = await served_chats_count()
+    served_users = await served_users_count()
     caption = _["gstats_5"].format(
         app.mention,
         len(ALL_MODULES),
@@ -1,6 +1,8 @@
 # Authored By Certified Coders  2025
 from pyrogram.types import CallbackQuery
-from pyrogram.enums import ChatType, ChatMemberStatus
+from pyrogram.enums import ChatType
+
+from siyamedia.utils.admincache import admin_cache
 
 async def is_admin(message_or_cq) -> bool:
     if isinstance(message_or_cq, CallbackQuery):
@@ -17,9 +19,7 @@ async def is_admin(message_or_cq) -> bool:
     if message.from_user.id in [777000, 1087968824]:
         return True
 
-    client = message._client
-    member = await client.get_chat_member(message.chat.id, message.from_user.id)
-    return member.status in [ChatMemberStatus.OWNER, ChatMemberStatus.ADMINISTRATOR]
+    return await admin_cache.is_admin(message.chat.id, message.from_user.id)
 
 async def is_group_owner(message_or_cq) -> bool:
     if isinstance(message_or_cq, CallbackQuery):
@@ -36,6 +36,5 @@ async def is_group_owner(message_or_cq) -> bool:
     if message.from_user.id in [777000, 1087968824]:
         return True
 
-    client = message._client
-    member = await client.get_chat_member(message.chat.id, message.from_user.id)
-    return member.status == ChatMemberStatus.OWNER
+    admins = await admin_cache.get(message.chat.id)
+    return bool(admins and admins.is_owner(message.from_user.id))
@@ -0,0 +1,127 @@
+# Authored By Certified Coders � 2025
+import asyncio
+from typing import Dict, Optional, Set
+
+from pyrogram.enums import ChatMemberStatus, ChatMembersFilter
+from pyrogram.types import ChatMemberUpdated, ChatPrivileges
+
+from siyamedia import app
+from siyamedia.logging import LOGGER
+from siyamedia.utils.cache import TTLCache
+from siyamedia.utils.database import get_authuser_names
+from siyamedia.utils.formatters import alpha_to_int
+from siyamedia.utils.tuning import ADMIN_CACHE_MAX, ADMIN_CACHE_TTL
+
+LOGGER = LOGGER(__name__)
+
+# Stands in for the owner's privileges: the owner holds every right.
+OWNER = object()
+
+
+class ChatAdmins:
+    """Administrators (with their privileges) and auth users of one chat."""
+
+    __slots__ = ("admins", "auth")
+
+    def __init__(self) -> None:
+        self.admins: Dict[int, object] = {}
+        self.auth: Set[int] = set()
+
+    def set_member(self, user_id: int, status: ChatMemberStatus, privileges: Optional[ChatPrivileges]) -> None:
+        if status == ChatMemberStatus.OWNER:
+            self.admins[user_id] = OWNER
+        elif status == ChatMemberStatus.ADMINISTRATOR:
+            self.admins[user_id] = privileges or ChatPrivileges()
+        else:
+            self.admins.pop(user_id, None)
+
+    def is_owner(self, user_id: int) -> bool:
+        return self.admins.get(user_id) is OWNER
+
+    def is_admin(self, user_id: int, right: Optional[str] = None) -> bool:
+        privileges = self.admins.get(user_id)
+        if privileges is None:
+            return False
+        if privileges is OWNER or right is None:
+            return True
+        return bool(getattr(privileges, right, False))
+
+    def can_manage(self, user_id: int) -> bool:
+        """Voice-chat admins and the chat's auth users may control playback."""
+        return user_id in self.auth or self.is_admin(user_id, "can_manage_video_chats")
+
+
+class AdminCache:
+    """
+    Per-chat admin lists, fetched on first use and kept current from
+    chat-member updates. Entries expire after ``ttl`` seconds as a fallback
+    for updates the bot never receives, and concurrent misses for the same
+    chat share one fetch.
+    """
+
+    def __init__(self, maxsize: int = ADMIN_CACHE_MAX, ttl: float = ADMIN_CACHE_TTL) -> None:
+        self._chats: TTLCache[ChatAdmins] = TTLCache(maxsize, ttl)
+        self._inflight: Dict[int, asyncio.Future] = {}
+
+    async def _fetch(self, chat_id: int) -> ChatAdmins:
+        entry = ChatAdmins()
+        async for member in app.get_chat_members(chat_id, filter=ChatMembersFilter.ADMINISTRATORS):
+            entry.set_member(member.user.id, member.status, member.privileges)
+        for token in await get_authuser_names(chat_id):
+            entry.auth.add(await alpha_to_int(token))
+        return entry
+
+    async def get(self, chat_id: int) -> Optional[ChatAdmins]:
+        """The chat's admins, or None when they cannot be fetched (e.g. the bot is not an admin)."""
+        entry = self._chats.get(chat_id)
+        if entry is not None:
+            return entry
+        if fut := self._inflight.get(chat_id):
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[chat_id] = fut
+        try:
+            entry = await self._fetch(chat_id)
+            self._chats.set(chat_id, entry)
+        except Exception as e:
+            LOGGER.warning(f"Could not fetch admins of {chat_id}: {e}")
+        finally:
+            fut.set_result(entry)
+            self._inflight.pop(chat_id, None)
+        return entry
+
+    async def is_admin(self, chat_id: int, user_id: int, right: Optional[str] = None) -> bool:
+        entry = await self.get(chat_id)
+        return bool(entry and entry.is_admin(user_id, right))
+
+    async def can_manage(self, chat_id: int, user_id: int) -> bool:
+        entry = await self.get(chat_id)
+        return bool(entry and entry.can_manage(user_id))
+
+    async def refresh(self, chat_id: int) -> Optional[ChatAdmins]:
+        self._chats.pop(chat_id)
+        return await self.get(chat_id)
+
+    def invalidate(self, chat_id: int) -> None:
+        self._chats.pop(chat_id)
+
+    def on_member_updated(self, update: ChatMemberUpdated) -> None:
+        entry = self._chats.get(update.chat.id)
+        if entry is None:
+            return
+        member = update.new_chat_member or update.old_chat_member
+        if member and member.user:
+            status = update.new_chat_member.status if update.new_chat_member else ChatMemberStatus.LEFT
+            entry.set_member(member.user.id, status, member.privileges)
+
+    def add_auth(self, chat_id: int, user_id: int) -> None:
+        if entry := self._chats.get(chat_id):
+            entry.auth.add(user_id)
+
+    def remove_auth(self, chat_id: int, user_id: int) -> None:
+        if entry := self._chats.get(chat_id):
+            entry.auth.discard(user_id)
+
+
+admin_cache = AdminCache()
@@ -0,0 +1,158 @@
+# Authored By Certified Coders � 2025
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+from pyrogram.enums import ChatMemberStatus
+from pyrogram.errors import FloodWait
+
+from siyamedia import app
+from siyamedia.logging import LOGGER
+from siyamedia.utils.database import (
+    assistantdict,
+    get_chat_settings,
+    get_client,
+    set_assistant_new,
+)
+from siyamedia.utils.tuning import (
+    ASSISTANT_ERROR_LIMIT,
+    ASSISTANT_ERROR_WINDOW,
+    ASSISTANT_REBALANCE_SLACK,
+    VIDEO_CALL_WEIGHT,
+)
+
+LOGGER = LOGGER(__name__)
+
+IN_CHAT = (ChatMemberStatus.MEMBER, ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER)
+
+
+@dataclass(slots=True)
+class AssistantLoad:
+    calls: int = 0
+    load: float = 0.0  # audio calls count 1, video calls VIDEO_CALL_WEIGHT (ffmpeg cost)
+    errors: Deque[float] = field(default_factory=deque)
+    flood_until: float = 0.0
+
+
+class AssistantPool:
+    """
+    Chat-to-assistant allocation driven by live load and health.
+
+    Each started assistant carries the weighted count of voice chats it is
+    streaming in, plus its recent call errors and FloodWait cooldown. Chats
+    without an assistant (or whose assistant is gone or unhealthy when they
+    start playing) are given the least-loaded healthy one; chats already
+    streaming on an assistant that turns unhealthy are moved at the next
+    track boundary when another healthy assistant is already in the chat.
+    """
+
+    def __init__(self) -> None:
+        self.stats: Dict[int, AssistantLoad] = {}
+        self._live: Dict[int, Tuple[int, float]] = {}
+
+    @staticmethod
+    def started() -> List[int]:
+        from siyamedia.core.userbot import assistants
+
+        return assistants
+
+    def _stat(self, index: int) -> AssistantLoad:
+        stat = self.stats.get(index)
+        if stat is None:
+            stat = self.stats[index] = AssistantLoad()
+        return stat
+
+    def healthy(self, index: int) -> bool:
+        stat = self._stat(index)
+        now = time.monotonic()
+        while stat.errors and stat.errors[0] < now - ASSISTANT_ERROR_WINDOW:
+            stat.errors.popleft()
+        return now >= stat.flood_until and len(stat.errors) < ASSISTANT_ERROR_LIMIT
+
+    def ranked(self, exclude: Optional[int] = None) -> List[int]:
+        """Started assistants, healthy ones first, each group by ascending load."""
+        return sorted(
+            (index for index in self.started() if index != exclude),
+            key=lambda index: (not self.healthy(index), self._stat(index).load, index),
+        )
+
+    def _overloaded(self, index: int) -> bool:
+        if not self.healthy(index):
+            return True
+        best = self.ranked()[0]
+        return self._stat(index).load - self._stat(best).load > ASSISTANT_REBALANCE_SLACK
+
+    async def _set(self, chat_id: int, index: int) -> int:
+        assistantdict[chat_id] = index
+        await set_assistant_new(chat_id, index)
+        return index
+
+    async def assign(self, chat_id: int, rebalance: bool = False) -> int:
+        """
+        Return the assistant number serving ``chat_id``, allocating one when
+        needed. With ``rebalance`` (a chat about to start playing) an
+        unhealthy or clearly overloaded assistant is swapped for a better one.
+        """
+        index = assistantdict.get(chat_id)
+        if index is None:
+            index = (await get_chat_settings(chat_id)).assistant
+        if index in self.started() and not (rebalance and chat_id not in self._live and self._overloaded(index)):
+            assistantdict[chat_id] = index
+            return index
+        return await self._set(chat_id, self.ranked()[0])
+
+    def track(self, chat_id: int, video: bool) -> None:
+        self.release(chat_id)
+        index = assistantdict.get(chat_id)
+        if index is None:
+            return
+        weight = VIDEO_CALL_WEIGHT if video else 1
+        self._live[chat_id] = (index, weight)
+        stat = self._stat(index)
+        stat.calls += 1
+        stat.load += weight
+
+    def release(self, chat_id: int) -> None:
+        index, weight = self._live.pop(chat_id, (None, 0))
+        if index is None:
+            return
+        stat = self._stat(index)
+        stat.calls -= 1
+        stat.load -= weight
+
+    def report(self, chat_id: int, error: Exception) -> None:
+        """Record a call failure (or FloodWait) against the chat's assistant."""
+        index = assistantdict.get(chat_id)
+        if index is None:
+            return
+        stat = self._stat(index)
+        if isinstance(error, FloodWait):
+            stat.flood_until = max(stat.flood_until, time.monotonic() + error.value)
+        else:
+            stat.errors.append(time.monotonic())
+
+    async def drain(self, chat_id: int) -> Optional[int]:
+        """
+        Called at a track boundary. If the chat's assistant is unhealthy and a
+        healthy assistant is already a member of the chat, reassign the chat
+        to it and return its number; otherwise return None.
+        """
+        index = assistantdict.get(chat_id)
+        if index is None or self.healthy(index):
+            return None
+        for target in self.ranked(exclude=index):
+            if not self.healthy(target):
+                break
+            client = await get_client(target)
+            try:
+                member = await app.get_chat_member(chat_id, client.id)
+            except Exception:
+                continue
+            if member.status in IN_CHAT:
+                LOGGER.info(f"Moving {chat_id} from assistant {index} to {target}")
+                return await self._set(chat_id, target)
+        return None
+
+
+assistant_pool = AssistantPool()
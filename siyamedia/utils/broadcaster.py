@@ -0,0 +1,263 @@
+# Authored By Certified Coders � 2025
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
+
+from pyrogram.errors import (
+    ChannelInvalid,
+    ChannelPrivate,
+    ChatWriteForbidden,
+    InputUserDeactivated,
+    PeerIdInvalid,
+    UserIsBlocked,
+)
+
+from siyamedia import app
+from siyamedia.core.mongo import mongodb
+from siyamedia.logging import LOGGER
+from siyamedia.utils.database import (
+    iter_served_chats,
+    iter_served_users,
+    remove_served_chat,
+    remove_served_user,
+    served_chats_count,
+    served_users_count,
+)
+from siyamedia.utils.sender import Priority, sender
+from siyamedia.utils.tuning import (
+    BROADCAST_BATCH,
+    BROADCAST_PROGRESS_INTERVAL,
+    BROADCAST_WORKERS,
+)
+from strings import get_string
+
+LOGGER = LOGGER(__name__)
+
+RUNNING, PAUSED, CANCELLED, DONE = "running", "paused", "cancelled", "done"
+
+# Recipients that can never be reached again are dropped from the served lists.
+PRUNE_ERRORS = (
+    ChatWriteForbidden,
+    PeerIdInvalid,
+    ChannelInvalid,
+    ChannelPrivate,
+    UserIsBlocked,
+    InputUserDeactivated,
+)
+
+
+@dataclass(slots=True)
+class BroadcastJob:
+    id: str
+    target: str  # "chats" or "users"
+    from_chat: Optional[int] = None
+    message_id: Optional[int] = None
+    text: Optional[str] = None
+    pin: Optional[str] = None  # None, "quiet" or "loud"
+    state: str = RUNNING
+    cursor: Any = None  # _id of the last recipient whose batch completed
+    total: int = 0
+    sent: int = 0
+    failed: int = 0
+    pruned: int = 0
+    pinned: int = 0
+    lang: str = "en"
+    status_chat: Optional[int] = None
+    status_msg: Optional[int] = None
+    started: float = field(default_factory=time.time)
+
+    @property
+    def processed(self) -> int:
+        return self.sent + self.failed + self.pruned
+
+    def to_doc(self) -> dict:
+        doc = {f.name: getattr(self, f.name) for f in fields(self)}
+        doc["_id"] = doc.pop("id")
+        return doc
+
+    @classmethod
+    def from_doc(cls, doc: dict) -> "BroadcastJob":
+        names = {f.name for f in fields(cls)}
+        return cls(id=doc["_id"], **{k: v for k, v in doc.items() if k in names and k != "id"})
+
+
+class Broadcaster:
+    """
+    Runs broadcast jobs over the served chats/users collections.
+
+    Recipients are read in ``_id`` order one batch at a time, delivered by a
+    bounded set of workers through the send scheduler, and the job's cursor
+    is checkpointed to Mongo after every batch so an interrupted job picks
+    up where it stopped. Pause and cancel take effect at batch boundaries.
+    """
+
+    def __init__(self) -> None:
+        self._coll = mongodb.broadcast_jobs
+        self.jobs: Dict[str, BroadcastJob] = {}
+        self._gates: Dict[str, asyncio.Event] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def get(self, job_id: Optional[str] = None) -> Optional[BroadcastJob]:
+        if job_id:
+            return self.jobs.get(job_id)
+        active = [job for job in self.jobs.values() if job.state in (RUNNING, PAUSED)]
+        return max(active, key=lambda job: job.started) if active else None
+
+    def active(self) -> List[BroadcastJob]:
+        return [job for job in self.jobs.values() if job.state in (RUNNING, PAUSED)]
+
+    async def start(self, job: BroadcastJob) -> BroadcastJob:
+        if job.target == "chats":
+            job.total = await served_chats_count()
+        else:
+            job.total = await served_users_count()
+        await self._save(job)
+        self._spawn(job)
+        return job
+
+    @staticmethod
+    def new_id() -> str:
+        return uuid.uuid4().hex[:8]
+
+    async def pause(self, job: BroadcastJob) -> bool:
+        if job.state != RUNNING:
+            return False
+        job.state = PAUSED
+        self._gates[job.id].clear()
+        await self._save(job)
+        return True
+
+    async def resume(self, job: BroadcastJob) -> bool:
+        if job.state != PAUSED:
+            return False
+        job.state = RUNNING
+        await self._save(job)
+        if job.id in self._tasks:
+            self._gates[job.id].set()
+        else:
+            self._spawn(job)
+        return True
+
+    async def cancel(self, job: BroadcastJob) -> bool:
+        if job.state not in (RUNNING, PAUSED):
+            return False
+        job.state = CANCELLED
+        self._gates[job.id].set()
+        await self._save(job)
+        return True
+
+    async def resume_all(self) -> None:
+        """Reload unfinished jobs after a restart; paused jobs stay paused."""
+        async for doc in self._coll.find({"state": {"$in": [RUNNING, PAUSED]}}):
+            job = BroadcastJob.from_doc(doc)
+            if job.id not in self.jobs:
+                LOGGER.info(f"Resuming broadcast {job.id} at {job.processed}/{job.total}")
+                self._spawn(job)
+
+    def _spawn(self, job: BroadcastJob) -> None:
+        self.jobs[job.id] = job
+        gate = self._gates[job.id] = asyncio.Event()
+        if job.state == RUNNING:
+            gate.set()
+        self._tasks[job.id] = asyncio.create_task(self._run(job))
+
+    async def _save(self, job: BroadcastJob) -> None:
+        await self._coll.replace_one({"_id": job.id}, job.to_doc(), upsert=True)
+
+    async def _run(self, job: BroadcastJob) -> None:
+        source = iter_served_chats if job.target == "chats" else iter_served_users
+        key = "chat_id" if job.target == "chats" else "user_id"
+        gate = self._gates[job.id]
+        workers = asyncio.Semaphore(BROADCAST_WORKERS)
+        progress = asyncio.create_task(self._report(job))
+
+        async def deliver(recipient: int) -> None:
+            async with workers:
+                await self._deliver(job, recipient)
+
+        try:
+            while True:
+                await gate.wait()
+                if job.state == CANCELLED:
+                    break
+                batch = [doc async for doc in source(job.cursor, BROADCAST_BATCH)]
+                if not batch:
+                    job.state = DONE
+                    break
+                await asyncio.gather(*(deliver(int(doc[key])) for doc in batch))
+                job.cursor = batch[-1]["_id"]
+                await self._save(job)
+        except Exception as e:
+            LOGGER.warning(f"Broadcast {job.id} paused after an error: {e}")
+            job.state = PAUSED
+        finally:
+            progress.cancel()
+            self._tasks.pop(job.id, None)
+            if job.state in (DONE, CANCELLED):
+                self.jobs.pop(job.id, None)
+                self._gates.pop(job.id, None)
+            await self._save(job)
+            await self._edit_status(job)
+
+    async def _deliver(self, job: BroadcastJob, recipient: int) -> None:
+        try:
+            if job.message_id:
+                m = await sender.call(
+                    app, "forward_messages", recipient, job.from_chat, job.message_id,
+                    priority=Priority.BULK,
+                )
+            else:
+                m = await sender.call(app, "send_message", recipient, text=job.text, priority=Priority.BULK)
+        except PRUNE_ERRORS:
+            job.pruned += 1
+            if job.target == "chats":
+                await remove_served_chat(recipient)
+            else:
+                await remove_served_user(recipient)
+            return
+        except Exception:
+            job.failed += 1
+            return
+        job.sent += 1
+        if job.pin:
+            try:
+                await sender.call(
+                    app, "pin_chat_message", recipient, m.id,
+                    disable_notification=job.pin != "loud", priority=Priority.BULK,
+                )
+                job.pinned += 1
+            except Exception:
+                pass
+
+    async def _report(self, job: BroadcastJob) -> None:
+        last = None
+        while True:
+            await asyncio.sleep(BROADCAST_PROGRESS_INTERVAL)
+            snapshot = (job.state, job.processed, job.pinned)
+            if snapshot != last:
+                last = snapshot
+                await self._edit_status(job)
+
+    def status_text(self, job: BroadcastJob) -> str:
+        _ = get_string(job.lang)
+        if job.state == DONE:
+            if job.target == "chats":
+                return _["broad_3"].format(job.sent, job.pinned)
+            return _["broad_4"].format(job.sent)
+        return _["broad_9"].format(
+            job.id, job.target, job.state, job.processed, job.total,
+            job.sent, job.failed, job.pruned, job.pinned,
+        )
+
+    async def _edit_status(self, job: BroadcastJob) -> None:
+        if not job.status_msg:
+            return
+        try:
+            await app.edit_message_text(job.status_chat, job.status_msg, self.status_text(job))
+        except Exception:
+            pass
+
+
+broadcaster = Broadcaster()
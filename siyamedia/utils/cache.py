@@ -0,0 +1,68 @@
+# Authored By Certified Coders � 2025
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Iterator, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """
+    Small in-process LRU cache with a per-entry time-to-live.
+
+    Entries are stamped with a monotonic expiry on insert. Reading an entry
+    refreshes its LRU position but not its expiry, and expired entries are
+    dropped lazily on access. Once ``maxsize`` is reached the least recently
+    used entry is evicted.
+    """
+
+    __slots__ = ("maxsize", "ttl", "_data")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._data))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires, value = item
+        if expires < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def purge(self) -> int:
+        """Drop every expired entry and return how many were removed."""
+        now = time.monotonic()
+        stale = [k for k, (expires, _) in self._data.items() if expires < now]
+        for key in stale:
+            del self._data[key]
+        return len(stale)
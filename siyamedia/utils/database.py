@@ -1,9 +1,16 @@
 # Authored By Certified Coders � 2025
-import random
-from typing import Dict, List, Union
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Union
 
+from pymongo import UpdateOne
+
+from config import SERVED_USERS_BLOOM
 from siyamedia import userbot
 from siyamedia.core.mongo import mongodb
+from siyamedia.utils.cache import TTLCache
+from siyamedia.utils.membership import MembershipIndex, MembershipSet
+from siyamedia.utils.tuning import SETTINGS_MAX, SETTINGS_TTL, SETTINGS_WARM
 
 authdb = mongodb.adminauth
 authuserdb = mongodb.authuser
@@ -16,9 +23,11 @@ channeldb = mongodb.cplaymode
 countdb = mongodb.upcount
 gbansdb = mongodb.gban
 langdb = mongodb.language
+migrationsdb = mongodb.migrations
 onoffdb = mongodb.onoffper
 playmodedb = mongodb.playmode
 playtypedb = mongodb.playtypedb
+settingsdb = mongodb.chat_settings
 skipdb = mongodb.skipmode
 sudoersdb = mongodb.sudoers
 usersdb = mongodb.tgusersdb
@@ -29,173 +38,190 @@ active = []
 activevideo = []
 assistantdict = {}
 autoend = {}
-count = {}
-channelconnect = {}
-langm = {}
 loop = {}
 maintenance = []
-nonadmin = {}
 pause = {}
-playmode = {}
-playtype = {}
-skipmode = {}
 mute = {}
 
-async def get_assistant_number(chat_id: int) -> str:
-    assistant = assistantdict.get(chat_id)
-    return assistant
+served_user_ids = MembershipSet(
+    usersdb, "user_id", {"user_id": {"$gt": 0}}, bloom_rate=SERVED_USERS_BLOOM
+)
+served_chat_ids = MembershipSet(chatsdb, "chat_id", {"chat_id": {"$lt": 0}})
+blacklisted_chat_ids = MembershipSet(blacklist_chatdb, "chat_id", {"chat_id": {"$lt": 0}})
+gbanned_ids = MembershipSet(gbansdb, "user_id", {"user_id": {"$gt": 0}})
+banned_ids = MembershipSet(blockeddb, "user_id", {"user_id": {"$gt": 0}})
+membership = MembershipIndex(
+    served_user_ids, served_chat_ids, blacklisted_chat_ids, gbanned_ids, banned_ids
+)
+
+
+@dataclass(slots=True)
+class ChatSettings:
+    lang: str = "en"
+    playmode: str = "Direct"
+    playtype: str = "Everyone"
+    cmode: Optional[int] = None
+    skipmode: bool = True
+    nonadmin: bool = False
+    upvotes: int = 5
+    assistant: Optional[int] = None
+
+
+_SETTINGS_FIELDS = tuple(f.name for f in fields(ChatSettings))
+_SETTINGS_PROJECTION = {"_id": 0, "chat_id": 1, **dict.fromkeys(_SETTINGS_FIELDS, 1)}
+
+# (legacy collection, chat_settings field, value key, value when the key is None).
+# skipmode/adminauth were flag collections: a document's presence was the value.
+_LEGACY_SETTINGS = (
+    (langdb, "lang", "lang", None),
+    (playmodedb, "playmode", "mode", None),
+    (playtypedb, "playtype", "mode", None),
+    (channeldb, "cmode", "mode", None),
+    (countdb, "upvotes", "mode", None),
+    (skipdb, "skipmode", None, False),
+    (authdb, "nonadmin", None, True),
+    (assdb, "assistant", "assistant", None),
+    (authuserdb, "authusers", "notes", None),
+)
+
+_settings: TTLCache[ChatSettings] = TTLCache(SETTINGS_MAX, SETTINGS_TTL)
+
+
+def _settings_from_doc(doc: Optional[dict]) -> ChatSettings:
+    if not doc:
+        return ChatSettings()
+    return ChatSettings(**{k: doc[k] for k in _SETTINGS_FIELDS if k in doc})
+
+
+async def get_chat_settings(chat_id: int) -> ChatSettings:
+    settings = _settings.get(chat_id)
+    if settings is None:
+        doc = await settingsdb.find_one({"chat_id": chat_id}, _SETTINGS_PROJECTION)
+        settings = _settings_from_doc(doc)
+        _settings.set(chat_id, settings)
+    return settings
+
+
+def _update_settings(chat_id: int, **changes) -> None:
+    settings = _settings.get(chat_id)
+    if settings is None:
+        return
+    for field, value in changes.items():
+        setattr(settings, field, value)
 
 
-async def get_client(assistant: int):
-    if int(assistant) == 1:
-        return userbot.one
-    elif int(assistant) == 2:
-        return userbot.two
-    elif int(assistant) == 3:
-        return userbot.three
-    elif int(assistant) == 4:
-        return userbot.four
-    elif int(assistant) == 5:
-        return userbot.five
+async def _save_settings(chat_id: int, **changes) -> None:
+    _update_settings(chat_id, **changes)
+    await settingsdb.update_one({"chat_id": chat_id}, {"$set": changes}, upsert=True)
 
 
-async def set_assistant_new(chat_id, number):
-    number = int(number)
-    await assdb.update_one(
-        {"chat_id": chat_id},
-        {"$set": {"assistant": number}},
+async def warm_chat_settings(chat_ids: Optional[List[int]] = None) -> int:
+    if chat_ids is None:
+        cursor = (
+            chatsdb.find({"chat_id": {"$lt": 0}}, {"chat_id": 1})
+            .sort("_id", -1)
+            .limit(SETTINGS_WARM)
+        )
+        chat_ids = [chat["chat_id"] async for chat in cursor]
+    for start in range(0, len(chat_ids), 1000):
+        batch = chat_ids[start : start + 1000]
+        loaded = {
+            doc["chat_id"]: doc
+            async for doc in settingsdb.find({"chat_id": {"$in": batch}}, _SETTINGS_PROJECTION)
+        }
+        for chat_id in batch:
+            _settings.set(chat_id, _settings_from_doc(loaded.get(chat_id)))
+    return len(chat_ids)
+
+
+async def migrate_chat_settings(force: bool = False) -> int:
+    """
+    Fold the legacy per-chat collections into ``chat_settings``.
+
+    Values already present in ``chat_settings`` win over legacy ones, so the
+    migration is safe to re-run. Returns the number of legacy documents read.
+    """
+    if not force and await migrationsdb.find_one({"_id": "chat_settings"}):
+        return 0
+    moved = 0
+    for coll, field, key, flag in _LEGACY_SETTINGS:
+        ops = []
+        async for doc in coll.find({"chat_id": {"$exists": True}}, {"_id": 0}):
+            value = flag if key is None else doc.get(key)
+            if value is None:
+                continue
+            ops.append(
+                UpdateOne(
+                    {"chat_id": doc["chat_id"]},
+                    [{"$set": {field: {"$ifNull": [f"${field}", {"$literal": value}]}}}],
+                    upsert=True,
+                )
+            )
+            if len(ops) >= 1000:
+                await settingsdb.bulk_write(ops, ordered=False)
+                moved += len(ops)
+                ops = []
+        if ops:
+            await settingsdb.bulk_write(ops, ordered=False)
+            moved += len(ops)
+    await migrationsdb.update_one(
+        {"_id": "chat_settings"},
+        {"$set": {"done_at": datetime.now(timezone.utc), "moved": moved}},
         upsert=True,
     )
+    _settings.clear()
+    return moved
 
 
-async def set_assistant(chat_id):
-    from siyamedia.core.userbot import assistants
+async def ensure_chat_settings() -> int:
+    await settingsdb.create_index("chat_id", unique=True)
+    return await migrate_chat_settings()
 
-    ran_assistant = random.choice(assistants)
-    assistantdict[chat_id] = ran_assistant
-    await assdb.update_one(
-        {"chat_id": chat_id},
-        {"$set": {"assistant": ran_assistant}},
-        upsert=True,
-    )
-    userbot = await get_client(ran_assistant)
-    return userbot
 
+async def get_assistant_number(chat_id: int) -> str:
+    assistant = assistantdict.get(chat_id)
+    return assistant
 
-async def get_assistant(chat_id: int) -> str:
-    from siyamedia.core.userbot import assistants
 
-    assistant = assistantdict.get(chat_id)
-    if not assistant:
-        dbassistant = await assdb.find_one({"chat_id": chat_id})
-        if not dbassistant:
-            userbot = await set_assistant(chat_id)
-            return userbot
-        else:
-            got_assis = dbassistant["assistant"]
-            if got_assis in assistants:
-                assistantdict[chat_id] = got_assis
-                userbot = await get_client(got_assis)
-                return userbot
-            else:
-                userbot = await set_assistant(chat_id)
-                return userbot
-    else:
-        if assistant in assistants:
-            userbot = await get_client(assistant)
-            return userbot
-        else:
-            userbot = await set_assistant(chat_id)
-            return userbot
+async def get_client(assistant: int):
+    return userbot.clients.get(int(assistant))
 
 
-async def set_calls_assistant(chat_id):
-    from siyamedia.core.userbot import assistants
+async def set_assistant_new(chat_id, number):
+    number = int(number)
+    await _save_settings(chat_id, assistant=number)
 
-    ran_assistant = random.choice(assistants)
-    assistantdict[chat_id] = ran_assistant
-    await assdb.update_one(
-        {"chat_id": chat_id},
-        {"$set": {"assistant": ran_assistant}},
-        upsert=True,
-    )
-    return ran_assistant
 
+async def get_assistant(chat_id: int, rebalance: bool = False):
+    from siyamedia.utils.assistantpool import assistant_pool
 
-async def group_assistant(self, chat_id: int) -> int:
-    from siyamedia.core.userbot import assistants
+    return await get_client(await assistant_pool.assign(chat_id, rebalance=rebalance))
 
-    assistant = assistantdict.get(chat_id)
-    if not assistant:
-        dbassistant = await assdb.find_one({"chat_id": chat_id})
-        if not dbassistant:
-            assis = await set_calls_assistant(chat_id)
-        else:
-            assis = dbassistant["assistant"]
-            if assis in assistants:
-                assistantdict[chat_id] = assis
-                assis = assis
-            else:
-                assis = await set_calls_assistant(chat_id)
-    else:
-        if assistant in assistants:
-            assis = assistant
-        else:
-            assis = await set_calls_assistant(chat_id)
-    if int(assis) == 1:
-        return self.one
-    elif int(assis) == 2:
-        return self.two
-    elif int(assis) == 3:
-        return self.three
-    elif int(assis) == 4:
-        return self.four
-    elif int(assis) == 5:
-        return self.five
+
+async def group_assistant(self, chat_id: int):
+    from siyamedia.utils.assistantpool import assistant_pool
+
+    return self.calls[await assistant_pool.assign(chat_id)]
 
 
 async def is_skipmode(chat_id: int) -> bool:
-    mode = skipmode.get(chat_id)
-    if not mode:
-        user = await skipdb.find_one({"chat_id": chat_id})
-        if not user:
-            skipmode[chat_id] = True
-            return True
-        skipmode[chat_id] = False
-        return False
-    return mode
+    return (await get_chat_settings(chat_id)).skipmode
 
 
 async def skip_on(chat_id: int):
-    skipmode[chat_id] = True
-    user = await skipdb.find_one({"chat_id": chat_id})
-    if user:
-        return await skipdb.delete_one({"chat_id": chat_id})
+    await _save_settings(chat_id, skipmode=True)
 
 
 async def skip_off(chat_id: int):
-    skipmode[chat_id] = False
-    user = await skipdb.find_one({"chat_id": chat_id})
-    if not user:
-        return await skipdb.insert_one({"chat_id": chat_id})
+    await _save_settings(chat_id, skipmode=False)
 
 
 async def get_upvote_count(chat_id: int) -> int:
-    mode = count.get(chat_id)
-    if not mode:
-        mode = await countdb.find_one({"chat_id": chat_id})
-        if not mode:
-            return 5
-        count[chat_id] = mode["mode"]
-        return mode["mode"]
-    return mode
+    return (await get_chat_settings(chat_id)).upvotes
 
 
 async def set_upvotes(chat_id: int, mode: int):
-    count[chat_id] = mode
-    await countdb.update_one(
-        {"chat_id": chat_id}, {"$set": {"mode": mode}}, upsert=True
-    )
+    await _save_settings(chat_id, upvotes=mode)
 
 
 async def is_autoend() -> bool:
@@ -228,76 +254,35 @@ async def set_loop(chat_id: int, mode: int):
 
 
 async def get_cmode(chat_id: int) -> int:
-    mode = channelconnect.get(chat_id)
-    if not mode:
-        mode = await channeldb.find_one({"chat_id": chat_id})
-        if not mode:
-            return None
-        channelconnect[chat_id] = mode["mode"]
-        return mode["mode"]
-    return mode
+    return (await get_chat_settings(chat_id)).cmode
 
 
 async def set_cmode(chat_id: int, mode: int):
-    channelconnect[chat_id] = mode
-    await channeldb.update_one(
-        {"chat_id": chat_id}, {"$set": {"mode": mode}}, upsert=True
-    )
+    await _save_settings(chat_id, cmode=mode)
 
 
 async def get_playtype(chat_id: int) -> str:
-    mode = playtype.get(chat_id)
-    if not mode:
-        mode = await playtypedb.find_one({"chat_id": chat_id})
-        if not mode:
-            playtype[chat_id] = "Everyone"
-            return "Everyone"
-        playtype[chat_id] = mode["mode"]
-        return mode["mode"]
-    return mode
+    return (await get_chat_settings(chat_id)).playtype
 
 
 async def set_playtype(chat_id: int, mode: str):
-    playtype[chat_id] = mode
-    await playtypedb.update_one(
-        {"chat_id": chat_id}, {"$set": {"mode": mode}}, upsert=True
-    )
+    await _save_settings(chat_id, playtype=mode)
 
 
 async def get_playmode(chat_id: int) -> str:
-    mode = playmode.get(chat_id)
-    if not mode:
-        mode = await playmodedb.find_one({"chat_id": chat_id})
-        if not mode:
-            playmode[chat_id] = "Direct"
-            return "Direct"
-        playmode[chat_id] = mode["mode"]
-        return mode["mode"]
-    return mode
+    return (await get_chat_settings(chat_id)).playmode
 
 
 async def set_playmode(chat_id: int, mode: str):
-    playmode[chat_id] = mode
-    await playmodedb.update_one(
-        {"chat_id": chat_id}, {"$set": {"mode": mode}}, upsert=True
-    )
+    await _save_settings(chat_id, playmode=mode)
 
 
 async def get_lang(chat_id: int) -> str:
-    mode = langm.get(chat_id)
-    if not mode:
-        lang = await langdb.find_one({"chat_id": chat_id})
-        if not lang:
-            langm[chat_id] = "en"
-            return "en"
-        langm[chat_id] = lang["lang"]
-        return lang["lang"]
-    return mode
+    return (await get_chat_settings(chat_id)).lang
 
 
 async def set_lang(chat_id: int, lang: str):
-    langm[chat_id] = lang
-    await langdb.update_one({"chat_id": chat_id}, {"$set": {"lang": lang}}, upsert=True)
+    await _save_settings(chat_id, lang=lang)
 
 
 async def is_music_playing(chat_id: int) -> bool:
@@ -363,39 +348,16 @@ async def remove_active_video_chat(chat_id: int):
         activevideo.remove(chat_id)
 
 
-async def check_nonadmin_chat(chat_id: int) -> bool:
-    user = await authdb.find_one({"chat_id": chat_id})
-    if not user:
-        return False
-    return True
-
-
 async def is_nonadmin_chat(chat_id: int) -> bool:
-    mode = nonadmin.get(chat_id)
-    if not mode:
-        user = await authdb.find_one({"chat_id": chat_id})
-        if not user:
-            nonadmin[chat_id] = False
-            return False
-        nonadmin[chat_id] = True
-        return True
-    return mode
+    return (await get_chat_settings(chat_id)).nonadmin
 
 
 async def add_nonadmin_chat(chat_id: int):
-    nonadmin[chat_id] = True
-    is_admin = await check_nonadmin_chat(chat_id)
-    if is_admin:
-        return
-    return await authdb.insert_one({"chat_id": chat_id})
+    await _save_settings(chat_id, nonadmin=True)
 
 
 async def remove_nonadmin_chat(chat_id: int):
-    nonadmin[chat_id] = False
-    is_admin = await check_nonadmin_chat(chat_id)
-    if not is_admin:
-        return
-    return await authdb.delete_one({"chat_id": chat_id})
+    await _save_settings(chat_id, nonadmin=False)
 
 
 async def is_on_off(on_off: int) -> bool:
@@ -455,79 +417,134 @@ async def maintenance_on():
     return await onoffdb.insert_one({"on_off": 1})
 
 
-async def is_served_user(user_id: int) -> bool:
-    user = await usersdb.find_one({"user_id": user_id})
-    if not user:
-        return False
-    return True
+async def ensure_membership_indexes() -> int:
+    """
+    Enforce one document per id on the registration collections so adds can
+    be plain upserts. Duplicates left by the old find-then-insert adds are
+    dropped first. Returns how many were removed.
+    """
+    removed = 0
+    for coll, key in (
+        (chatsdb, "chat_id"),
+        (usersdb, "user_id"),
+        (blacklist_chatdb, "chat_id"),
+        (blockeddb, "user_id"),
+        (gbansdb, "user_id"),
+    ):
+        indexes = await coll.index_information()
+        if any(ix.get("unique") and ix["key"] == [(key, 1)] for ix in indexes.values()):
+            continue
+        pipeline = [
+            {"$group": {"_id": f"${key}", "ids": {"$push": "$_id"}, "n": {"$sum": 1}}},
+            {"$match": {"n": {"$gt": 1}}},
+        ]
+        async for dup in coll.aggregate(pipeline, allowDiskUse=True):
+            result = await coll.delete_many({"_id": {"$in": dup["ids"][1:]}})
+            removed += result.deleted_count
+        await coll.create_index(key, unique=True)
+    return removed
+
+
+async def served_users_count() -> int:
+    if served_user_ids.loaded and served_user_ids.exact:
+        return len(served_user_ids)
+    return await usersdb.count_documents({"user_id": {"$gt": 0}})
+
+
+async def served_chats_count() -> int:
+    if served_chat_ids.loaded:
+        return len(served_chat_ids)
+    return await chatsdb.count_documents({"chat_id": {"$lt": 0}})
 
 
-async def get_served_users() -> list:
-    users_list = []
-    async for user in usersdb.find({"user_id": {"$gt": 0}}):
-        users_list.append(user)
-    return users_list
+async def is_served_user(user_id: int) -> bool:
+    return await served_user_ids.contains(user_id)
 
 
 async def add_served_user(user_id: int):
-    is_served = await is_served_user(user_id)
-    if is_served:
+    # A bloom filter can answer a false "yes" (or still hold a pruned user),
+    # so only an exact set may skip the idempotent upsert.
+    if served_user_ids.exact and user_id in served_user_ids:
         return
-    return await usersdb.insert_one({"user_id": user_id})
+    await usersdb.update_one(
+        {"user_id": user_id}, {"$setOnInsert": {"user_id": user_id}}, upsert=True
+    )
+    served_user_ids.add(user_id)
+
+
+async def remove_served_user(user_id: int):
+    result = await usersdb.delete_one({"user_id": user_id})
+    if result.deleted_count:
+        served_user_ids.discard(user_id)
+
 
+async def iter_served_users(after=None, limit: int = 0):
+    """Stream served users in ``_id`` order, starting after the given ``_id``."""
+    query = {"user_id": {"$gt": 0}}
+    if after is not None:
+        query["_id"] = {"$gt": after}
+    cursor = usersdb.find(query, {"user_id": 1}).sort("_id", 1).limit(limit)
+    async for user in cursor:
+        yield user
 
-async def get_served_chats() -> list:
-    chats_list = []
-    async for chat in chatsdb.find({"chat_id": {"$lt": 0}}):
-        chats_list.append(chat)
-    return chats_list
+
+async def iter_served_chats(after=None, limit: int = 0):
+    """Stream served chats in ``_id`` order, starting after the given ``_id``."""
+    query = {"chat_id": {"$lt": 0}}
+    if after is not None:
+        query["_id"] = {"$gt": after}
+    cursor = chatsdb.find(query, {"chat_id": 1}).sort("_id", 1).limit(limit)
+    async for chat in cursor:
+        yield chat
 
 
 async def is_served_chat(chat_id: int) -> bool:
-    chat = await chatsdb.find_one({"chat_id": chat_id})
-    if not chat:
-        return False
-    return True
+    return await served_chat_ids.contains(chat_id)
 
 
 async def add_served_chat(chat_id: int):
-    is_served = await is_served_chat(chat_id)
-    if is_served:
+    if chat_id in served_chat_ids:
         return
-    return await chatsdb.insert_one({"chat_id": chat_id})
+    await chatsdb.update_one(
+        {"chat_id": chat_id}, {"$setOnInsert": {"chat_id": chat_id}}, upsert=True
+    )
+    served_chat_ids.add(chat_id)
+
 
-# New function to remove served chat
 async def remove_served_chat(chat_id: int):
-    if await is_served_chat(chat_id):
-        await chatsdb.delete_one({"chat_id": chat_id})
-    
+    result = await chatsdb.delete_one({"chat_id": chat_id})
+    if result.deleted_count:
+        served_chat_ids.discard(chat_id)
+
 
 async def blacklisted_chats() -> list:
-    chats_list = []
-    async for chat in blacklist_chatdb.find({"chat_id": {"$lt": 0}}):
-        chats_list.append(chat["chat_id"])
-    return chats_list
+    return await blacklisted_chat_ids.members()
+
+
+async def is_blacklisted_chat(chat_id: int) -> bool:
+    return await blacklisted_chat_ids.contains(chat_id)
 
 
 async def blacklist_chat(chat_id: int) -> bool:
-    if not await blacklist_chatdb.find_one({"chat_id": chat_id}):
-        await blacklist_chatdb.insert_one({"chat_id": chat_id})
-        return True
-    return False
+    result = await blacklist_chatdb.update_one(
+        {"chat_id": chat_id}, {"$setOnInsert": {"chat_id": chat_id}}, upsert=True
+    )
+    blacklisted_chat_ids.add(chat_id)
+    return result.upserted_id is not None
 
 
 async def whitelist_chat(chat_id: int) -> bool:
-    if await blacklist_chatdb.find_one({"chat_id": chat_id}):
-        await blacklist_chatdb.delete_one({"chat_id": chat_id})
-        return True
-    return False
+    result = await blacklist_chatdb.delete_one({"chat_id": chat_id})
+    if result.deleted_count:
+        blacklisted_chat_ids.discard(chat_id)
+    return bool(result.deleted_count)
 
 
 async def _get_authusers(chat_id: int) -> Dict[str, int]:
-    _notes = await authuserdb.find_one({"chat_id": chat_id})
+    _notes = await settingsdb.find_one({"chat_id": chat_id}, {"_id": 0, "authusers": 1})
     if not _notes:
         return {}
-    return _notes.get("notes", {})
+    return _notes.get("authusers", {})
 
 
 async def get_authuser_names(chat_id: int) -> List[str]:
@@ -545,56 +562,38 @@ async def get_authuser(chat_id: int, name: str) -> Union[bool, dict]:
 
 
 async def save_authuser(chat_id: int, name: str, note: dict):
-    name = name
-    _notes = await _get_authusers(chat_id)
-    _notes[name] = note
-
-    await authuserdb.update_one(
-        {"chat_id": chat_id}, {"$set": {"notes": _notes}}, upsert=True
+    await settingsdb.update_one(
+        {"chat_id": chat_id}, {"$set": {f"authusers.{name}": note}}, upsert=True
     )
 
 
 async def delete_authuser(chat_id: int, name: str) -> bool:
-    notesd = await _get_authusers(chat_id)
-    name = name
-    if name in notesd:
-        del notesd[name]
-        await authuserdb.update_one(
-            {"chat_id": chat_id},
-            {"$set": {"notes": notesd}},
-            upsert=True,
-        )
-        return True
-    return False
+    result = await settingsdb.update_one(
+        {"chat_id": chat_id, f"authusers.{name}": {"$exists": True}},
+        {"$unset": {f"authusers.{name}": ""}},
+    )
+    return bool(result.modified_count)
 
 
 async def get_gbanned() -> list:
-    results = []
-    async for user in gbansdb.find({"user_id": {"$gt": 0}}):
-        user_id = user["user_id"]
-        results.append(user_id)
-    return results
+    return await gbanned_ids.members()
 
 
 async def is_gbanned_user(user_id: int) -> bool:
-    user = await gbansdb.find_one({"user_id": user_id})
-    if not user:
-        return False
-    return True
+    return await gbanned_ids.contains(user_id)
 
 
 async def add_gban_user(user_id: int):
-    is_gbanned = await is_gbanned_user(user_id)
-    if is_gbanned:
-        return
-    return await gbansdb.insert_one({"user_id": user_id})
+    await gbansdb.update_one(
+        {"user_id": user_id}, {"$setOnInsert": {"user_id": user_id}}, upsert=True
+    )
+    gbanned_ids.add(user_id)
 
 
 async def remove_gban_user(user_id: int):
-    is_gbanned = await is_gbanned_user(user_id)
-    if not is_gbanned:
-        return
-    return await gbansdb.delete_one({"user_id": user_id})
+    result = await gbansdb.delete_one({"user_id": user_id})
+    if result.deleted_count:
+        gbanned_ids.discard(user_id)
 
 
 async def get_sudoers() -> list:
@@ -623,35 +622,27 @@ async def remove_sudo(user_id: int) -> bool:
 
 
 async def get_banned_users() -> list:
-    results = []
-    async for user in blockeddb.find({"user_id": {"$gt": 0}}):
-        user_id = user["user_id"]
-        results.append(user_id)
-    return results
+    return await banned_ids.members()
 
 
 async def get_banned_count() -> int:
-    users = blockeddb.find({"user_id": {"$gt": 0}})
-    users = await users.to_list(length=100000)
-    return len(users)
+    if banned_ids.loaded:
+        return len(banned_ids)
+    return await blockeddb.count_documents({"user_id": {"$gt": 0}})
 
 
 async def is_banned_user(user_id: int) -> bool:
-    user = await blockeddb.find_one({"user_id": user_id})
-    if not user:
-        return False
-    return True
+    return await banned_ids.contains(user_id)
 
 
 async def add_banned_user(user_id: int):
-    is_gbanned = await is_banned_user(user_id)
-    if is_gbanned:
-        return
-    return await blockeddb.insert_one({"user_id": user_id})
+    await blockeddb.update_one(
+        {"user_id": user_id}, {"$setOnInsert": {"user_id": user_id}}, upsert=True
+    )
+    banned_ids.add(user_id)
 
 
 async def remove_banned_user(user_id: int):
-    is_gbanned = await is_banned_user(user_id)
-    if not is_gbanned:
-        return
-    return await blockeddb.delete_one({"user_id": user_id})
+    result = await blockeddb.delete_one({"user_id": user_id})
+    if result.deleted_count:
+        banned_ids.discard(user_id)
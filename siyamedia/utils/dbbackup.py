@@ -0,0 +1,172 @@
+# Authored By Certified Coders � 2025
+import asyncio
+import itertools
+import json
+import os
+import zipfile
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import bson
+from bson import ObjectId
+from pymongo import ReplaceOne
+from pymongo.errors import BulkWriteError
+
+from siyamedia.core.dir import BACKUP_DIR
+from siyamedia.core.mongo import mongodb
+from siyamedia.logging import LOGGER
+from siyamedia.utils.tuning import BACKUP_BATCH, BACKUP_FULL_EVERY
+
+LOGGER = LOGGER(__name__)
+
+MARKS = "backup_marks"
+FULL_MARK = "$full"  # not a valid collection name, so it cannot clash
+
+
+async def _marks() -> Dict[str, dict]:
+    return {doc["_id"]: doc async for doc in mongodb[MARKS].find({})}
+
+
+async def commit_marks(marks: Dict[str, ObjectId], full: bool) -> None:
+    """Record the high-water marks of a backup once it has been delivered."""
+    now = datetime.now(timezone.utc)
+    ops = [
+        ReplaceOne({"_id": name}, {"mark": mark, "at": now}, upsert=True)
+        for name, mark in marks.items()
+    ]
+    if full:
+        ops.append(ReplaceOne({"_id": FULL_MARK}, {"at": now}, upsert=True))
+    if ops:
+        await mongodb[MARKS].bulk_write(ops, ordered=False)
+
+
+async def full_backup_due() -> bool:
+    last = (await _marks()).get(FULL_MARK)
+    if not last:
+        return True
+    at = last["at"]
+    if at.tzinfo is None:  # motor returns naive UTC datetimes
+        at = at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - at >= timedelta(days=BACKUP_FULL_EVERY)
+
+
+def _clear_archives() -> None:
+    for fname in os.listdir(BACKUP_DIR):
+        fpath = os.path.join(BACKUP_DIR, fname)
+        if os.path.isfile(fpath) and fname.endswith(".zip"):
+            try:
+                os.remove(fpath)
+            except Exception:
+                pass
+
+
+async def create_backup(incremental: bool = False) -> Tuple[str, Dict[str, ObjectId]]:
+    """
+    Stream every collection into a zip of raw BSON entries and return its
+    path with the new high-water marks (to pass to ``commit_marks``).
+
+    Documents are read as raw BSON batches and written straight into the
+    deflate stream from a worker thread, so nothing is decoded and only one
+    batch is held in memory. An incremental backup only holds documents
+    whose ObjectId ``_id`` is past the collection's mark, i.e. inserted since
+    the last delivered backup; in-place updates and deletes are only picked
+    up by a full backup. Collections without ObjectId ids are always dumped
+    in full.
+    """
+    marks = await _marks() if incremental else {}
+    new_marks: Dict[str, ObjectId] = {}
+    manifest = {"created": datetime.now(timezone.utc).isoformat(), "incremental": incremental, "collections": {}}
+
+    await asyncio.to_thread(_clear_archives)
+    kind = "Incremental" if incremental else "Backup"
+    path = os.path.join(BACKUP_DIR, f"siyamedia_{kind}_{datetime.now():%Y%m%d_%H%M%S}.zip")
+    LOGGER.info(f"Starting {kind.lower()} database backup to {os.path.basename(path)}")
+
+    zf = await asyncio.to_thread(zipfile.ZipFile, path, "w", zipfile.ZIP_DEFLATED)
+    try:
+        for name in sorted(await mongodb.list_collection_names()):
+            if name == MARKS:
+                continue
+            coll = mongodb[name]
+            top = await coll.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+            if not top:
+                continue
+            query, since = {}, None
+            if isinstance(top["_id"], ObjectId):
+                new_marks[name] = top["_id"]
+                if since := (marks.get(name) or {}).get("mark"):
+                    query = {"_id": {"$gt": since}}
+
+            size = 0
+            entry = await asyncio.to_thread(zf.open, f"{mongodb.name}/{name}.bson", "w")
+            try:
+                cursor = coll.find_raw_batches(query, sort=[("_id", 1)], batch_size=BACKUP_BATCH)
+                async for batch in cursor:
+                    await asyncio.to_thread(entry.write, batch)
+                    size += len(batch)
+            finally:
+                await asyncio.to_thread(entry.close)
+            manifest["collections"][name] = {"since": str(since) if since else None, "bytes": size}
+
+        await asyncio.to_thread(zf.writestr, "manifest.json", json.dumps(manifest, indent=1))
+    except BaseException:
+        await asyncio.to_thread(zf.close)
+        await asyncio.to_thread(os.remove, path)
+        raise
+    await asyncio.to_thread(zf.close)
+    return path, new_marks
+
+
+def _read_entry(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> Iterator[List[dict]]:
+    with zf.open(info) as f:
+        docs = bson.decode_file_iter(f)
+        while batch := list(itertools.islice(docs, BACKUP_BATCH)):
+            yield batch
+
+
+async def restore_backup(path: str, only: Optional[str] = None) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Upsert every document of a backup archive by ``_id``; returns the
+    restored and skipped counts per collection. Upserting makes restores
+    idempotent, so a full backup followed by its incrementals (oldest first)
+    rebuilds the latest state. Entries are decoded in a worker thread one
+    batch at a time.
+
+    A document whose unique key (``chat_id``, ``user_id``) is already held
+    by a live document under another ``_id`` is skipped and counted rather
+    than aborting the rest of the restore.
+    """
+    restored: Dict[str, int] = {}
+    skipped: Dict[str, int] = {}
+    zf = await asyncio.to_thread(zipfile.ZipFile, path)
+    try:
+        for info in zf.infolist():
+            if not info.filename.endswith(".bson"):
+                continue
+            name = os.path.splitext(os.path.basename(info.filename))[0]
+            if only and name != only:
+                continue
+            batches = _read_entry(zf, info)
+            while batch := await asyncio.to_thread(next, batches, None):
+                dupes = 0
+                try:
+                    await mongodb[name].bulk_write(
+                        [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in batch],
+                        ordered=False,
+                    )
+                except BulkWriteError as e:
+                    errors = e.details.get("writeErrors", [])
+                    if (
+                        not errors
+                        or e.details.get("writeConcernErrors")
+                        or any(err.get("code") != 11000 for err in errors)
+                    ):
+                        raise
+                    dupes = len(errors)
+                    skipped[name] = skipped.get(name, 0) + dupes
+                restored[name] = restored.get(name, 0) + len(batch) - dupes
+    finally:
+        await asyncio.to_thread(zf.close)
+    if skipped:
+        LOGGER.warning(f"Restore skipped duplicate-key documents: {skipped}")
+    return restored, skipped
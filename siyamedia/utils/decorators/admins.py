@@ -4,8 +4,8 @@ from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from siyamedia import app
 from siyamedia.misc import SUDOERS, db
+from siyamedia.utils.admincache import admin_cache
 from siyamedia.utils.database import (
-    get_authuser_names,
     get_cmode,
     get_lang,
     get_upvote_count,
@@ -14,11 +14,9 @@ from siyamedia.utils.database import (
     is_nonadmin_chat,
     is_skipmode,
 )
-from config import SUPPORT_CHAT, adminlist, confirmer
+from config import SUPPORT_CHAT, confirmer
 from strings import get_string
 
-from ..formatters import int_to_alpha
-
 
 def AdminRightsCheck(mystic):
     async def wrapper(client, message):
@@ -66,11 +64,11 @@ def AdminRightsCheck(mystic):
         is_non_admin = await is_nonadmin_chat(message.chat.id)
         if not is_non_admin:
             if message.from_user.id not in SUDOERS:
-                admins = adminlist.get(message.chat.id)
+                admins = await admin_cache.get(message.chat.id)
                 if not admins:
                     return await message.reply_text(_["admin_13"])
                 else:
-                    if message.from_user.id not in admins:
+                    if not admins.can_manage(message.from_user.id):
                         if await is_skipmode(message.chat.id):
                             upvote = await get_upvote_count(chat_id)
                             text = f"""<b>????? ?????s ??????</b>
@@ -98,8 +96,8 @@ def AdminRightsCheck(mystic):
                             if chat_id not in confirmer:
                                 confirmer[chat_id] = {}
                             try:
-                                vidid = db[chat_id][0]["vidid"]
-                                file = db[chat_id][0]["file"]
+                                vidid = db[chat_id][0].vidid
+                                file = db[chat_id][0].file
                             except:
                                 return await message.reply_text(_["admin_14"])
                             senn = await message.reply_text(text, reply_markup=upl)
@@ -148,15 +146,10 @@ def AdminActual(mystic):
             )
             return await message.reply_text(_["general_3"], reply_markup=upl)
         if message.from_user.id not in SUDOERS:
-            try:
-                member = (
-                    await app.get_chat_member(message.chat.id, message.from_user.id)
-                ).privileges
-                if not member:
-                    return await message.reply_text(_["general_4"])
-            except:
+            admins = await admin_cache.get(message.chat.id)
+            if not admins:
                 return
-            if not member.can_manage_video_chats:
+            if not admins.is_admin(message.from_user.id, "can_manage_video_chats"):
                 return await message.reply(_["general_4"])
         return await mystic(client, message, _)
 
@@ -179,30 +172,17 @@ def ActualAdminCB(mystic):
         if CallbackQuery.message.chat.type == ChatType.PRIVATE:
             return await mystic(client, CallbackQuery, _)
         is_non_admin = await is_nonadmin_chat(CallbackQuery.message.chat.id)
-        if not is_non_admin:
-            try:
-                a = (
-                    await app.get_chat_member(
-                        CallbackQuery.message.chat.id,
-                        CallbackQuery.from_user.id,
+        if not is_non_admin and CallbackQuery.from_user.id not in SUDOERS:
+            if not await admin_cache.can_manage(
+                CallbackQuery.message.chat.id, CallbackQuery.from_user.id
+            ):
+                try:
+                    return await CallbackQuery.answer(
+                        _["general_4"],
+                        show_alert=True,
                     )
-                ).privileges
-                if not a:
-                    return await CallbackQuery.answer(_["general_4"], show_alert=True)
-            except:
-                return await CallbackQuery.answer(_["general_4"], show_alert=True)
-            if not a.can_manage_video_chats:
-                if CallbackQuery.from_user.id not in SUDOERS:
-                    token = await int_to_alpha(CallbackQuery.from_user.id)
-                    _check = await get_authuser_names(CallbackQuery.from_user.id)
-                    if token not in _check:
-                        try:
-                            return await CallbackQuery.answer(
-                                _["general_4"],
-                                show_alert=True,
-                            )
-                        except:
-                            return
+                except:
+                    return
         return await mystic(client, CallbackQuery, _)
 
     return wrapper
@@ -4,6 +4,7 @@ import asyncio
 from pyrogram.enums import ChatMemberStatus
 from pyrogram.errors import (
     ChatAdminRequired,
+    FloodWait,
     InviteHashExpired,
     InviteRequestSent,
     UserAlreadyParticipant,
@@ -11,10 +12,12 @@ from pyrogram.errors import (
 )
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
-from config import PLAYLIST_IMG_URL, SUPPORT_CHAT, adminlist
+from config import PLAYLIST_IMG_URL, SUPPORT_CHAT
 from strings import get_string
 from siyamedia import YouTube, app
 from siyamedia.misc import SUDOERS
+from siyamedia.utils.admincache import admin_cache
+from siyamedia.utils.assistantpool import assistant_pool
 from siyamedia.utils.database import (
     get_assistant,
     get_cmode,
@@ -99,10 +102,10 @@ def PlayWrapper(command):
         playty = await get_playtype(message.chat.id)
         if playty != "Everyone":
             if message.from_user.id not in SUDOERS:
-                admins = adminlist.get(message.chat.id)
+                admins = await admin_cache.get(message.chat.id)
                 if not admins:
                     return await message.reply_text(_["admin_13"])
-                elif message.from_user.id not in admins:
+                elif not admins.can_manage(message.from_user.id):
                     return await message.reply_text(_["play_4"])
 
         if message.command[0][0] == "v":
@@ -121,7 +124,7 @@ def PlayWrapper(command):
             fplay = None
 
         if not await is_active_chat(chat_id):
-            userbot = await get_assistant(chat_id)
+            userbot = await get_assistant(chat_id, rebalance=True)
             try:
                 try:
                     member = await app.get_chat_member(chat_id, userbot.id)
@@ -207,6 +210,11 @@ def PlayWrapper(command):
                     await myu.edit(_["call_5"].format(app.mention))
                 except UserAlreadyParticipant:
                     pass
+                except FloodWait as e:
+                    assistant_pool.report(chat_id, e)
+                    return await message.reply_text(
+                        _["call_3"].format(app.mention, type(e).__name__)
+                    )
                 except Exception as e:
                     return await message.reply_text(
                         _["call_3"].format(app.mention, type(e).__name__)
@@ -13,7 +13,8 @@ from yt_dlp import YoutubeDL
 
 from siyamedia.core.dir import CACHE_DIR, DOWNLOAD_DIR
 from siyamedia.utils.cookie_handler import COOKIE_PATH as _COOKIES_FILE
-from siyamedia.utils.tuning import CHUNK_SIZE, SEM
+from siyamedia.utils.mediacache import media_cache
+from siyamedia.utils.tuning import CHUNK_SIZE, SEM, YTDLP_TIMEOUT
 from config import API_KEY, API_URL, VIDEO_API_URL
 from siyamedia.logging import LOGGER
 
@@ -56,13 +57,7 @@ def get_cookie_file() -> Optional[str]:
 
 
 def find_cached_file(video_id: str) -> Optional[str]:
-    if not video_id:
-        return None
-    for ext in ("mp3", "m4a", "webm", "mp4", "mkv"):
-        path = f"{DOWNLOAD_DIR}/{video_id}.{ext}"
-        if os.path.exists(path):
-            return path
-    return None
+    return media_cache.lookup(video_id)
 
 
 def get_ytdlp_base_opts() -> Dict[str, object]:
@@ -214,6 +209,30 @@ def download_with_ytdlp_sync(link: str, fmt: str) -> Optional[str]:
         return None
 
 
+def resolve_stream_url_sync(link: str, fmt: str) -> Optional[str]:
+    try:
+        opts = get_ytdlp_base_opts()
+        opts["format"] = fmt
+        with YoutubeDL(opts) as ydl:
+            info = ydl.extract_info(link, download=False)
+        return info.get("url") if info else None
+    except Exception:
+        return None
+
+
+async def resolve_stream_url(link: str, video: bool = False) -> Optional[str]:
+    """Direct media URL of a single (muxed) format that ffmpeg can stream from."""
+    fmt = "best[height<=?720][width<=?1280]" if video else "bestaudio"
+    loop = asyncio.get_running_loop()
+    try:
+        return await asyncio.wait_for(
+            run_with_semaphore(loop.run_in_executor(None, resolve_stream_url_sync, link, fmt)),
+            timeout=YTDLP_TIMEOUT,
+        )
+    except Exception:
+        return None
+
+
 async def run_with_semaphore(coro):
     async with SEM:
         return await coro
@@ -290,7 +309,7 @@ async def yt_dlp_download(link: str, type: str, title: str = "") -> Optional[str
                 log_download_source(title, "yt-dlp")
             return result
 
-        return await deduplicate_download(key, run)
+        return media_cache.add(await deduplicate_download(key, run))
 
     elif type == "video":
         key = f"video:{link}"
@@ -309,6 +328,6 @@ async def yt_dlp_download(link: str, type: str, title: str = "") -> Optional[str
                 log_download_source(title, "yt-dlp")
             return result
 
-        return await deduplicate_download(key, run)
+        return media_cache.add(await deduplicate_download(key, run))
 
     return None
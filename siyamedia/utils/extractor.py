@@ -0,0 +1,155 @@
+# Authored By Certified Coders � 2025
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Tuple
+
+from yt_dlp import YoutubeDL
+
+from siyamedia.core.dir import CACHE_DIR
+from siyamedia.logging import LOGGER
+from siyamedia.utils.cookie_handler import COOKIE_PATH
+from siyamedia.utils.tuning import (
+    DOWNLOAD_WORKERS,
+    EXTRACTOR_WORKERS,
+    YTDLP_DOWNLOAD_TIMEOUT,
+    YTDLP_TIMEOUT,
+)
+
+LOGGER = LOGGER(__name__)
+
+_BASE_OPTS = {
+    "quiet": True,
+    "no_warnings": True,
+    "noprogress": True,
+    "cachedir": str(CACHE_DIR),
+}
+_MAX_INSTANCES = 16
+
+# -- Worker side: one set of YoutubeDL instances per process, reused across jobs --
+_instances: Dict[Tuple, YoutubeDL] = {}
+
+
+def _ydl(opts: Dict) -> YoutubeDL:
+    key = tuple(sorted(opts.items()))
+    ydl = _instances.get(key)
+    if ydl is None:
+        if len(_instances) >= _MAX_INSTANCES:
+            for old in _instances.values():
+                old.close()
+            _instances.clear()
+        ydl = _instances[key] = YoutubeDL({**_BASE_OPTS, **opts})
+    return ydl
+
+
+def _warm() -> int:
+    _ydl({}).get_info_extractor("Youtube")
+    return os.getpid()
+
+
+def _extract(link: str, opts: Dict) -> Optional[Dict]:
+    ydl = _ydl(opts)
+    info = ydl.extract_info(link, download=False)
+    return ydl.sanitize_info(info) if info else None
+
+
+def _download(link: str, opts: Dict) -> int:
+    return _ydl(opts).download([link])
+
+
+# -- Parent side ------------------------------------------------------------------
+def cookie_opts() -> Dict:
+    """Cookie options keyed by file mtime so refreshed cookies get a fresh instance."""
+    path = str(COOKIE_PATH)
+    try:
+        if path and os.path.getsize(path) > 0:
+            return {"cookiefile": path, "_cookies_mtime": os.path.getmtime(path)}
+    except OSError:
+        pass
+    return {}
+
+
+class ExtractorPool:
+    """
+    Long-lived yt-dlp workers in two process pools.
+
+    Each worker keeps its YoutubeDL instances (and their extractor and cookie
+    state) alive between jobs, so a metadata call no longer pays for spawning
+    the yt-dlp CLI. Metadata lookups and full downloads run in separate pools,
+    so a few long downloads cannot hold up every ``/play`` lookup.
+
+    Each pool hands out one slot per worker and a job only enters the pool
+    once it holds a slot, so its timeout counts run time, not time queued.
+    A slot is held until the worker is actually done, even when the caller
+    timed out or was cancelled.
+    """
+
+    def __init__(self, workers: int = EXTRACTOR_WORKERS, download_workers: int = DOWNLOAD_WORKERS) -> None:
+        self.workers = {"meta": workers, "download": download_workers}
+        self._pools: Dict[str, ProcessPoolExecutor] = {}
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+
+    def start(self, lane: str = "meta") -> ProcessPoolExecutor:
+        if lane not in self._pools:
+            # fork: workers must not re-import the bot package on start.
+            self._pools[lane] = ProcessPoolExecutor(
+                self.workers[lane], mp_context=multiprocessing.get_context("fork")
+            )
+        return self._pools[lane]
+
+    def spawn(self) -> None:
+        """Fork every worker now, from the calling thread, without waiting for warm-up."""
+        for lane in self.workers:
+            self.start(lane).submit(os.getpid)
+
+    async def warm(self) -> List[int]:
+        """Fork every worker and load the YouTube extractor up front."""
+        return await asyncio.gather(
+            *(
+                self._run(lane, _warm, timeout=60)
+                for lane, count in self.workers.items()
+                for _ in range(count)
+            )
+        )
+
+    async def _run(self, lane: str, fn: Callable, *args, timeout: float):
+        slot = self._slots.get(lane)
+        if slot is None:
+            slot = self._slots[lane] = asyncio.Semaphore(self.workers[lane])
+        await slot.acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            try:
+                fut = loop.run_in_executor(self.start(lane), fn, *args)
+            except BrokenProcessPool:
+                # A worker died while idle; the pool only notices on submit.
+                LOGGER.warning(f"yt-dlp {lane} worker pool broke, restarting it")
+                self.shutdown(lane)
+                fut = loop.run_in_executor(self.start(lane), fn, *args)
+        except BaseException:
+            slot.release()
+            raise
+        fut.add_done_callback(lambda _: slot.release())
+        try:
+            return await asyncio.wait_for(asyncio.shield(fut), timeout=timeout)
+        except BrokenProcessPool:
+            LOGGER.warning(f"yt-dlp {lane} worker pool broke, restarting it")
+            self.shutdown(lane)
+            raise
+
+    async def extract(self, link: str, opts: Optional[Dict] = None, timeout: float = YTDLP_TIMEOUT) -> Optional[Dict]:
+        return await self._run("meta", _extract, link, {**cookie_opts(), **(opts or {})}, timeout=timeout)
+
+    async def download(self, link: str, opts: Dict, timeout: float = YTDLP_DOWNLOAD_TIMEOUT) -> int:
+        return await self._run("download", _download, link, {**cookie_opts(), **opts}, timeout=timeout)
+
+    def shutdown(self, lane: Optional[str] = None) -> None:
+        for name in [lane] if lane else list(self._pools):
+            pool = self._pools.pop(name, None)
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+
+extractor = ExtractorPool()
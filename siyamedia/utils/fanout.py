@@ -0,0 +1,215 @@
+# Authored By Certified Coders � 2025
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field, fields
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from siyamedia import app
+from siyamedia.core.mongo import mongodb
+from siyamedia.logging import LOGGER
+from siyamedia.utils.database import iter_served_chats
+from siyamedia.utils.tuning import FANOUT_BATCH, FANOUT_PROGRESS_INTERVAL, FANOUT_WORKERS
+
+LOGGER = LOGGER(__name__)
+
+RUNNING, CANCELLED, FAILED, DONE = "running", "cancelled", "failed", "done"
+
+
+@dataclass(slots=True)
+class FanOutJob:
+    id: str
+    action: str  # name the FanOutAction was registered under
+    subject: Optional[int] = None  # the user being acted on
+    scope: Optional[int] = None  # chat the targets belong to, for per-chat actions
+    state: str = RUNNING
+    cursor: Any = None  # position of the last target whose batch completed
+    total: int = 0
+    done: int = 0
+    failed: int = 0
+    lang: str = "en"
+    status_chat: Optional[int] = None
+    status_msg: Optional[int] = None
+    meta: Dict[str, Any] = field(default_factory=dict)
+    started: float = field(default_factory=time.time)
+
+    @property
+    def processed(self) -> int:
+        return self.done + self.failed
+
+    def to_doc(self) -> dict:
+        doc = {f.name: getattr(self, f.name) for f in fields(self)}
+        doc["_id"] = doc.pop("id")
+        return doc
+
+    @classmethod
+    def from_doc(cls, doc: dict) -> "FanOutJob":
+        names = {f.name for f in fields(cls)}
+        return cls(id=doc["_id"], **{k: v for k, v in doc.items() if k in names and k != "id"})
+
+
+@dataclass(slots=True)
+class FanOutAction:
+    # Yields (cursor, target) pairs, resuming after ``job.cursor`` when resumable.
+    source: Callable[[FanOutJob], AsyncIterator[Tuple[Any, int]]]
+    # Acts on one target; raising counts it as failed.
+    apply: Callable[[FanOutJob, int], Awaitable[Any]]
+    status: Callable[[FanOutJob], str]
+    finish: Optional[Callable[[FanOutJob], Awaitable[None]]] = None
+    resumable: bool = True  # checkpoint to Mongo and pick the job up again after a restart
+
+
+async def served_chat_targets(job: FanOutJob) -> AsyncIterator[Tuple[Any, int]]:
+    """Every served chat in ``_id`` order, one short query per page."""
+    cursor = job.cursor
+    while True:
+        page = [doc async for doc in iter_served_chats(cursor, FANOUT_BATCH)]
+        if not page:
+            return
+        for doc in page:
+            yield doc["_id"], int(doc["chat_id"])
+        cursor = page[-1]["_id"]
+
+
+class FanOut:
+    """
+    Applies a registered action to a lazily paged stream of targets.
+
+    Targets are pulled one batch at a time and handed to a bounded set of
+    workers; the actions go through the send scheduler, so concurrency
+    never outruns the per-method rate limits. For resumable actions the
+    cursor is checkpointed to Mongo after every batch and unfinished jobs
+    are restarted by ``resume_all``. The job's status message is edited at
+    most every ``FANOUT_PROGRESS_INTERVAL`` seconds. Cancelling stops any
+    target that has not been started yet.
+    """
+
+    def __init__(self) -> None:
+        self._coll = mongodb.fanout_jobs
+        self.actions: Dict[str, FanOutAction] = {}
+        self.jobs: Dict[str, FanOutJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def register(self, name: str, action: FanOutAction) -> None:
+        self.actions[name] = action
+
+    @staticmethod
+    def new_id() -> str:
+        return uuid.uuid4().hex[:8]
+
+    def get(self, job_id: Optional[str] = None) -> Optional[FanOutJob]:
+        if job_id:
+            return self.jobs.get(job_id)
+        active = self.active()
+        return max(active, key=lambda job: job.started) if active else None
+
+    def active(self, action: Optional[str] = None, subject: Optional[int] = None) -> List[FanOutJob]:
+        return [
+            job
+            for job in self.jobs.values()
+            if job.state == RUNNING
+            and (action is None or job.action == action)
+            and (subject is None or job.subject == subject)
+        ]
+
+    async def start(self, job: FanOutJob) -> FanOutJob:
+        await self._save(job)
+        self._spawn(job)
+        return job
+
+    async def wait(self, job: FanOutJob) -> None:
+        if task := self._tasks.get(job.id):
+            await asyncio.shield(task)
+
+    async def cancel(self, job: FanOutJob) -> bool:
+        if job.state != RUNNING:
+            return False
+        job.state = CANCELLED
+        await self._save(job)
+        return True
+
+    async def resume_all(self, action: str) -> None:
+        """Restart the unfinished jobs of ``action`` after a restart."""
+        async for doc in self._coll.find({"action": action, "state": RUNNING}):
+            job = FanOutJob.from_doc(doc)
+            if job.id not in self.jobs:
+                LOGGER.info(f"Resuming {action} {job.id} at {job.processed}/{job.total}")
+                self._spawn(job)
+
+    def _spawn(self, job: FanOutJob) -> None:
+        self.jobs[job.id] = job
+        self._tasks[job.id] = asyncio.create_task(self._run(job))
+
+    async def _save(self, job: FanOutJob) -> None:
+        if self.actions[job.action].resumable:
+            await self._coll.replace_one({"_id": job.id}, job.to_doc(), upsert=True)
+
+    async def _run(self, job: FanOutJob) -> None:
+        action = self.actions[job.action]
+        workers = asyncio.Semaphore(FANOUT_WORKERS)
+        progress = asyncio.create_task(self._report(job))
+
+        async def apply(target: int) -> None:
+            async with workers:
+                if job.state != RUNNING:
+                    return
+                try:
+                    await action.apply(job, target)
+                except Exception:
+                    job.failed += 1
+                else:
+                    job.done += 1
+
+        async def flush(batch: List[Tuple[Any, int]]) -> None:
+            await asyncio.gather(*(apply(target) for _, target in batch))
+            if job.state == RUNNING:
+                job.cursor = batch[-1][0]
+                await self._save(job)
+
+        try:
+            batch: List[Tuple[Any, int]] = []
+            async for item in action.source(job):
+                if job.state != RUNNING:
+                    break
+                batch.append(item)
+                if len(batch) >= FANOUT_BATCH:
+                    await flush(batch)
+                    batch = []
+            if batch and job.state == RUNNING:
+                await flush(batch)
+            if job.state == RUNNING:
+                job.state = DONE
+        except Exception as e:
+            LOGGER.warning(f"{job.action} {job.id} stopped after an error: {e}")
+            job.state = FAILED
+        finally:
+            progress.cancel()
+            self._tasks.pop(job.id, None)
+            self.jobs.pop(job.id, None)
+            await self._save(job)
+            await self._edit_status(job)
+            if action.finish:
+                try:
+                    await action.finish(job)
+                except Exception as e:
+                    LOGGER.warning(f"{job.action} {job.id} finish failed: {e}")
+
+    async def _report(self, job: FanOutJob) -> None:
+        last = None
+        while True:
+            await asyncio.sleep(FANOUT_PROGRESS_INTERVAL)
+            if job.processed != last:
+                last = job.processed
+                await self._edit_status(job)
+
+    async def _edit_status(self, job: FanOutJob) -> None:
+        if not job.status_msg:
+            return
+        try:
+            text = self.actions[job.action].status(job)
+            await app.edit_message_text(job.status_chat, job.status_msg, text)
+        except Exception:
+            pass
+
+
+fanout = FanOut()
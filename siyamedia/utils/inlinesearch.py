@@ -0,0 +1,95 @@
+# Authored By Certified Coders � 2025
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from youtubesearchpython.aio import VideosSearch
+
+from siyamedia.logging import LOGGER
+from siyamedia.utils.cache import TTLCache
+from siyamedia.utils.tuning import (
+    INLINE_PAGE_SIZE,
+    INLINE_SEARCH_DEBOUNCE,
+    INLINE_SEARCH_LIMIT,
+    INLINE_SEARCH_MAX,
+    INLINE_SEARCH_TTL,
+)
+from siyamedia.utils.ytmeta import RESULT_FIELDS, normalize_query
+
+LOGGER = LOGGER(__name__)
+
+
+class InlineSearch:
+    """
+    YouTube search behind the inline mode.
+
+    Queries are normalised and cached in an LRU/TTL map; concurrent misses
+    for one query share a single fetch. Each user has at most one search
+    pending: a newer keystroke cancels the older one while it is still in
+    its debounce window or waiting on the fetch (the fetch itself keeps
+    running for anyone else waiting on it). If a fetch fails, the results
+    of the longest cached prefix of the query are served instead.
+    """
+
+    def __init__(self) -> None:
+        self._cache: TTLCache[List[Dict]] = TTLCache(INLINE_SEARCH_MAX, INLINE_SEARCH_TTL)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._pending: Dict[int, asyncio.Task] = {}
+
+    async def _fetch(self, key: str) -> List[Dict]:
+        try:
+            data = await VideosSearch(key, limit=INLINE_SEARCH_LIMIT).next()
+            results = [
+                {k: item[k] for k in RESULT_FIELDS if k in item}
+                for item in data.get("result") or ()
+            ]
+        except Exception as e:
+            LOGGER.warning(f"Inline search for {key!r} failed: {e}")
+            results = []
+        finally:
+            self._inflight.pop(key, None)
+        if results:
+            self._cache.set(key, results)
+        return results or self._prefix(key)
+
+    def _prefix(self, key: str) -> List[Dict]:
+        for end in range(len(key) - 1, 0, -1):
+            results = self._cache.get(key[:end])
+            if results:
+                return results
+        return []
+
+    async def _lookup(self, key: str) -> List[Dict]:
+        await asyncio.sleep(INLINE_SEARCH_DEBOUNCE)
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.create_task(self._fetch(key))
+        return await asyncio.shield(task)
+
+    async def search(self, user_id: int, query: str) -> Optional[List[Dict]]:
+        """Results for ``query``, or None if ``user_id`` sent a newer query meanwhile."""
+        key = normalize_query(query)
+        results = self._cache.get(key)
+        if results is not None:
+            return results
+
+        if previous := self._pending.get(user_id):
+            previous.cancel()
+        task = self._pending[user_id] = asyncio.create_task(self._lookup(key))
+        try:
+            await asyncio.wait({task})
+        finally:
+            if self._pending.get(user_id) is task:
+                del self._pending[user_id]
+        if task.cancelled():
+            return None
+        return task.result()
+
+    @staticmethod
+    def page(results: List[Dict], offset: str) -> Tuple[List[Dict], str]:
+        """Slice one page of ``results`` for an inline ``offset``; returns it and the next offset."""
+        start = int(offset) if offset.isdigit() else 0
+        end = start + INLINE_PAGE_SIZE
+        return results[start:end], str(end) if end < len(results) else ""
+
+
+inline_search = InlineSearch()
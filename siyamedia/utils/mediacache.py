@@ -0,0 +1,173 @@
+# Authored By Certified Coders � 2025
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Set
+
+from config import MEDIA_CACHE_MB
+from siyamedia.core.dir import DOWNLOAD_DIR
+from siyamedia.logging import LOGGER
+from siyamedia.misc import db
+
+LOGGER = LOGGER(__name__)
+
+# Preference order when a video id is cached in more than one format.
+MEDIA_EXTS = ("mp3", "m4a", "webm", "mp4", "mkv", "ogg", "opus", "flac", "wav", "mov")
+
+
+@dataclass(slots=True)
+class CachedMedia:
+    path: str
+    key: str
+    ext: str
+    size: int
+    atime: float
+
+
+class MediaCache:
+    """
+    Index of the playable files in DOWNLOAD_DIR, keyed by ``<video id>.<ext>``.
+
+    Entries are kept in LRU order. Whenever the total size goes over the
+    byte budget the least recently used files are deleted, skipping any file
+    still referenced by a queue in ``siyamedia.misc.db``.
+    """
+
+    EXTS = MEDIA_EXTS
+
+    def __init__(self, root: str = DOWNLOAD_DIR, budget: int = MEDIA_CACHE_MB * 1024 * 1024) -> None:
+        self.root = os.path.realpath(root)
+        self.budget = budget
+        self.total = 0
+        self._entries: "OrderedDict[str, CachedMedia]" = OrderedDict()
+        self._by_key: Dict[str, Dict[str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _split(self, path: str):
+        path = os.path.realpath(path)
+        if os.path.dirname(path) != self.root:
+            return None
+        key, _, ext = os.path.basename(path).rpartition(".")
+        ext = ext.lower()
+        if not key or ext not in self.EXTS:
+            return None
+        return path, key, ext
+
+    def tracks(self, path: str) -> bool:
+        """True if ``path`` is a file this cache indexes and evicts."""
+        return self._split(path) is not None
+
+    def _insert(self, entry: CachedMedia) -> None:
+        old = self._entries.pop(entry.path, None)
+        if old:
+            self.total -= old.size
+        self._entries[entry.path] = entry
+        self._by_key.setdefault(entry.key, {})[entry.ext] = entry.path
+        self.total += entry.size
+
+    def _drop(self, path: str) -> Optional[CachedMedia]:
+        entry = self._entries.pop(path, None)
+        if entry:
+            self.total -= entry.size
+            formats = self._by_key.get(entry.key)
+            if formats:
+                formats.pop(entry.ext, None)
+                if not formats:
+                    self._by_key.pop(entry.key, None)
+        return entry
+
+    def scan(self) -> int:
+        """
+        Rebuild the index from the directory, oldest files first, and return
+        the entry count. Nothing is evicted here so files of queues that are
+        about to be restored survive the boot.
+        """
+        self._entries.clear()
+        self._by_key.clear()
+        self.total = 0
+        found = []
+        try:
+            with os.scandir(self.root) as it:
+                for item in it:
+                    parts = self._split(item.path) if item.is_file() else None
+                    if parts:
+                        st = item.stat()
+                        found.append(CachedMedia(*parts, st.st_size, max(st.st_atime, st.st_mtime)))
+        except FileNotFoundError:
+            return 0
+        for entry in sorted(found, key=lambda e: e.atime):
+            self._insert(entry)
+        return len(self._entries)
+
+    def add(self, path: Optional[str]) -> Optional[str]:
+        """Register a freshly downloaded file and enforce the budget. Returns ``path``."""
+        parts = self._split(path) if path else None
+        if not parts:
+            return path
+        try:
+            size = os.path.getsize(parts[0])
+        except OSError:
+            return path
+        self._insert(CachedMedia(*parts, size, time.time()))
+        self.evict()
+        return path
+
+    def lookup(self, video_id: str, exts: Iterable[str] = MEDIA_EXTS) -> Optional[str]:
+        if not video_id:
+            return None
+        formats = self._by_key.get(video_id)
+        if not formats:
+            return None
+        for ext in exts:
+            path = formats.get(ext)
+            if not path:
+                continue
+            if not os.path.exists(path):
+                self._drop(path)
+                continue
+            self.touch(path)
+            return path
+        return None
+
+    def touch(self, path: str) -> None:
+        entry = self._entries.get(os.path.realpath(path))
+        if entry:
+            entry.atime = time.time()
+            self._entries.move_to_end(entry.path)
+
+    @staticmethod
+    def pinned() -> Set[str]:
+        paths = set()
+        for queue in list(db.values()):
+            for track in queue:
+                for path in (track.file, track.speed_path):
+                    if path and not path.startswith(("vid_", "live_", "index_")):
+                        paths.add(os.path.realpath(path))
+        return paths
+
+    def evict(self) -> int:
+        """Delete unpinned files, least recently used first, until under budget."""
+        if self.total <= self.budget:
+            return 0
+        pinned = self.pinned()
+        removed = 0
+        for path in list(self._entries):
+            if self.total <= self.budget:
+                break
+            if path in pinned:
+                continue
+            self._drop(path)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                LOGGER.warning(f"Could not evict {path}: {e}")
+            removed += 1
+        return removed
+
+
+media_cache = MediaCache()
@@ -0,0 +1,159 @@
+# Authored By Certified Coders � 2025
+import asyncio
+import hashlib
+import math
+from typing import Iterator, List, Optional, Set, Tuple, Union
+
+from siyamedia.logging import LOGGER
+from siyamedia.utils.tuning import MEMBERSHIP_BLOOM_MIN, MEMBERSHIP_RECONCILE_INTERVAL
+
+LOGGER = LOGGER(__name__)
+
+
+class BloomFilter:
+    """
+    Fixed-size bloom filter over integer ids.
+
+    Sized for ``capacity`` ids at ``error_rate`` false positives; it keeps
+    working past that, just with a rising error rate. Ids cannot be removed.
+    """
+
+    __slots__ = ("size", "hashes", "_bits")
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(1, capacity)
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: int) -> Iterator[int]:
+        digest = hashlib.blake2b(key.to_bytes(8, "little", signed=True), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: int) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: int) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class MembershipSet:
+    """
+    In-memory mirror of the ids stored under ``key`` in one Mongo collection.
+
+    ``load`` reads every id once; the database add/remove helpers then keep
+    it current and ``load`` is re-run periodically to pick up writes from
+    elsewhere. Until the first load, ``contains`` and ``members`` fall back
+    to Mongo.
+
+    With ``bloom_rate`` set the ids go into a bloom filter instead of a set:
+    lookups may return false positives at about that rate, removals only
+    take effect at the next reload and the ids cannot be listed.
+    """
+
+    def __init__(self, coll, key: str, query: dict, bloom_rate: float = 0) -> None:
+        self.coll = coll
+        self.key = key
+        self.query = query
+        self.bloom_rate = bloom_rate
+        self.loaded = False
+        self._ids: Union[Set[int], BloomFilter] = set()
+        self._count = 0
+        self._pending: Optional[List[Tuple[bool, int]]] = None
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._ids
+
+    @property
+    def exact(self) -> bool:
+        """False while backed by a bloom filter, whose lookups may be false positives."""
+        return isinstance(self._ids, set)
+
+    def __len__(self) -> int:
+        # Under a bloom filter this is approximate: an add whose id looks
+        # present already (a false positive) is not counted.
+        return len(self._ids) if self.exact else self._count
+
+    def _apply(self, present: bool, key: int) -> None:
+        if self.exact:
+            if present:
+                self._ids.add(key)
+            else:
+                self._ids.discard(key)
+        elif present:
+            if key not in self._ids:
+                self._ids.add(key)
+                self._count += 1
+        else:
+            self._count = max(0, self._count - 1)
+
+    def add(self, key: int) -> None:
+        if self._pending is not None:
+            self._pending.append((True, key))
+        self._apply(True, key)
+
+    def discard(self, key: int) -> None:
+        """Forget ``key``; only call after it was actually deleted from Mongo."""
+        if self._pending is not None:
+            self._pending.append((False, key))
+        self._apply(False, key)
+
+    async def contains(self, key: int) -> bool:
+        if self.loaded:
+            return key in self._ids
+        return await self.coll.find_one({self.key: key}, {"_id": 1}) is not None
+
+    async def members(self) -> List[int]:
+        if self.loaded and self.exact:
+            return list(self._ids)
+        return [doc[self.key] async for doc in self.coll.find(self.query, {"_id": 0, self.key: 1})]
+
+    async def load(self) -> int:
+        """Rebuild from Mongo, replaying adds/removes made while reading. Returns the size."""
+        self._pending = []
+        try:
+            ids = [
+                doc[self.key]
+                async for doc in self.coll.find(self.query, {"_id": 0, self.key: 1})
+            ]
+            if self.bloom_rate:
+                bloom = BloomFilter(max(MEMBERSHIP_BLOOM_MIN, 2 * len(ids)), self.bloom_rate)
+                for key in ids:
+                    bloom.add(key)
+                self._ids, self._count = bloom, len(ids)
+            else:
+                self._ids = set(ids)
+            for present, key in self._pending:
+                self._apply(present, key)
+        finally:
+            self._pending = None
+        self.loaded = True
+        return len(self)
+
+
+class MembershipIndex:
+    """Loads a group of ``MembershipSet``\\s at boot and reconciles them on an interval."""
+
+    def __init__(self, *sets: MembershipSet, interval: float = MEMBERSHIP_RECONCILE_INTERVAL) -> None:
+        self.sets = sets
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def load(self) -> None:
+        await asyncio.gather(*(s.load() for s in self.sets))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            for s in self.sets:
+                try:
+                    await s.load()
+                except Exception as e:
+                    LOGGER.warning(f"Membership reconcile of {s.coll.name} failed: {e}")
+
+    def start(self) -> None:
+        if not self._task:
+            self._task = asyncio.create_task(self._run())
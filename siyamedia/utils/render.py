@@ -0,0 +1,211 @@
+# Authored By Certified Coders � 2025
+import asyncio
+import multiprocessing
+import os
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Callable, List, Optional
+
+from PIL import Image, ImageDraw, ImageFont, UnidentifiedImageError
+
+from siyamedia.logging import LOGGER
+from siyamedia.utils.tuning import RENDER_QUEUE_MAX, RENDER_TIMEOUT, RENDER_WORKERS
+
+LOGGER = LOGGER(__name__)
+
+ASSETS = "siyamedia/assets"
+FALLBACK_PIC = f"{ASSETS}/upic.png"
+WELCOME_BG = f"{ASSETS}/annie/welcome.png"
+WELCOME_FONT = f"{ASSETS}/annie/Arimo.ttf"
+COUPLE_BG = f"{ASSETS}/annie/couple.png"
+MEME_FONT = "arial.ttf" if os.name == "nt" else f"{ASSETS}/default.ttf"
+
+# Loaded into every worker when it starts, so the first job does not pay for it.
+PRELOAD_FONTS = [(WELCOME_FONT, 65)]
+PRELOAD_IMAGES = [WELCOME_BG, COUPLE_BG, FALLBACK_PIC]
+_warmers: List[Callable] = []
+
+
+def on_warm(fn: Callable) -> Callable:
+    """Also run ``fn`` when a worker starts (e.g. to build a render template)."""
+    _warmers.append(fn)
+    return fn
+
+
+# -- Worker side: assets are cached per process, callers copy before drawing ------
+@lru_cache(maxsize=32)
+def font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=16)
+def image(path: str) -> Image.Image:
+    return Image.open(path).convert("RGBA")
+
+
+def _warm() -> int:
+    for path, size in PRELOAD_FONTS:
+        try:
+            font(path, size)
+        except OSError:
+            pass
+    for path in PRELOAD_IMAGES:
+        try:
+            image(path)
+        except (OSError, UnidentifiedImageError):
+            pass
+    for fn in _warmers:
+        try:
+            fn()
+        except Exception:
+            pass
+    return os.getpid()
+
+
+def _circle(im: Image.Image, size) -> Image.Image:
+    im = im.resize(size, Image.LANCZOS).convert("RGBA")
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, *size), fill=255)
+    im.putalpha(mask)
+    return im
+
+
+def _open_or_fallback(path: str) -> Image.Image:
+    try:
+        return Image.open(path)
+    except (FileNotFoundError, UnidentifiedImageError):
+        return image(FALLBACK_PIC)
+
+
+def welcome_card(avatar: str, name: str, uid: int, username: str) -> str:
+    os.makedirs("downloads", exist_ok=True)
+    bg = image(WELCOME_BG).copy()
+    pic = _circle(Image.open(avatar), (835, 839))
+    bg.paste(pic, (1887, 390), pic)
+    d = ImageDraw.Draw(bg)
+    f = font(WELCOME_FONT, 65)
+    d.text((421, 715), name, fill=(242, 242, 242), font=f)
+    d.text((270, 1005), str(uid), fill=(242, 242, 242), font=f)
+    d.text((570, 1308), username, fill=(242, 242, 242), font=f)
+    path = f"downloads/welcome_{uid}.png"
+    bg.save(path)
+    return path
+
+
+def couple_card(pic1: str, pic2: str, out_path: str) -> str:
+    base = image(COUPLE_BG).copy()
+    a1 = _circle(_open_or_fallback(pic1), (486, 486))
+    a2 = _circle(_open_or_fallback(pic2), (486, 486))
+    base.paste(a1, (410, 500), a1)
+    base.paste(a2, (1395, 500), a2)
+    base.save(out_path)
+    return out_path
+
+
+def _outlined(draw: ImageDraw.ImageDraw, x: float, y: float, text: str, fnt) -> None:
+    for dx, dy in ((-2, 0), (2, 0), (0, -2), (0, 2)):
+        draw.text(xy=(x + dx, y + dy), text=text, font=fnt, fill=(0, 0, 0))
+    draw.text(xy=(x, y), text=text, font=fnt, fill=(255, 255, 255))
+
+
+def meme(image_path: str, text: str, out_path: str = "memify.webp") -> str:
+    img = Image.open(image_path)
+    os.remove(image_path)
+
+    i_width, i_height = img.size
+    m_font = font(MEME_FONT, int((70 / 640) * i_width))
+
+    if ";" in text:
+        upper_text, lower_text = text.split(";", 1)
+    else:
+        upper_text, lower_text = text, ""
+
+    draw = ImageDraw.Draw(img)
+    current_h, pad = 10, 5
+
+    for u_text in textwrap.wrap(upper_text, width=15):
+        uwl, uht, uwr, uhb = m_font.getbbox(u_text)
+        u_width, u_height = uwr - uwl, uhb - uht
+        _outlined(draw, (i_width - u_width) / 2, int((current_h / 640) * i_width), u_text, m_font)
+        current_h += u_height + pad
+
+    for l_text in textwrap.wrap(lower_text, width=15):
+        uwl, uht, uwr, uhb = m_font.getbbox(l_text)
+        u_width, u_height = uwr - uwl, uhb - uht
+        _outlined(
+            draw,
+            (i_width - u_width) / 2,
+            i_height - u_height - int((20 / 640) * i_width),
+            l_text,
+            m_font,
+        )
+
+    img.save(out_path, "webp")
+    return out_path
+
+
+# -- Parent side ------------------------------------------------------------------
+class RenderBusy(Exception):
+    pass
+
+
+class RenderService:
+    """
+    Pillow rendering off the event loop, in a small process pool.
+
+    ``submit`` runs a module-level render function in a worker and waits at
+    most ``timeout`` seconds for it. When ``max_pending`` jobs are already
+    queued it raises ``RenderBusy`` instead of piling up more work, so callers
+    fall back (e.g. to the stock thumbnail) rather than wait.
+    """
+
+    def __init__(self, workers: int = RENDER_WORKERS, max_pending: int = RENDER_QUEUE_MAX) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self._pending = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("fork"), initializer=_warm
+            )
+        return self._pool
+
+    def spawn(self) -> None:
+        """Fork every worker now, from the calling thread, without waiting for warm-up."""
+        self.start().submit(os.getpid)
+
+    async def warm(self) -> List[int]:
+        """Fork every worker (loading fonts and backgrounds) up front."""
+        return await asyncio.gather(*(self.submit(_warm, timeout=60) for _ in range(self.workers)))
+
+    async def submit(self, fn: Callable, *args, timeout: float = RENDER_TIMEOUT):
+        if self._pending >= self.max_pending:
+            raise RenderBusy(f"{self._pending} renders already queued")
+        self._pending += 1
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(self.start(), fn, *args), timeout=timeout
+            )
+        except BrokenProcessPool:
+            LOGGER.warning("Render worker pool broke, restarting it")
+            self.shutdown()
+            raise
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+renderer = RenderService()
@@ -0,0 +1,185 @@
+# Authored By Certified Coders � 2025
+import asyncio
+import time
+from collections import Counter
+from enum import IntEnum
+from typing import Any, Dict, Optional, Tuple
+
+from pyrogram import Client
+from pyrogram.errors import FloodWait
+
+from siyamedia.logging import LOGGER
+from siyamedia.utils.cache import TTLCache
+from siyamedia.utils.tuning import (
+    SEND_CHAT_BURST,
+    SEND_CHAT_RATE,
+    SEND_FLOOD_MAX,
+    SEND_GLOBAL_RATE,
+    SEND_GROUP_BURST,
+    SEND_GROUP_RATE,
+    SEND_METHOD_RATES,
+    SEND_RETRIES,
+    SEND_USERBOT_RATE,
+)
+
+LOGGER = LOGGER(__name__)
+
+# Methods that post into the chat and so count against its message limit.
+CHAT_LIMITED = ("send_", "forward_", "copy_")
+
+
+class Priority(IntEnum):
+    NOW_PLAYING = 0
+    INTERACTIVE = 1
+    BULK = 2
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "stamp")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.stamp = time.monotonic()
+
+    def delay(self, now: float) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+
+class SendScheduler:
+    """
+    Paces outgoing Telegram calls of the bot and assistant clients.
+
+    Every call takes a token from up to three buckets: the account's global
+    bucket, the target chat's bucket (for methods that post a message) and the
+    method's bucket (when it has a limit in ``SEND_METHOD_RATES``). A FloodWait puts the account's method on
+    hold for every caller, not just the one that hit it, and the call is
+    retried. Lower-priority callers yield while higher-priority ones wait, so
+    a now-playing card never queues behind a broadcast.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[Tuple, TokenBucket] = {}
+        # Per-chat buckets are dropped once idle; a bucket that has been idle
+        # that long would be full again anyway.
+        self._chats: TTLCache = TTLCache(50000, 60)
+        self._hold: Dict[Tuple[str, str], float] = {}
+        self._waiting: Counter = Counter()
+        self.metrics: Counter = Counter()
+
+    @staticmethod
+    def _account(client: Client) -> Tuple[str, bool]:
+        me = getattr(client, "me", None)
+        return getattr(client, "name", str(id(client))), getattr(me, "is_bot", True)
+
+    def _bucket(self, key: Tuple, rate: float, capacity: float) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(rate, capacity)
+        return bucket
+
+    def _buckets_for(self, client: Client, method: str, chat_id: Optional[int]):
+        """The account-wide buckets and the per-chat bucket (or None) for a call."""
+        account, is_bot = self._account(client)
+        shared = [
+            self._bucket((account,), SEND_GLOBAL_RATE, SEND_GLOBAL_RATE)
+            if is_bot
+            else self._bucket((account,), SEND_USERBOT_RATE, 1)
+        ]
+        rate = SEND_METHOD_RATES.get(method)
+        if rate:
+            shared.append(self._bucket((account, method), rate, rate))
+        chat = None
+        if chat_id is not None and method.startswith(CHAT_LIMITED):
+            key = (account, chat_id)
+            chat = self._chats.get(key)
+            if chat is None:
+                if isinstance(chat_id, int) and chat_id > 0:
+                    chat = TokenBucket(SEND_CHAT_RATE, SEND_CHAT_BURST)
+                else:
+                    chat = TokenBucket(SEND_GROUP_RATE, SEND_GROUP_BURST)
+            self._chats.set(key, chat)
+        return shared, chat
+
+    async def _acquire(self, client: Client, method: str, chat_id, priority: Priority) -> None:
+        account = self._account(client)[0]
+        shared, chat = self._buckets_for(client, method, chat_id)
+        started = time.monotonic()
+        contending = False
+        if chat:
+            self._waiting[(account, chat_id, priority)] += 1
+        try:
+            while True:
+                now = time.monotonic()
+                chat_delay = chat.delay(now) if chat else 0.0
+                # Only callers held up by the account-wide limits compete for
+                # them; one waiting on its own chat's bucket blocks nobody.
+                if contending != (not chat_delay):
+                    contending = not chat_delay
+                    self._waiting[(account, priority)] += 1 if contending else -1
+                delay = max(self._hold.get((account, method), 0) - now, chat_delay)
+                for bucket in shared:
+                    delay = max(delay, bucket.delay(now))
+                if not delay and any(
+                    self._waiting[(account, p)] or (chat and self._waiting[(account, chat_id, p)])
+                    for p in Priority
+                    if p < priority
+                ):
+                    delay = 0.05
+                if not delay:
+                    for bucket in shared:
+                        bucket.take()
+                    if chat:
+                        chat.take()
+                    self.metrics[f"waited_{priority.name.lower()}"] += now - started
+                    return
+                await asyncio.sleep(delay)
+        finally:
+            if contending:
+                self._waiting[(account, priority)] -= 1
+            if chat:
+                self._waiting[(account, chat_id, priority)] -= 1
+                if not self._waiting[(account, chat_id, priority)]:
+                    del self._waiting[(account, chat_id, priority)]
+
+    async def call(
+        self,
+        client: Client,
+        method: str,
+        chat_id,
+        *args,
+        priority: Priority = Priority.INTERACTIVE,
+        **kwargs,
+    ) -> Any:
+        """``await client.<method>(chat_id, *args, **kwargs)``, paced and retried on FloodWait."""
+        account = self._account(client)[0]
+        attempt = 0
+        while True:
+            await self._acquire(client, method, chat_id, priority)
+            try:
+                result = await getattr(client, method)(chat_id, *args, **kwargs)
+            except FloodWait as e:
+                wait = int(e.value or 1)
+                self.metrics["flood_waits"] += 1
+                self.metrics["flood_seconds"] += wait
+                self._hold[(account, method)] = max(
+                    self._hold.get((account, method), 0), time.monotonic() + wait
+                )
+                attempt += 1
+                if wait > SEND_FLOOD_MAX or attempt > SEND_RETRIES:
+                    raise
+                LOGGER.warning(f"FloodWait {wait}s on {account}.{method}, holding that method")
+                continue
+            self.metrics["sent"] += 1
+            self.metrics[f"sent_{priority.name.lower()}"] += 1
+            return result
+
+
+sender = SendScheduler()
@@ -1,19 +1,40 @@
 # Authored By Certified Coders  2025
+import asyncio
 import os
 
-from config import autoclean
+from siyamedia.logging import LOGGER
+from siyamedia.utils.mediacache import media_cache
+from siyamedia.utils.stream.track import ChatQueue
 
+LOGGER = LOGGER(__name__)
 
-async def auto_clean(popped):
+
+def _remove(path):
     try:
-        rem = popped["file"]
-        autoclean.remove(rem)
-        count = autoclean.count(rem)
-        if count == 0:
-            if "vid_" not in rem or "live_" not in rem or "index_" not in rem:
-                try:
-                    os.remove(rem)
-                except:
-                    pass
-    except:
+        os.remove(path)
+    except FileNotFoundError:
         pass
+    except OSError as e:
+        LOGGER.warning(f"Could not remove {path}: {e}")
+
+
+def _sweep(files, pinned):
+    # Files outside the media cache (Telegram media, speed renders) are not
+    # kept for replays, so delete them once no queue references them.
+    for file in files:
+        if not file or file.startswith(("vid_", "live_", "index_")):
+            continue
+        path = os.path.realpath(file)
+        if os.path.isfile(path) and path not in pinned and not media_cache.tracks(path):
+            _remove(path)
+
+
+async def auto_clean(popped):
+    # Finished files stay in the media cache for replays; now that the track
+    # is no longer queued its file may be evicted if the cache is over budget.
+    # ``popped`` is one finished Track, or a whole ChatQueue when cleared.
+    if popped:
+        tracks = popped if isinstance(popped, ChatQueue) else (popped,)
+        files = [path for track in tracks for path in (track.file, track.speed_path)]
+        await asyncio.to_thread(_sweep, files, media_cache.pinned())
+        media_cache.evict()
@@ -0,0 +1,78 @@
+# Authored By Certified Coders � 2025
+import time
+from typing import Dict, Optional
+
+from siyamedia.misc import db
+
+
+class PlaybackClock:
+    """
+    Tracks the playback position of one stream from monotonic timestamps.
+
+    Nothing ticks in the background: the position is derived on demand from
+    the offset recorded at the last start/seek/pause and the time elapsed since.
+    """
+
+    __slots__ = ("_offset", "_since")
+
+    def __init__(self, position: float = 0.0) -> None:
+        self._offset = max(0.0, float(position))
+        self._since: Optional[float] = time.monotonic()
+
+    @property
+    def paused(self) -> bool:
+        return self._since is None
+
+    def position(self) -> float:
+        if self._since is None:
+            return self._offset
+        return self._offset + (time.monotonic() - self._since)
+
+    def pause(self) -> None:
+        if self._since is not None:
+            self._offset = self.position()
+            self._since = None
+
+    def resume(self) -> None:
+        if self._since is None:
+            self._since = time.monotonic()
+
+    def seek(self, position: float) -> None:
+        self._offset = max(0.0, float(position))
+        if self._since is not None:
+            self._since = time.monotonic()
+
+
+clocks: Dict[int, PlaybackClock] = {}
+
+
+def start_clock(chat_id: int, position: float = 0.0) -> PlaybackClock:
+    clock = clocks[chat_id] = PlaybackClock(position)
+    return clock
+
+
+def stop_clock(chat_id: int) -> None:
+    clocks.pop(chat_id, None)
+
+
+def pause_clock(chat_id: int) -> None:
+    if clock := clocks.get(chat_id):
+        clock.pause()
+
+
+def resume_clock(chat_id: int) -> None:
+    if clock := clocks.get(chat_id):
+        clock.resume()
+
+
+def get_played(chat_id: int) -> int:
+    clock = clocks.get(chat_id)
+    if not clock:
+        return 0
+    played = int(clock.position())
+    playing = db.get(chat_id)
+    if playing:
+        duration = int(playing[0].seconds or 0)
+        if duration:
+            played = min(played, duration)
+    return played
@@ -0,0 +1,110 @@
+# Authored By Certified Coders � 2025
+import asyncio
+import os
+from typing import Dict, Optional
+
+from siyamedia.logging import LOGGER
+from siyamedia.misc import db
+from siyamedia.utils.downloader import yt_dlp_download
+from siyamedia.utils.stream.track import Track
+from siyamedia.utils.tuning import PREFETCH_CONCURRENCY, PREFETCH_DEPTH, PREFETCH_PER_CHAT
+
+LOGGER = LOGGER(__name__)
+
+YOUTUBE_URL = "https://www.youtube.com/watch?v="
+
+
+class Prefetcher:
+    """
+    Downloads the next ``depth`` ``vid_`` placeholders of each active queue
+    while the current track plays, then points the entry at the local file.
+
+    At most ``per_chat`` downloads run for one chat and ``limit`` overall.
+    Tracks that leave the look-ahead window (skip, stop, clear) have their
+    fetch cancelled. The yt-dlp worker thread itself cannot be interrupted,
+    so a cancelled fetch still lands in the media cache for later reuse.
+    """
+
+    def __init__(
+        self,
+        depth: int = PREFETCH_DEPTH,
+        per_chat: int = PREFETCH_PER_CHAT,
+        limit: int = PREFETCH_CONCURRENCY,
+    ) -> None:
+        self.depth = depth
+        self.per_chat = per_chat
+        self._sem = asyncio.Semaphore(limit)
+        self._tasks: Dict[int, Dict[Track, asyncio.Task]] = {}
+
+    @staticmethod
+    def _wanted(track: Track) -> bool:
+        return track.file.startswith("vid_") and track.vidid not in ("telegram", "soundcloud")
+
+    def schedule(self, chat_id: int) -> None:
+        """Sync the running fetches of ``chat_id`` with the head of its queue."""
+        queue = db.get(chat_id)
+        window = list(queue)[: self.depth + 1] if queue else []
+        running = self._tasks.get(chat_id, {})
+
+        for track, task in list(running.items()):
+            if not any(track is t for t in window):
+                task.cancel()
+                running.pop(track, None)
+
+        for track in window[1:]:
+            if len(running) >= self.per_chat:
+                break
+            if track in running or not self._wanted(track):
+                continue
+            running[track] = asyncio.create_task(self._fetch(chat_id, track))
+
+        if running:
+            self._tasks[chat_id] = running
+        else:
+            self._tasks.pop(chat_id, None)
+
+    def cancel(self, chat_id: int) -> None:
+        for task in self._tasks.pop(chat_id, {}).values():
+            task.cancel()
+
+    async def ready(self, chat_id: int, track: Track) -> None:
+        """Wait for an in-flight fetch of ``track`` so playback can use its file."""
+        task = self._tasks.get(chat_id, {}).get(track)
+        if task:
+            await asyncio.wait({task})
+
+    def _release(self, download: asyncio.Future) -> None:
+        self._sem.release()
+        if not download.cancelled():
+            download.exception()  # retrieved here in case the fetch was cancelled
+
+    async def _fetch(self, chat_id: int, track: Track) -> Optional[str]:
+        placeholder = track.file
+        path = None
+        try:
+            await self._sem.acquire()
+            download = asyncio.ensure_future(
+                yt_dlp_download(
+                    YOUTUBE_URL + track.vidid,
+                    "video" if track.streamtype == "video" else "audio",
+                    track.title,
+                )
+            )
+            # Shielded so a cancel does not abandon a download other callers
+            # may be deduplicated onto; the slot is held until it really ends.
+            download.add_done_callback(self._release)
+            path = await asyncio.shield(download)
+        except Exception as e:
+            LOGGER.warning(f"Prefetch failed for {track.vidid} in {chat_id}: {e}")
+        finally:
+            running = self._tasks.get(chat_id)
+            if running and running.get(track) is asyncio.current_task():
+                running.pop(track, None)
+
+        if path and os.path.exists(path) and track.file == placeholder:
+            track.file = path
+        self.schedule(chat_id)
+        return path
+
+
+prefetcher = Prefetcher()
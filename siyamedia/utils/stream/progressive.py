@@ -0,0 +1,62 @@
+# Authored By Certified Coders � 2025
+import asyncio
+from typing import Optional, Tuple
+
+from siyamedia import YouTube
+from siyamedia.logging import LOGGER
+from siyamedia.misc import db
+from siyamedia.utils.downloader import resolve_stream_url
+from siyamedia.utils.mediacache import media_cache
+from siyamedia.utils.tuning import PROGRESSIVE_HEADSTART
+
+LOGGER = LOGGER(__name__)
+
+AUDIO_EXTS = ("mp3", "m4a", "webm", "ogg", "opus")
+VIDEO_EXTS = ("mp4", "mkv")
+
+
+async def open_source(vidid: str, video: bool = False) -> Tuple[Optional[str], Optional[asyncio.Task]]:
+    """
+    Return something playable for ``vidid`` as fast as possible.
+
+    A cached file is returned as is. Otherwise the full download is started
+    and given PROGRESSIVE_HEADSTART seconds; if it is not done by then the
+    call starts from a direct media URL while the download keeps running.
+    In that case the still-running download task is returned as well, to be
+    handed to :func:`adopt` once the track is queued.
+    """
+    if cached := media_cache.lookup(vidid, VIDEO_EXTS if video else AUDIO_EXTS):
+        return cached, None
+
+    task = asyncio.create_task(YouTube.download(vidid, None, videoid=True, video=video))
+    done, _ = await asyncio.wait({task}, timeout=PROGRESSIVE_HEADSTART)
+    if not done:
+        url = await resolve_stream_url(YouTube.base_url + vidid, video)
+        if url:
+            return url, task
+        done, _ = await asyncio.wait({task})
+
+    try:
+        file_path, _ = task.result()
+    except Exception:
+        file_path = None
+    return file_path, None
+
+
+def adopt(chat_id: int, vidid: str, task: asyncio.Task) -> None:
+    """Point the queued ``vid_`` entry at the local file once the background download lands."""
+
+    def _done(fut: asyncio.Task) -> None:
+        try:
+            file_path, _ = fut.result()
+        except BaseException:
+            return
+        if not file_path:
+            return
+        for track in db.get(chat_id) or ():
+            if track.vidid == vidid and track.file == f"vid_{vidid}":
+                track.file = file_path
+                LOGGER.info(f"Progressive stream of {vidid} in {chat_id} now backed by {file_path}")
+                break
+
+    task.add_done_callback(_done)
@@ -3,8 +3,30 @@ import asyncio
 from typing import Union
 
 from siyamedia.misc import db
+from siyamedia.utils.exceptions import AssistantErr
 from siyamedia.utils.formatters import check_duration, seconds_to_min
-from config import autoclean, time_to_seconds
+from siyamedia.utils.stream.prefetch import prefetcher
+from siyamedia.utils.stream.track import ChatQueue, QueueFull, Track
+from siyamedia.utils.tuning import QUEUE_MAX_TRACKS
+from config import time_to_seconds
+
+
+def new_queue(tracks=()) -> ChatQueue:
+    return ChatQueue(tracks, limit=QUEUE_MAX_TRACKS)
+
+
+def _enqueue(chat_id, track: Track, forceplay) -> None:
+    queue = db.get(chat_id)
+    if queue is None:
+        queue = db[chat_id] = new_queue()
+    try:
+        if forceplay:
+            queue.push_front(track)
+        else:
+            queue.push(track)
+    except QueueFull:
+        raise AssistantErr(f"Queue is full ({QUEUE_MAX_TRACKS} tracks), skip or clear some first.")
+    prefetcher.schedule(chat_id)
 
 
 async def put_queue(
@@ -24,28 +46,18 @@ async def put_queue(
         duration_in_seconds = time_to_seconds(duration) - 3
     except:
         duration_in_seconds = 0
-    put = {
-        "title": title,
-        "dur": duration,
-        "streamtype": stream,
-        "by": user,
-        "user_id": user_id,
-        "chat_id": original_chat_id,
-        "file": file,
-        "vidid": vidid,
-        "seconds": duration_in_seconds,
-        "played": 0,
-    }
-    if forceplay:
-        check = db.get(chat_id)
-        if check:
-            check.insert(0, put)
-        else:
-            db[chat_id] = []
-            db[chat_id].append(put)
-    else:
-        db[chat_id].append(put)
-    autoclean.append(file)
+    put = Track(
+        title=title,
+        dur=duration,
+        streamtype=stream,
+        by=user,
+        user_id=user_id,
+        chat_id=original_chat_id,
+        file=file,
+        vidid=vidid,
+        seconds=duration_in_seconds,
+    )
+    _enqueue(chat_id, put, forceplay)
 
 
 async def put_queue_index(
@@ -70,23 +82,14 @@ async def put_queue_index(
             dur = 0
     else:
         dur = 0
-    put = {
-        "title": title,
-        "dur": duration,
-        "streamtype": stream,
-        "by": user,
-        "chat_id": original_chat_id,
-        "file": file,
-        "vidid": vidid,
-        "seconds": dur,
-        "played": 0,
-    }
-    if forceplay:
-        check = db.get(chat_id)
-        if check:
-            check.insert(0, put)
-        else:
-            db[chat_id] = []
-            db[chat_id].append(put)
-    else:
-        db[chat_id].append(put)
+    put = Track(
+        title=title,
+        dur=duration,
+        streamtype=stream,
+        by=user,
+        chat_id=original_chat_id,
+        file=file,
+        vidid=vidid,
+        seconds=dur,
+    )
+    _enqueue(chat_id, put, forceplay)
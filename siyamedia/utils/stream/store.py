@@ -0,0 +1,224 @@
+# Authored By Certified Coders � 2025
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from pymongo import DeleteOne, ReplaceOne
+
+from config import QUEUE_STORE
+from siyamedia.core.dir import BASE_DIR
+from siyamedia.core.mongo import mongodb
+from siyamedia.logging import LOGGER
+from siyamedia.misc import db
+from siyamedia.utils.database import activevideo, loop
+from siyamedia.utils.stream.clock import clocks
+from siyamedia.utils.stream.queue import new_queue
+from siyamedia.utils.stream.track import Track
+from siyamedia.utils.tuning import (
+    QUEUE_FLUSH_INTERVAL,
+    QUEUE_RESTORE_CONCURRENCY,
+    QUEUE_RESTORE_TIMEOUT,
+)
+
+LOGGER = LOGGER(__name__)
+
+QUEUE_DB_PATH = os.path.join(BASE_DIR, "queues.sqlite3")
+
+
+class QueueStore(ABC):
+    """Storage backend for per-chat queue snapshots (JSON strings keyed by chat id)."""
+
+    @abstractmethod
+    async def load(self) -> Dict[int, str]:
+        ...
+
+    @abstractmethod
+    async def save(self, upserts: Dict[int, str], deletes: List[int]) -> None:
+        ...
+
+    async def close(self) -> None:
+        pass
+
+
+class SQLiteQueueStore(QueueStore):
+    def __init__(self, path: str = QUEUE_DB_PATH) -> None:
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS queues ("
+            "chat_id INTEGER PRIMARY KEY, state TEXT NOT NULL, updated REAL NOT NULL)"
+        )
+
+    def _load_sync(self) -> Dict[int, str]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT chat_id, state FROM queues"))
+
+    def _save_sync(self, upserts: Dict[int, str], deletes: List[int]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO queues (chat_id, state, updated) VALUES (?, ?, ?)",
+                    [(chat_id, state, now) for chat_id, state in upserts.items()],
+                )
+                self._conn.executemany(
+                    "DELETE FROM queues WHERE chat_id = ?", [(chat_id,) for chat_id in deletes]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    async def load(self) -> Dict[int, str]:
+        return await asyncio.to_thread(self._load_sync)
+
+    async def save(self, upserts: Dict[int, str], deletes: List[int]) -> None:
+        await asyncio.to_thread(self._save_sync, upserts, deletes)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class MongoQueueStore(QueueStore):
+    def __init__(self) -> None:
+        self._coll = mongodb.queues
+
+    async def load(self) -> Dict[int, str]:
+        return {doc["_id"]: doc["state"] async for doc in self._coll.find({})}
+
+    async def save(self, upserts: Dict[int, str], deletes: List[int]) -> None:
+        now = time.time()
+        ops = [
+            ReplaceOne({"_id": chat_id}, {"state": state, "updated": now}, upsert=True)
+            for chat_id, state in upserts.items()
+        ]
+        ops.extend(DeleteOne({"_id": chat_id}) for chat_id in deletes)
+        if ops:
+            await self._coll.bulk_write(ops, ordered=False)
+
+
+class QueueJournal:
+    """
+    Write-behind journal for the in-memory play queues in ``siyamedia.misc.db``.
+
+    Every ``interval`` seconds the queues (plus playback position, pause,
+    video and loop state) are serialised, and only the chats whose snapshot
+    changed since the last flush are written to the backend in one batch.
+    """
+
+    def __init__(self, store: Optional[QueueStore], interval: float = QUEUE_FLUSH_INTERVAL) -> None:
+        self.store = store
+        self.interval = interval
+        self._written: Dict[int, str] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def snapshot(chat_id: int) -> Optional[str]:
+        queue = db.get(chat_id)
+        if not queue:
+            return None
+        clock = clocks.get(chat_id)
+        state = {
+            "queue": [track.to_dict() for track in queue],
+            "position": int(clock.position()) if clock else 0,
+            "paused": bool(clock and clock.paused),
+            "video": chat_id in activevideo,
+            "loop": loop.get(chat_id, 0),
+        }
+        return json.dumps(state, separators=(",", ":"), default=str)
+
+    async def flush(self) -> None:
+        if not self.store:
+            return
+        upserts: Dict[int, str] = {}
+        for chat_id in list(db):
+            state = self.snapshot(chat_id)
+            if state is not None and self._written.get(chat_id) != state:
+                upserts[chat_id] = state
+        deletes = [chat_id for chat_id in self._written if not db.get(chat_id)]
+        if not upserts and not deletes:
+            return
+        await self.store.save(upserts, deletes)
+        self._written.update(upserts)
+        for chat_id in deletes:
+            self._written.pop(chat_id, None)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                LOGGER.warning(f"Queue journal flush failed: {e}")
+
+    def start(self) -> None:
+        if self.store and not self._task:
+            self._task = asyncio.create_task(self._run())
+
+    async def restore(self, resume: Callable[[int, dict], Awaitable[None]]) -> List[int]:
+        """
+        Load saved queues back into ``db`` and hand each chat to ``resume``.
+        Chats that fail to resume are dropped. Returns the restored chat ids.
+        """
+        if not self.store:
+            return []
+        saved = await self.store.load()
+        states: Dict[int, dict] = {}
+        for chat_id, raw in saved.items():
+            try:
+                state = json.loads(raw)
+                queue = new_queue(Track.from_dict(t) for t in state.get("queue") or ())
+            except (ValueError, TypeError):
+                continue
+            if queue:
+                states[int(chat_id)] = state
+                db[int(chat_id)] = queue
+                loop[int(chat_id)] = state.get("loop", 0)
+        self._written = {int(chat_id): raw for chat_id, raw in saved.items()}
+
+        sem = asyncio.Semaphore(QUEUE_RESTORE_CONCURRENCY)
+        restored: List[int] = []
+
+        async def _resume(chat_id: int, state: dict) -> None:
+            async with sem:
+                try:
+                    await asyncio.wait_for(resume(chat_id, state), QUEUE_RESTORE_TIMEOUT)
+                    restored.append(chat_id)
+                except Exception as e:
+                    LOGGER.warning(f"Could not resume queue for {chat_id}: {e}")
+                    db.pop(chat_id, None)
+                    loop.pop(chat_id, None)
+
+        await asyncio.gather(*(_resume(chat_id, state) for chat_id, state in states.items()))
+        await self.flush()
+        return restored
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        if self.store:
+            try:
+                await self.flush()
+            finally:
+                await self.store.close()
+
+
+def get_queue_store() -> Optional[QueueStore]:
+    if QUEUE_STORE == "mongo":
+        return MongoQueueStore()
+    if QUEUE_STORE == "sqlite":
+        return SQLiteQueueStore()
+    return None
+
+
+journal = QueueJournal(get_queue_store())
@@ -13,7 +13,8 @@ from siyamedia.utils.database import add_active_video_chat, is_active_chat
 from siyamedia.utils.exceptions import AssistantErr
 from siyamedia.utils.inline import aq_markup, close_markup, stream_markup
 from siyamedia.utils.pastebin import ANNIEBIN
-from siyamedia.utils.stream.queue import put_queue, put_queue_index
+from siyamedia.utils.stream.progressive import adopt, open_source
+from siyamedia.utils.stream.queue import new_queue, put_queue, put_queue_index
 from siyamedia.utils.thumbnails import get_thumb
 from siyamedia.utils.errors import capture_internal_err
 
@@ -49,6 +50,8 @@ async def stream(
         for search in result:
             if int(count) == config.PLAYLIST_FETCH_LIMIT:
                 continue
+            if (queue := db.get(chat_id)) and queue.full:
+                break
             try:
                 title, duration_min, duration_sec, thumbnail, vidid = await YouTube.details(
                     search, videoid=search
@@ -79,27 +82,28 @@ async def stream(
                 msg += f"{_['play_20']} {position}\n\n"
             else:
                 if not forceplay:
-                    db[chat_id] = []
-                try:
-                    file_path, direct = await YouTube.download(
-                        vidid, mystic, video=is_video, videoid=vidid
-                    )
-                except Exception:
-                    raise AssistantErr(_["play_14"])
+                    db[chat_id] = new_queue()
+                file_path, pending = await open_source(vidid, is_video)
                 if not file_path:
                     raise AssistantErr(_["play_14"])
 
-                await StreamController.join_call(
-                    chat_id,
-                    original_chat_id,
-                    file_path,
-                    video=is_video,
-                    image=thumbnail,
-                )
+                try:
+                    await StreamController.join_call(
+                        chat_id,
+                        original_chat_id,
+                        file_path,
+                        video=is_video,
+                        image=thumbnail,
+                    )
+                except BaseException:
+                    if pending:
+                        # Let the download finish into the cache and consume its result.
+                        adopt(chat_id, vidid, pending)
+                    raise
                 await put_queue(
                     chat_id,
                     original_chat_id,
-                    file_path if direct else f"vid_{vidid}",
+                    f"vid_{vidid}" if pending else file_path,
                     title,
                     duration_min,
                     user_name,
@@ -108,6 +112,8 @@ async def stream(
                     "video" if is_video else "audio",
                     forceplay=forceplay,
                 )
+                if pending:
+                    adopt(chat_id, vidid, pending)
                 img = await get_thumb(vidid)
                 button = stream_markup(_, chat_id)
                 run = await app.send_photo(
@@ -121,8 +127,8 @@ async def stream(
                     ),
                     reply_markup=InlineKeyboardMarkup(button),
                 )
-                db[chat_id][0]["mystic"] = run
-                db[chat_id][0]["markup"] = "stream"
+                db[chat_id][0].mystic = run
+                db[chat_id][0].markup = "stream"
 
         if count == 0:
             return
@@ -152,16 +158,15 @@ async def stream(
         duration_min = result["duration_min"]
         thumbnail = result["thumb"]
 
-        try:
-            file_path, direct = await YouTube.download(
-                vidid, mystic, video=is_video, videoid=vidid
-            )
-        except Exception:
-            raise AssistantErr(_["play_14"])
-        if not file_path:
-            raise AssistantErr(_["play_14"])
-
         if await is_active_chat(chat_id):
+            try:
+                file_path, direct = await YouTube.download(
+                    vidid, mystic, video=is_video, videoid=vidid
+                )
+            except Exception:
+                raise AssistantErr(_["play_14"])
+            if not file_path:
+                raise AssistantErr(_["play_14"])
             await put_queue(
                 chat_id,
                 original_chat_id,
@@ -182,18 +187,27 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
-            await StreamController.join_call(
-                chat_id,
-                original_chat_id,
-                file_path,
-                video=is_video,
-                image=thumbnail,
-            )
+                db[chat_id] = new_queue()
+            file_path, pending = await open_source(vidid, is_video)
+            if not file_path:
+                raise AssistantErr(_["play_14"])
+            try:
+                await StreamController.join_call(
+                    chat_id,
+                    original_chat_id,
+                    file_path,
+                    video=is_video,
+                    image=thumbnail,
+                )
+            except BaseException:
+                if pending:
+                    # Let the download finish into the cache and consume its result.
+                    adopt(chat_id, vidid, pending)
+                raise
             await put_queue(
                 chat_id,
                 original_chat_id,
-                file_path if direct else f"vid_{vidid}",
+                f"vid_{vidid}" if pending else file_path,
                 title,
                 duration_min,
                 user_name,
@@ -202,6 +216,8 @@ async def stream(
                 "video" if is_video else "audio",
                 forceplay=forceplay,
             )
+            if pending:
+                adopt(chat_id, vidid, pending)
             img = await get_thumb(vidid)
             button = stream_markup(_, chat_id)
             run = await app.send_photo(
@@ -215,8 +231,8 @@ async def stream(
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "stream"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "stream"
 
     elif streamtype == "soundcloud":
         file_path = result["filepath"]
@@ -246,7 +262,7 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
+                db[chat_id] = new_queue()
             await StreamController.join_call(chat_id, original_chat_id, file_path, video=False)
             await put_queue(
                 chat_id,
@@ -269,8 +285,8 @@ async def stream(
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
 
     elif streamtype == "telegram":
         file_path = result["path"]
@@ -301,7 +317,7 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
+                db[chat_id] = new_queue()
             await StreamController.join_call(chat_id, original_chat_id, file_path, video=is_video)
             await put_queue(
                 chat_id,
@@ -324,8 +340,8 @@ async def stream(
                 caption=_["stream_1"].format(link, title[:23], duration_min, user_name),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
 
     elif streamtype == "live":
         link = result["link"]
@@ -355,7 +371,7 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
+                db[chat_id] = new_queue()
             n, file_path = await YouTube.video(link)
             if n == 0:
                 raise AssistantErr(_["str_3"])
@@ -394,8 +410,8 @@ async def stream(
                 ),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
 
     elif streamtype == "index":
         link = result
@@ -421,7 +437,7 @@ async def stream(
             )
         else:
             if not forceplay:
-                db[chat_id] = []
+                db[chat_id] = new_queue()
             await StreamController.join_call(
                 chat_id,
                 original_chat_id,
@@ -446,6 +462,6 @@ async def stream(
                 caption=_["stream_2"].format(user_name),
                 reply_markup=InlineKeyboardMarkup(button),
             )
-            db[chat_id][0]["mystic"] = run
-            db[chat_id][0]["markup"] = "tg"
+            db[chat_id][0].mystic = run
+            db[chat_id][0].markup = "tg"
             await mystic.delete()
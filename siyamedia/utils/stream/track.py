@@ -0,0 +1,95 @@
+# Authored By Certified Coders � 2025
+import random
+from collections import deque
+from dataclasses import dataclass, fields
+from typing import Any, Iterable, Optional
+
+
+@dataclass(slots=True, eq=False)
+class Track:
+    """One queued item. ``file`` may be a local path or a ``vid_``/``live_``/``index_`` marker."""
+
+    title: str
+    dur: str
+    streamtype: str
+    by: str
+    chat_id: int
+    file: str
+    vidid: str
+    seconds: int = 0
+    user_id: Optional[int] = None
+    speed_path: Optional[str] = None
+    speed: Optional[float] = None
+    old_dur: Optional[str] = None
+    old_second: Optional[int] = None
+    mystic: Any = None
+    markup: Optional[str] = None
+
+    def reset_speed(self) -> None:
+        """Undo a speedup so the track replays from its original file and duration."""
+        if self.old_dur:
+            self.dur = self.old_dur
+            self.seconds = self.old_second
+            self.speed_path = None
+            self.speed = 1.0
+
+    def to_dict(self) -> dict:
+        """Persistable fields only; the now-playing message and markup state are runtime-only."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in ("mystic", "markup") and getattr(self, f.name) is not None
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Track":
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+class QueueFull(Exception):
+    pass
+
+
+class ChatQueue(deque):
+    """
+    Play queue of one chat. Index 0 is the track currently streaming.
+
+    Tracks are added through ``push``/``push_front`` which refuse to grow the
+    queue past ``limit`` (0 means unbounded).
+    """
+
+    __slots__ = ("limit",)
+
+    def __init__(self, tracks: Iterable[Track] = (), limit: int = 0) -> None:
+        super().__init__(tracks)
+        self.limit = limit
+
+    @property
+    def current(self) -> Optional[Track]:
+        return self[0] if self else None
+
+    @property
+    def full(self) -> bool:
+        return bool(self.limit) and len(self) >= self.limit
+
+    def push(self, track: Track) -> None:
+        if self.full:
+            raise QueueFull(self.limit)
+        self.append(track)
+
+    def push_front(self, track: Track) -> None:
+        if self.full:
+            raise QueueFull(self.limit)
+        self.appendleft(track)
+
+    def shuffle(self) -> bool:
+        """Shuffle everything after the current track. False if there is nothing to shuffle."""
+        if len(self) < 2:
+            return False
+        current = self.popleft()
+        rest = list(self)
+        random.shuffle(rest)
+        self.clear()
+        self.append(current)
+        self.extend(rest)
+        return True
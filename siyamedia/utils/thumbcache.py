@@ -0,0 +1,98 @@
+# Authored By Certified Coders � 2025
+import asyncio
+import os
+import re
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from config import THUMB_CACHE_MB, THUMB_FORMAT
+from siyamedia.core.dir import CACHE_DIR
+from siyamedia.utils.cache import TTLCache
+from siyamedia.utils.mediacache import MediaCache
+from siyamedia.utils.tuning import THUMB_FILE_ID_TTL, THUMB_FILE_IDS
+
+# Bumped whenever the card layout changes, so stale renders age out of the LRU.
+THUMB_VERSION = "v5"
+THUMB_EXTS = {"png": "png", "jpeg": "jpg", "jpg": "jpg", "webp": "webp"}
+
+_STEM_RE = re.compile(r"^([a-zA-Z0-9_-]{11})_v\d+$")
+
+
+class ThumbCache(MediaCache):
+    """
+    Rendered now-playing cards in CACHE_DIR, one ``<video id>_<version>.<ext>``
+    file per video, evicted least recently used first once over budget.
+
+    Concurrent requests for a card that is not on disk yet share one render,
+    and the Telegram file_id of a card that has been sent is remembered so
+    later sends reuse it instead of uploading the file again.
+    """
+
+    EXTS = ("png", "jpg", "webp")
+
+    def __init__(
+        self, root: str = CACHE_DIR, budget: int = THUMB_CACHE_MB * 1024 * 1024, fmt: str = THUMB_FORMAT
+    ) -> None:
+        super().__init__(root, budget)
+        self.ext = THUMB_EXTS.get(fmt, "png")
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._file_ids: TTLCache = TTLCache(THUMB_FILE_IDS, THUMB_FILE_ID_TTL)
+        self._owners: TTLCache = TTLCache(THUMB_FILE_IDS, THUMB_FILE_ID_TTL)
+
+    def _split(self, path: str):
+        # Only rendered cards; cover downloads and yt-dlp's cache share the directory.
+        parts = super()._split(path)
+        return parts if parts and _STEM_RE.match(parts[1]) else None
+
+    @staticmethod
+    def pinned() -> Set[str]:
+        return set()
+
+    def path_for(self, video_id: str) -> str:
+        return os.path.join(self.root, f"{video_id}_{THUMB_VERSION}.{self.ext}")
+
+    async def get(self, video_id: str, build: Callable[[str], Awaitable[str]]) -> Optional[str]:
+        """
+        A file_id or path for the card of ``video_id``. On a miss ``build`` is
+        awaited with the target path and returns either that path or a fallback.
+        """
+        if file_id := self._file_ids.get(video_id):
+            return file_id
+        if path := self.lookup(f"{video_id}_{THUMB_VERSION}", (self.ext,)):
+            return path
+        if fut := self._inflight.get(video_id):
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[video_id] = fut
+        result = None
+        try:
+            target = self.path_for(video_id)
+            result = await build(target)
+            if result == target:
+                self.add(target)
+            return result
+        finally:
+            # Waiters see None if the build failed or was cancelled.
+            fut.set_result(result)
+            self._inflight.pop(video_id, None)
+
+    def remember(self, path: str, file_id: str) -> None:
+        """Record the file_id Telegram assigned to a card that was just sent."""
+        parts = self._split(path) if isinstance(path, str) else None
+        if parts:
+            video_id = _STEM_RE.match(parts[1]).group(1)
+            self._file_ids.set(video_id, file_id)
+            self._owners.set(file_id, video_id)
+
+    def owner(self, file_id: str) -> Optional[str]:
+        """The video id whose card was remembered under ``file_id``, if any."""
+        return self._owners.get(file_id)
+
+    def forget(self, video_id: str) -> Optional[str]:
+        file_id = self._file_ids.pop(video_id)
+        if file_id:
+            self._owners.pop(file_id)
+        return file_id
+
+
+thumb_cache = ThumbCache()
@@ -0,0 +1,165 @@
+# Authored By Certified Coders � 2025
+import os
+from typing import Dict, Optional
+
+from PIL import Image, ImageDraw, ImageEnhance, ImageFilter, ImageFont
+
+ASSETS = "siyamedia/assets/thumb"
+
+CANVAS_W, CANVAS_H = 1280, 720
+
+PANEL_W, PANEL_H = 763, 545
+PANEL_X = (CANVAS_W - PANEL_W) // 2
+PANEL_Y = 88
+TRANSPARENCY = 170
+INNER_OFFSET = 36
+
+THUMB_W, THUMB_H = 542, 273
+THUMB_X = PANEL_X + (PANEL_W - THUMB_W) // 2
+THUMB_Y = PANEL_Y + INNER_OFFSET
+
+TITLE_X = 377
+META_X = 377
+TITLE_Y = THUMB_Y + THUMB_H + 10
+META_Y = TITLE_Y + 45
+
+BAR_X, BAR_Y = 388, META_Y + 45
+BAR_RED_LEN = 280
+BAR_TOTAL_LEN = 480
+
+ICONS_W, ICONS_H = 415, 45
+ICONS_X = PANEL_X + (PANEL_W - ICONS_W) // 2
+ICONS_Y = BAR_Y + 48
+
+MAX_TITLE_WIDTH = 580
+
+# The background is blurred at 1/BLUR_SCALE size and scaled back up: a 10px
+# box blur at full size and a 2.5px one at quarter size look the same.
+# Everything is drawn in RGB; the card is opaque, so no alpha is needed.
+BLUR_SCALE = 4
+BLUR_RADIUS = 10
+# zlib level for the cached PNG; level 6 (the default) costs ~3x the encode
+# time for a ~25% smaller file that Telegram recompresses anyway.
+PNG_COMPRESS_LEVEL = 1
+# Encoder settings for every output format; each encoder ignores the others'.
+SAVE_PARAMS = {"compress_level": PNG_COMPRESS_LEVEL, "quality": 85, "method": 2}
+
+
+def trim_to_width(text: str, font: ImageFont.FreeTypeFont, max_w: int) -> str:
+    ellipsis = "…"
+    if font.getlength(text) <= max_w:
+        return text
+    for i in range(len(text) - 1, 0, -1):
+        if font.getlength(text[:i] + ellipsis) <= max_w:
+            return text[:i] + ellipsis
+    return ellipsis
+
+
+class ThumbnailTemplate:
+    """
+    Now-playing card with every track-independent layer built once.
+
+    Fonts, the rounded panel/cover masks, the frosted-glass tint and an
+    overlay holding the progress bar, start time and recoloured player icons
+    are prepared in ``__init__``. ``render`` only blurs the cover into the
+    background, frosts the panel, pastes the cover and draws the title,
+    views and duration.
+    """
+
+    def __init__(self, assets: str = ASSETS) -> None:
+        try:
+            self.title_font = ImageFont.truetype(os.path.join(assets, "font2.ttf"), 32)
+            self.regular_font = ImageFont.truetype(os.path.join(assets, "font.ttf"), 18)
+        except OSError:
+            self.title_font = self.regular_font = ImageFont.load_default()
+
+        self.panel_mask = Image.new("L", (PANEL_W, PANEL_H), 0)
+        ImageDraw.Draw(self.panel_mask).rounded_rectangle((0, 0, PANEL_W, PANEL_H), 50, fill=255)
+        self.frost = Image.new("RGB", (PANEL_W, PANEL_H), (255, 255, 255))
+        self.thumb_mask = Image.new("L", (THUMB_W, THUMB_H), 0)
+        ImageDraw.Draw(self.thumb_mask).rounded_rectangle((0, 0, THUMB_W, THUMB_H), 20, fill=255)
+        overlay = self._build_overlay(assets)
+        self.overlay_box = overlay.getbbox() or (0, 0, 1, 1)
+        self.overlay = overlay.crop(self.overlay_box)
+        self._advance: Dict[str, float] = {}
+
+    def _build_overlay(self, assets: str) -> Image.Image:
+        overlay = Image.new("RGBA", (CANVAS_W, CANVAS_H), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+        draw.line([(BAR_X, BAR_Y), (BAR_X + BAR_RED_LEN, BAR_Y)], fill="red", width=6)
+        draw.line([(BAR_X + BAR_RED_LEN, BAR_Y), (BAR_X + BAR_TOTAL_LEN, BAR_Y)], fill="gray", width=5)
+        draw.ellipse([(BAR_X + BAR_RED_LEN - 7, BAR_Y - 7), (BAR_X + BAR_RED_LEN + 7, BAR_Y + 7)], fill="red")
+        draw.text((BAR_X, BAR_Y + 15), "00:00", fill="black", font=self.regular_font)
+
+        icons_path = os.path.join(assets, "play_icons.png")
+        if os.path.isfile(icons_path):
+            icons = Image.open(icons_path).resize((ICONS_W, ICONS_H)).convert("RGBA")
+            black = Image.new("RGBA", icons.size, (0, 0, 0, 0))
+            black.putalpha(icons.getchannel("A"))
+            overlay.paste(black, (ICONS_X, ICONS_Y), black)
+        return overlay
+
+    def fit_title(self, text: str) -> str:
+        """``trim_to_width`` for the title font, using cached glyph advances."""
+        ellipsis = "…"
+        if self.title_font.getlength(text) <= MAX_TITLE_WIDTH:
+            return text
+        width, budget = 0.0, MAX_TITLE_WIDTH - self._width(ellipsis)
+        for i, ch in enumerate(text):
+            width += self._width(ch)
+            if width > budget:
+                return text[:i] + ellipsis
+        return text
+
+    def _width(self, ch: str) -> float:
+        w = self._advance.get(ch)
+        if w is None:
+            w = self._advance[ch] = self.title_font.getlength(ch)
+        return w
+
+    def background(self, cover: Image.Image) -> Image.Image:
+        small = cover.resize((CANVAS_W // BLUR_SCALE, CANVAS_H // BLUR_SCALE), Image.BOX)
+        small = small.filter(ImageFilter.BoxBlur(BLUR_RADIUS / BLUR_SCALE))
+        small = ImageEnhance.Brightness(small).enhance(0.6)
+        return small.resize((CANVAS_W, CANVAS_H), Image.BILINEAR)
+
+    def render(
+        self,
+        cover: Image.Image,
+        title: str,
+        views: str,
+        duration_text: str,
+        is_live: bool,
+        out_path: Optional[str] = None,
+    ) -> Image.Image:
+        # JPEG covers can be decoded straight at a reduced scale.
+        cover.draft("RGB", (THUMB_W, THUMB_H))
+        cover = cover.convert("RGB")
+        thumb = cover.resize((THUMB_W, THUMB_H), Image.BILINEAR, reducing_gap=2.0)
+        bg = self.background(cover)
+
+        panel = bg.crop((PANEL_X, PANEL_Y, PANEL_X + PANEL_W, PANEL_Y + PANEL_H))
+        frosted = Image.blend(panel, self.frost, TRANSPARENCY / 255)
+        bg.paste(frosted, (PANEL_X, PANEL_Y), self.panel_mask)
+        bg.paste(thumb, (THUMB_X, THUMB_Y), self.thumb_mask)
+        bg.paste(self.overlay, self.overlay_box[:2], self.overlay)
+
+        draw = ImageDraw.Draw(bg)
+        draw.text(
+            (TITLE_X, TITLE_Y),
+            self.fit_title(title),
+            fill="black",
+            font=self.title_font,
+        )
+        draw.text((META_X, META_Y), f"YouTube | {views}", fill="black", font=self.regular_font)
+        end_text = "Live" if is_live else duration_text
+        draw.text(
+            (BAR_X + BAR_TOTAL_LEN - (90 if is_live else 60), BAR_Y + 15),
+            end_text,
+            fill="red" if is_live else "black",
+            font=self.regular_font,
+        )
+
+        if out_path:
+            bg.save(out_path, **SAVE_PARAMS)
+        return bg
@@ -9,3 +9,57 @@ YTDLP_TIMEOUT = 30
 YOUTUBE_META_TTL = 600
 YOUTUBE_META_MAX = 2048
 SEM = asyncio.Semaphore(MAX_CONCURRENT)
+SETTINGS_TTL = 1800
+SETTINGS_MAX = 20000
+SETTINGS_WARM = 5000
+QUEUE_FLUSH_INTERVAL = 5
+QUEUE_RESTORE_CONCURRENCY = 4
+QUEUE_RESTORE_TIMEOUT = 120  # per chat; a rejoin may include a full download
+QUEUE_MAX_TRACKS = 500
+PREFETCH_DEPTH = 2
+PREFETCH_PER_CHAT = 1
+PREFETCH_CONCURRENCY = 4
+PROGRESSIVE_HEADSTART = 3
+EXTRACTOR_WORKERS = min(4, CPU)  # metadata lookups
+DOWNLOAD_WORKERS = max(1, min(2, CPU))  # full downloads, in their own pool
+YTDLP_DOWNLOAD_TIMEOUT = 600
+YOUTUBE_META_L2_TTL = 86400
+RENDER_WORKERS = max(1, min(2, CPU))
+RENDER_QUEUE_MAX = 32
+RENDER_TIMEOUT = 30
+THUMB_FILE_IDS = 4096
+THUMB_FILE_ID_TTL = 7 * 86400
+SEND_GLOBAL_RATE = 25  # messages/s per bot account (Telegram allows ~30)
+SEND_USERBOT_RATE = 1 / 3  # messages/s per assistant account
+SEND_CHAT_RATE, SEND_CHAT_BURST = 1, 3  # private chats
+SEND_GROUP_RATE, SEND_GROUP_BURST = 20 / 60, 5  # groups and channels
+SEND_METHOD_RATES = {
+    "ban_chat_member": 10,
+    "unban_chat_member": 10,
+    "restrict_chat_member": 10,
+    "pin_chat_message": 5,
+}
+SEND_FLOOD_MAX = 300  # a longer FloodWait is raised to the caller instead of waited out
+SEND_RETRIES = 3
+BROADCAST_WORKERS = 16
+BROADCAST_BATCH = 200
+BROADCAST_PROGRESS_INTERVAL = 15
+VIDEO_CALL_WEIGHT = 3  # relative ffmpeg cost of a video call vs an audio call
+ASSISTANT_ERROR_WINDOW = 300
+ASSISTANT_ERROR_LIMIT = 3  # call errors within the window that mark an assistant unhealthy
+ASSISTANT_REBALANCE_SLACK = 4  # load gap before a chat starting playback moves assistant
+ADMIN_CACHE_MAX = 20000
+ADMIN_CACHE_TTL = 1800  # refresh fallback; chat-member updates keep entries current
+MEMBERSHIP_RECONCILE_INTERVAL = 3600
+MEMBERSHIP_BLOOM_MIN = 100_000  # capacity floor, so a fresh bloom filter has room to grow
+INLINE_SEARCH_MAX = 1024
+INLINE_SEARCH_TTL = 600
+INLINE_SEARCH_LIMIT = 20
+INLINE_SEARCH_DEBOUNCE = 0.3  # wait for the user to stop typing before searching
+INLINE_PAGE_SIZE = 10
+INLINE_CACHE_TIME = 300  # seconds Telegram may cache an inline answer for
+FANOUT_WORKERS = 8
+FANOUT_BATCH = 100
+FANOUT_PROGRESS_INTERVAL = 10
+BACKUP_BATCH = 1000  # documents per raw cursor batch / restore bulk write
+BACKUP_FULL_EVERY = 7  # days; the daily backup is incremental in between
@@ -0,0 +1,129 @@
+# Authored By Certified Coders � 2025
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from youtubesearchpython.aio import VideosSearch
+
+from siyamedia.core.mongo import mongodb
+from siyamedia.logging import LOGGER
+from siyamedia.utils.cache import TTLCache
+from siyamedia.utils.downloader import extract_video_id
+from siyamedia.utils.tuning import YOUTUBE_META_L2_TTL, YOUTUBE_META_MAX, YOUTUBE_META_TTL
+
+LOGGER = LOGGER(__name__)
+
+_MISSING = object()
+
+# Fields of a VideosSearch result that anything in the bot reads.
+RESULT_FIELDS = ("id", "title", "duration", "thumbnails", "viewCount", "link", "channel", "publishedTime")
+
+
+class MetaCache:
+    """
+    Two-tier cache: an in-process LRU/TTL map in front of an optional Mongo
+    collection, with concurrent misses for one key coalesced into a single
+    fetch. Empty results are never cached.
+    """
+
+    def __init__(self, name: Optional[str], maxsize: int, ttl: float, l2_ttl: float = 0) -> None:
+        self._l1: TTLCache = TTLCache(maxsize, ttl)
+        self._coll = mongodb[name] if name else None
+        self._l2_ttl = l2_ttl
+        self._indexed = False
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def _l2_get(self, key: str) -> Any:
+        if self._coll is None:
+            return None
+        try:
+            doc = await self._coll.find_one({"_id": key, "expireAt": {"$gt": datetime.now(timezone.utc)}})
+        except Exception as e:
+            LOGGER.warning(f"Metadata L2 read failed: {e}")
+            return None
+        return doc.get("v") if doc else None
+
+    async def _l2_set(self, key: str, value: Any) -> None:
+        if self._coll is None:
+            return
+        try:
+            if not self._indexed:
+                await self._coll.create_index("expireAt", expireAfterSeconds=0)
+                self._indexed = True
+            expires = datetime.now(timezone.utc) + timedelta(seconds=self._l2_ttl)
+            await self._coll.update_one(
+                {"_id": key}, {"$set": {"v": value, "expireAt": expires}}, upsert=True
+            )
+        except Exception as e:
+            LOGGER.warning(f"Metadata L2 write failed: {e}")
+
+    def peek(self, key: str) -> Any:
+        return self._l1.get(key)
+
+    async def put(self, key: str, value: Any) -> None:
+        if value:
+            self._l1.set(key, value)
+            await self._l2_set(key, value)
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = self._l1.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if fut := self._inflight.get(key):
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        value = None
+        try:
+            value = await self._l2_get(key)
+            if value:
+                self._l1.set(key, value)
+            else:
+                value = await fetch()
+                await self.put(key, value)
+            return value
+        finally:
+            # Waiters see a miss (None) if the leader failed or was cancelled.
+            fut.set_result(value)
+            self._inflight.pop(key, None)
+
+
+search_cache = MetaCache("youtube_meta", YOUTUBE_META_MAX, YOUTUBE_META_TTL, YOUTUBE_META_L2_TTL)
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def _compact(item: Dict) -> Dict:
+    return {k: item[k] for k in RESULT_FIELDS if k in item}
+
+
+async def _search(query: str) -> List[Dict]:
+    try:
+        data = await VideosSearch(query, limit=1).next()
+    except Exception:
+        return []
+    return [_compact(r) for r in data.get("result", [])]
+
+
+async def search(query: str) -> List[Dict]:
+    """First search result for ``query`` (a search text or a YouTube link)."""
+    if "youtu" in query and (vid := extract_video_id(query)):
+        info = await video_info(vid)
+        return [info] if info else []
+
+    results = await search_cache.get(f"q:{normalize_query(query)}", lambda: _search(query))
+    for item in results or ():
+        if item.get("id") and search_cache.peek(f"v:{item['id']}") is None:
+            await search_cache.put(f"v:{item['id']}", item)
+    return results or []
+
+
+async def video_info(vidid: str) -> Optional[Dict]:
+    async def fetch() -> Optional[Dict]:
+        results = await _search(f"https://www.youtube.com/watch?v={vidid}")
+        return results[0] if results else None
+
+    return await search_cache.get(f"v:{vidid}", fetch)